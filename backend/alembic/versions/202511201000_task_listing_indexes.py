@@ -0,0 +1,30 @@
+"""add composite indexes for keyset task listing
+
+Revision ID: 202511201000
+Revises: 202511141200
+Create Date: 2025-11-20 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "202511201000"
+down_revision = "202511141200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tasks_owner_created_id", "tasks", ["owner_id", "created_at", "id"])
+    op.create_index("ix_tasks_owner_status_created_id", "tasks", ["owner_id", "status", "created_at", "id"])
+    op.create_index("ix_tasks_owner_priority_created_id", "tasks", ["owner_id", "priority", "created_at", "id"])
+    op.create_index("ix_tasks_owner_due_date", "tasks", ["owner_id", "due_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_owner_due_date", table_name="tasks")
+    op.drop_index("ix_tasks_owner_priority_created_id", table_name="tasks")
+    op.drop_index("ix_tasks_owner_status_created_id", table_name="tasks")
+    op.drop_index("ix_tasks_owner_created_id", table_name="tasks")
@@ -0,0 +1,26 @@
+"""add token_version to users
+
+Revision ID: 202511211000
+Revises: 202511201000
+Create Date: 2025-11-21 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202511211000"
+down_revision = "202511201000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("token_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("token_version")
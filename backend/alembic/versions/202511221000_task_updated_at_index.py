@@ -0,0 +1,24 @@
+"""add owner/updated_at index for task collection versions
+
+Revision ID: 202511221000
+Revises: 202511211000
+Create Date: 2025-11-22 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "202511221000"
+down_revision = "202511211000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tasks_owner_updated_at", "tasks", ["owner_id", "updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_owner_updated_at", table_name="tasks")
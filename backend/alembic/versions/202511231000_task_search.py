@@ -0,0 +1,77 @@
+"""add full-text search for tasks
+
+Revision ID: 202511231000
+Revises: 202511221000
+Create Date: 2025-11-23 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "202511231000"
+down_revision = "202511221000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(
+            """
+            ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+            ) STORED
+            """
+        )
+        op.execute("CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)")
+    elif dialect == "sqlite":
+        op.execute(
+            """
+            CREATE VIRTUAL TABLE tasks_fts USING fts5(
+                title, description, owner_id, content='tasks', content_rowid='id', prefix='2 3 4',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+            """
+        )
+        op.execute(
+            """
+            CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+                INSERT INTO tasks_fts(rowid, title, description, owner_id)
+                VALUES (new.id, new.title, new.description, new.owner_id);
+            END
+            """
+        )
+        op.execute(
+            """
+            CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+                INSERT INTO tasks_fts(tasks_fts, rowid, title, description, owner_id)
+                VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+            END
+            """
+        )
+        op.execute(
+            """
+            CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description, owner_id ON tasks BEGIN
+                INSERT INTO tasks_fts(tasks_fts, rowid, title, description, owner_id)
+                VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+                INSERT INTO tasks_fts(rowid, title, description, owner_id)
+                VALUES (new.id, new.title, new.description, new.owner_id);
+            END
+            """
+        )
+        op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.drop_index("ix_tasks_search_vector", table_name="tasks")
+        op.drop_column("tasks", "search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
@@ -0,0 +1,49 @@
+"""add materialized per-user task statistics
+
+Revision ID: 202511241000
+Revises: 202511231000
+Create Date: 2025-11-24 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202511241000"
+down_revision = "202511231000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_task_stats",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "kind", "key"),
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        due_day = "to_char(timezone('UTC', due_date), 'YYYY-MM-DD')"
+    else:
+        due_day = "date(due_date)"
+    op.execute(
+        f"""
+        INSERT INTO user_task_stats (user_id, kind, key, count)
+        SELECT owner_id, 'total', '', count(id) FROM tasks GROUP BY owner_id
+        UNION ALL
+        SELECT owner_id, 'completed', '', count(id) FROM tasks WHERE status = 'done' GROUP BY owner_id
+        UNION ALL
+        SELECT owner_id, 'priority', priority, count(id) FROM tasks GROUP BY owner_id, priority
+        UNION ALL
+        SELECT owner_id, 'due', {due_day}, count(id) FROM tasks
+        WHERE status != 'done' AND due_date IS NOT NULL GROUP BY owner_id, {due_day}
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_task_stats")
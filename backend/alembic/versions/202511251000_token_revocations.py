@@ -0,0 +1,37 @@
+"""add token revocation list
+
+Revision ID: 202511251000
+Revises: 202511241000
+Create Date: 2025-11-25 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202511251000"
+down_revision = "202511241000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "token_revocations",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("jti", sa.String(length=64), nullable=True, unique=True),
+        sa.Column("min_version", sa.Integer(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_token_revocations_user_id", "token_revocations", ["user_id"])
+    op.create_index("ix_token_revocations_expires_at", "token_revocations", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_token_revocations_expires_at", table_name="token_revocations")
+    op.drop_index("ix_token_revocations_user_id", table_name="token_revocations")
+    op.drop_table("token_revocations")
@@ -0,0 +1,34 @@
+"""add shared rate limit counters
+
+Revision ID: 202511261000
+Revises: 202511251000
+Create Date: 2025-11-26 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202511261000"
+down_revision = "202511251000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_counters",
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("window", sa.BigInteger(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("key", "window"),
+    )
+    op.create_index("ix_rate_limit_counters_expires_at", "rate_limit_counters", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rate_limit_counters_expires_at", table_name="rate_limit_counters")
+    op.drop_table("rate_limit_counters")
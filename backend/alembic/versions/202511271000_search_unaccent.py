@@ -0,0 +1,58 @@
+"""ignore accents in postgres task search
+
+Revision ID: 202511271000
+Revises: 202511261000
+Create Date: 2025-11-27 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "202511271000"
+down_revision = "202511261000"
+branch_labels = None
+depends_on = None
+
+
+def _rebuild_search_vector(config: str) -> None:
+    op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+    op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
+    op.execute(
+        f"""
+        ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('{config}', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('{config}', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute("CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'ponte_search') THEN
+                CREATE TEXT SEARCH CONFIGURATION ponte_search (COPY = simple);
+                ALTER TEXT SEARCH CONFIGURATION ponte_search
+                    ALTER MAPPING FOR asciiword, asciihword, hword_asciipart, word, hword, hword_part
+                    WITH unaccent, simple;
+            END IF;
+        END
+        $$
+        """
+    )
+    _rebuild_search_vector("ponte_search")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _rebuild_search_vector("simple")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS ponte_search")
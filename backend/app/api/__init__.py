@@ -1,3 +1,3 @@
-from app.api.routes import api_router
+from app.api.routes import api_router, build_api_router
 
-__all__ = ["api_router"]
+__all__ = ["api_router", "build_api_router"]
@@ -1,8 +1,40 @@
 from fastapi import APIRouter
+from fastapi.routing import APIRoute
 
-from app.api.routes import auth, dashboard, tasks
+from app.api.routes import async_auth, async_dashboard, async_tasks, auth, dashboard, events, tasks
+from app.core.config import get_settings
 
-api_router = APIRouter()
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
-api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+ROUTERS = {
+    "sync": {"auth": auth.router, "tasks": tasks.router, "dashboard": dashboard.router},
+    "async": {"auth": async_auth.router, "tasks": async_tasks.router, "dashboard": async_dashboard.router},
+}
+
+
+def _route_key(route) -> tuple[str, frozenset[str]] | None:
+    if isinstance(route, APIRoute):
+        return route.path, frozenset(route.methods)
+    return None
+
+
+def _prefer_async(async_router: APIRouter, sync_router: APIRouter) -> APIRouter:
+    async_routes = {_route_key(route): route for route in async_router.routes}
+    router = APIRouter()
+    for route in sync_router.routes:
+        router.routes.append(async_routes.pop(_route_key(route), route))
+    router.routes.extend(async_routes.values())
+    return router
+
+
+def build_api_router(database_mode: str) -> APIRouter:
+    routers = ROUTERS["sync"]
+    if database_mode == "async":
+        routers = {name: _prefer_async(router, routers[name]) for name, router in ROUTERS["async"].items()}
+    api_router = APIRouter()
+    api_router.include_router(routers["auth"], prefix="/auth", tags=["auth"])
+    api_router.include_router(routers["tasks"], prefix="/tasks", tags=["tasks"])
+    api_router.include_router(routers["dashboard"], prefix="/dashboard", tags=["dashboard"])
+    api_router.include_router(events.router, prefix="/events", tags=["events"])
+    return api_router
+
+
+api_router = build_api_router(get_settings().database_mode)
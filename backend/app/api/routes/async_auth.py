@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_async_db, get_current_user_async, get_token_payload
+from app.core.rate_limit import LOGIN_PER_IP, REGISTER_PER_IP, rate_limit
+from app.schemas.auth import AuthRequest, AuthResponse, Principal
+from app.schemas.user import UserCreate, UserRead
+from app.services import async_auth_service
+
+router = APIRouter()
+
+
+@router.post(
+    "/register",
+    response_model=UserRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit(REGISTER_PER_IP))],
+)
+async def register(user_in: UserCreate, session: AsyncSession = Depends(get_async_db)):
+    return await async_auth_service.register_user(session, user_in)
+
+
+@router.post("/login", response_model=AuthResponse, dependencies=[Depends(rate_limit(LOGIN_PER_IP))])
+async def login(credentials: AuthRequest, session: AsyncSession = Depends(get_async_db)):
+    return await async_auth_service.login(session, credentials)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(payload: Dict[str, Any] = Depends(get_token_payload)):
+    await async_auth_service.logout(payload)
+
+
+@router.post("/logout/all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_everywhere(
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user_async),
+):
+    await async_auth_service.revoke_user_tokens(session, current_user.id)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_async_db, require_active_user_async
+from app.schemas.auth import Principal
+from app.schemas.task import DashboardSummary
+from app.services import async_task_service
+from app.utils.etags import make_etag, not_modified
+
+router = APIRouter()
+
+
+@router.get("/summary", response_model=DashboardSummary)
+async def dashboard_summary(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    summary = await async_task_service.generate_dashboard_summary(session, current_user)
+    cached = not_modified(request, response, make_etag(current_user.id, summary.model_dump_json()))
+    if cached is not None:
+        return cached
+    return summary
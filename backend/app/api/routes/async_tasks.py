@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_async_db, require_active_user_async
+from app.core.responses import json_response
+from app.schemas.auth import Principal
+from app.schemas.task import (
+    TaskCreate,
+    TaskFilters,
+    TaskPage,
+    TaskProjection,
+    TaskRead,
+    TaskSearchPage,
+    TaskSummary,
+    TaskUpdate,
+)
+from app.services import async_task_service, task_queries
+from app.utils.etags import make_etag, not_modified, task_etag
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=list[TaskRead] | list[TaskProjection],
+    description="Returns full TaskRead items, or only id plus the requested columns when fields is given.",
+)
+async def list_tasks(
+    request: Request,
+    response: Response,
+    filters: TaskFilters = Depends(),
+    fields: str | None = Query(default=None, max_length=200, description="Comma-separated TaskRead fields"),
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    selected = task_queries.resolve_fields(fields)
+    version = await async_task_service.task_collection_version(session, current_user)
+    cached = not_modified(request, response, make_etag(current_user.id, version, request.url.query))
+    if cached is not None:
+        return cached
+    payloads = await async_task_service.list_task_payloads(session, current_user, filters, selected)
+    return json_response(payloads, response)
+
+
+@router.get("/board", response_model=list[TaskSummary])
+async def list_task_board(
+    request: Request,
+    response: Response,
+    filters: TaskFilters = Depends(),
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    version = await async_task_service.task_collection_version(session, current_user)
+    cached = not_modified(request, response, make_etag(current_user.id, "board", version, request.url.query))
+    if cached is not None:
+        return cached
+    fields = task_queries.TASK_SUMMARY_FIELDS
+    payloads = await async_task_service.list_task_payloads(session, current_user, filters, fields)
+    return json_response(payloads, response)
+
+
+@router.get("/page", response_model=TaskPage)
+async def list_tasks_page(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    filters: TaskFilters = Depends(),
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    version = await async_task_service.task_collection_version(session, current_user)
+    cached = not_modified(request, response, make_etag(current_user.id, version, request.url.query))
+    if cached is not None:
+        return cached
+    return await async_task_service.list_tasks_page(session, current_user, limit, cursor, filters)
+
+
+@router.get(
+    "/search",
+    response_model=TaskSearchPage,
+    description=(
+        "Matches are ranked in blocks of the newest SEARCH_CANDIDATE_LIMIT matching tasks; "
+        "next_offset continues into older blocks once the current one is exhausted."
+    ),
+)
+async def search_tasks(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0, le=10_000),
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    return await async_task_service.search_tasks(session, current_user, q, limit, offset)
+
+
+@router.post("/", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
+async def create_task(
+    task_in: TaskCreate,
+    response: Response,
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    task = await async_task_service.create_task(session, current_user, task_in)
+    response.headers["ETag"] = task_etag(task.id, task.updated_at)
+    return task
+
+
+@router.get("/{task_id}", response_model=TaskRead)
+async def get_task(
+    task_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    updated_at = await async_task_service.task_version(session, current_user, task_id)
+    cached = not_modified(request, response, task_etag(task_id, updated_at))
+    if cached is not None:
+        return cached
+    return await async_task_service.get_task(session, current_user, task_id)
+
+
+@router.put("/{task_id}", response_model=TaskRead)
+async def update_task(
+    task_id: int,
+    task_in: TaskUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    task = await async_task_service.update_task(session, current_user, task_id, task_in, if_match)
+    response.headers["ETag"] = task_etag(task.id, task.updated_at)
+    return task
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(
+    task_id: int,
+    session: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_active_user_async),
+):
+    await async_task_service.delete_task(session, current_user, task_id)
+    return
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
+from typing import Any, Dict
+
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
-from app.core.dependencies import get_db
-from app.schemas.auth import AuthRequest, AuthResponse
+from app.core.dependencies import get_current_user, get_db, get_token_payload
+from app.core.rate_limit import LOGIN_PER_IP, REGISTER_PER_IP, rate_limit
+from app.schemas.auth import AuthRequest, AuthResponse, Principal
 from app.schemas.user import UserCreate, UserRead
 from app.services import auth_service
 
 router = APIRouter()
 
 
-@router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/register",
+    response_model=UserRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit(REGISTER_PER_IP))],
+)
 def register(user_in: UserCreate, session: Session = Depends(get_db)):
     return auth_service.register_user(session, user_in)
 
 
-@router.post("/login", response_model=AuthResponse)
+@router.post("/login", response_model=AuthResponse, dependencies=[Depends(rate_limit(LOGIN_PER_IP))])
 def login(credentials: AuthRequest, session: Session = Depends(get_db)):
     return auth_service.login(session, credentials)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(payload: Dict[str, Any] = Depends(get_token_payload)):
+    auth_service.logout(payload)
+
+
+@router.post("/logout/all", status_code=status.HTTP_204_NO_CONTENT)
+def logout_everywhere(
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    auth_service.revoke_user_tokens(session, current_user.id)
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_db, require_active_user
-from app.models.user import User
+from app.schemas.auth import Principal
 from app.schemas.task import DashboardSummary
 from app.services import task_service
+from app.utils.etags import make_etag, not_modified
 
 router = APIRouter()
 
 
 @router.get("/summary", response_model=DashboardSummary)
 def dashboard_summary(
+    request: Request,
+    response: Response,
     session: Session = Depends(get_db),
-    current_user: User = Depends(require_active_user),
+    current_user: Principal = Depends(require_active_user),
 ):
-    return task_service.generate_dashboard_summary(session, current_user)
+    summary = task_service.generate_dashboard_summary(session, current_user)
+    cached = not_modified(request, response, make_etag(current_user.id, summary.model_dump_json()))
+    if cached is not None:
+        return cached
+    return summary
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.dependencies import get_db, require_active_user, require_stream_user
+from app.core.events import event_broker
+from app.core.principals import principal_claims
+from app.core.security import create_stream_token
+from app.schemas.auth import Principal, StreamTokenResponse
+from app.services.event_stream import event_stream, summary_loader
+
+router = APIRouter()
+settings = get_settings()
+
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@router.post("/token", response_model=StreamTokenResponse)
+def issue_stream_token(current_user: Principal = Depends(require_active_user)):
+    return StreamTokenResponse(
+        stream_token=create_stream_token(current_user.id, principal_claims(current_user)),
+        expires_in=settings.events_token_expire_seconds,
+    )
+
+
+@router.get("", response_class=StreamingResponse)
+async def stream_events(
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_stream_user),
+):
+    stream = event_stream(
+        event_broker,
+        current_user,
+        summary_loader(session, current_user),
+        settings.events_keepalive_seconds,
+    )
+    return StreamingResponse(stream, media_type="text/event-stream", headers=STREAM_HEADERS)
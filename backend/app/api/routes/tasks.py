@@ -1,48 +1,213 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, File, Header, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.dependencies import get_db, require_active_user
-from app.models.user import User
-from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
-from app.services import task_service
+from app.core.responses import json_response
+from app.schemas.auth import Principal
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkResult,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskFilters,
+    TaskImportSummary,
+    TaskPage,
+    TaskProjection,
+    TaskRead,
+    TaskSearchPage,
+    TaskSummary,
+    TaskUpdate,
+)
+from app.services import export_service, import_service, task_queries, task_service
+from app.services.export_service import ExportFormat
+from app.services.import_service import ImportFormat
+from app.utils.etags import make_etag, not_modified, task_etag
 
 router = APIRouter()
+settings = get_settings()
 
 
-@router.get("/", response_model=list[TaskRead])
+@router.get(
+    "/",
+    response_model=list[TaskRead] | list[TaskProjection],
+    description="Returns full TaskRead items, or only id plus the requested columns when fields is given.",
+)
 def list_tasks(
+    request: Request,
+    response: Response,
+    filters: TaskFilters = Depends(),
+    fields: str | None = Query(default=None, max_length=200, description="Comma-separated TaskRead fields"),
     session: Session = Depends(get_db),
-    current_user: User = Depends(require_active_user),
+    current_user: Principal = Depends(require_active_user),
 ):
-    return task_service.list_tasks(session, current_user)
+    selected = task_queries.resolve_fields(fields)
+    version = task_service.task_collection_version(session, current_user)
+    cached = not_modified(request, response, make_etag(current_user.id, version, request.url.query))
+    if cached is not None:
+        return cached
+    return json_response(task_service.list_task_payloads(session, current_user, filters, selected), response)
+
+
+@router.get("/board", response_model=list[TaskSummary])
+def list_task_board(
+    request: Request,
+    response: Response,
+    filters: TaskFilters = Depends(),
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    version = task_service.task_collection_version(session, current_user)
+    cached = not_modified(request, response, make_etag(current_user.id, "board", version, request.url.query))
+    if cached is not None:
+        return cached
+    payloads = task_service.list_task_payloads(session, current_user, filters, task_queries.TASK_SUMMARY_FIELDS)
+    return json_response(payloads, response)
+
+
+@router.get("/page", response_model=TaskPage)
+def list_tasks_page(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    filters: TaskFilters = Depends(),
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    version = task_service.task_collection_version(session, current_user)
+    cached = not_modified(request, response, make_etag(current_user.id, version, request.url.query))
+    if cached is not None:
+        return cached
+    return task_service.list_tasks_page(session, current_user, limit, cursor, filters)
+
+
+@router.get(
+    "/search",
+    response_model=TaskSearchPage,
+    description=(
+        "Matches are ranked in blocks of the newest SEARCH_CANDIDATE_LIMIT matching tasks; "
+        "next_offset continues into older blocks once the current one is exhausted."
+    ),
+)
+def search_tasks(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0, le=10_000),
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    return task_service.search_tasks(session, current_user, q, limit, offset)
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_tasks(
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    stream_session = Session(bind=session.get_bind(), autoflush=False)
+    return StreamingResponse(
+        export_service.stream_export(stream_session, current_user, export_format),
+        media_type=export_service.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'},
+    )
 
 
 @router.post("/", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
 def create_task(
     task_in: TaskCreate,
+    response: Response,
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    task = task_service.create_task(session, current_user, task_in)
+    response.headers["ETag"] = task_etag(task.id, task.updated_at)
+    return task
+
+
+@router.post("/bulk", response_model=TaskBulkResult, status_code=status.HTTP_201_CREATED)
+def bulk_create_tasks(
+    payload: TaskBulkCreate,
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    return task_service.bulk_create_tasks(session, current_user, payload)
+
+
+@router.patch("/bulk", response_model=TaskBulkResult)
+def bulk_update_tasks(
+    payload: TaskBulkUpdate,
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    return task_service.bulk_update_tasks(session, current_user, payload)
+
+
+@router.delete("/bulk", response_model=TaskBulkResult)
+def bulk_delete_tasks(
+    payload: TaskBulkDelete,
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    return task_service.bulk_delete_tasks(session, current_user, payload)
+
+
+@router.post("/import", response_model=TaskImportSummary)
+def import_tasks(
+    file: UploadFile = File(...),
+    import_format: ImportFormat | None = Query(default=None, alias="format"),
+    batch_size: int | None = Query(default=None, ge=1, le=50_000),
+    session: Session = Depends(get_db),
+    current_user: Principal = Depends(require_active_user),
+):
+    return import_service.import_tasks(
+        session,
+        current_user,
+        file.file,
+        import_format or import_service.detect_format(file.filename),
+        batch_size or settings.task_import_batch_size,
+    )
+
+
+@router.get("/{task_id}", response_model=TaskRead)
+def get_task(
+    task_id: int,
+    request: Request,
+    response: Response,
     session: Session = Depends(get_db),
-    current_user: User = Depends(require_active_user),
+    current_user: Principal = Depends(require_active_user),
 ):
-    return task_service.create_task(session, current_user, task_in)
+    updated_at = task_service.task_version(session, current_user, task_id)
+    cached = not_modified(request, response, task_etag(task_id, updated_at))
+    if cached is not None:
+        return cached
+    return task_service.get_task(session, current_user, task_id)
 
 
 @router.put("/{task_id}", response_model=TaskRead)
 def update_task(
     task_id: int,
     task_in: TaskUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
     session: Session = Depends(get_db),
-    current_user: User = Depends(require_active_user),
+    current_user: Principal = Depends(require_active_user),
 ):
-    return task_service.update_task(session, current_user, task_id, task_in)
+    task = task_service.update_task(session, current_user, task_id, task_in, if_match)
+    response.headers["ETag"] = task_etag(task.id, task.updated_at)
+    return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_task(
     task_id: int,
     session: Session = Depends(get_db),
-    current_user: User = Depends(require_active_user),
+    current_user: Principal = Depends(require_active_user),
 ):
     task_service.delete_task(session, current_user, task_id)
     return
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import List
+from typing import Dict, List, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,13 +13,73 @@ class Settings(BaseSettings):
     project_name: str = "PonteTech Mission Control"
     environment: str = Field(default="local")
     secret_key: str = Field(default="super-secret")
-    jwt_algorithm: str = "HS256"
+    jwt_algorithm: Literal["HS256", "ES256", "EdDSA"] = "HS256"
+    jwt_key_id: str = Field(default="primary")
+    jwt_private_key: str | None = None
+    jwt_verification_keys: Dict[str, str] = Field(default_factory=dict)
+    token_cache_max_entries: int = Field(default=10_000, ge=0)
     access_token_expire_minutes: int = 60 * 24 * 7
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    principal_cache_ttl_seconds: int = Field(default=60)
+    principal_cache_max_entries: int = Field(default=10_000)
+    auth_trust_token_claims: bool = Field(default=False)
+    token_revocation_refresh_seconds: float = Field(default=5.0, gt=0)
+    rate_limit_enabled: bool = Field(default=True)
+    rate_limit_backend: Literal["memory", "database"] = Field(default="memory")
+    rate_limit_max_entries: int = Field(default=100_000, ge=1)
+    rate_limit_client_header: str | None = Field(default=None)
+    login_rate_limit_per_ip: int = Field(default=30, ge=1)
+    login_rate_limit_per_email: int = Field(default=5, ge=1)
+    login_rate_limit_window_seconds: float = Field(default=300.0, gt=0)
+    register_rate_limit_per_ip: int = Field(default=10, ge=1)
+    register_rate_limit_window_seconds: float = Field(default=3_600.0, gt=0)
+    password_hash_workers: int = Field(default=2)
+    password_hash_max_pending: int = Field(default=32)
+    password_hash_max_blocking: int = Field(default=8, ge=0)
+    password_hash_retry_after_seconds: int = Field(default=1)
     database_url: str = Field(default="postgresql+psycopg://ponte:ponte@db:5432/ponte")
     alembic_database_url: str | None = None
+    database_mode: Literal["sync", "async"] = Field(default="sync")
+    database_read_urls: List[str] = Field(default_factory=list)
+    read_your_writes_seconds: float = Field(default=5.0, ge=0)
+    read_your_writes_max_entries: int = Field(default=100_000)
+    db_pool_mode: Literal["queue", "null"] = Field(default="queue")
+    db_pool_size: int = Field(default=10, ge=1)
+    db_max_overflow: int = Field(default=20, ge=0)
+    db_pool_timeout: float = Field(default=10.0, gt=0)
+    db_pool_recycle: int = Field(default=1_800)
+    db_pool_pre_ping: Literal["always", "idle", "never"] = Field(default="idle")
+    db_pool_idle_ping_seconds: float = Field(default=30.0, ge=0)
+    db_pgbouncer: bool = Field(default=False)
+    server_host: str = Field(default="0.0.0.0")
+    server_port: int = Field(default=8000)
+    server_workers: int = Field(default=0, ge=0)
+    server_loop: Literal["auto", "asyncio", "uvloop"] = Field(default="auto")
+    server_http: Literal["auto", "h11", "httptools"] = Field(default="auto")
+    server_backlog: int = Field(default=2_048, ge=1)
+    server_keepalive_seconds: int = Field(default=5, ge=1)
+    server_graceful_shutdown_seconds: int = Field(default=30, ge=0)
+    server_limit_concurrency: int | None = Field(default=None, ge=1)
+    server_max_requests: int | None = Field(default=None, ge=1)
+    server_max_requests_jitter: int = Field(default=0, ge=0)
+    server_proxy_headers: bool = Field(default=True)
+    server_forwarded_allow_ips: str = Field(default="127.0.0.1")
+    server_warmup: bool = Field(default=True)
+    server_warmup_connections: int = Field(default=2, ge=0)
     backend_cors_origins: List[str] = Field(default_factory=lambda: ["http://localhost:5173"])
     frontend_url: str = Field(default="http://localhost:5173")
     log_level: str = Field(default="INFO")
+    metrics_enabled: bool = Field(default=True)
+    query_debug: bool = Field(default=False)
+    query_debug_repeat_threshold: int = Field(default=3, ge=2)
+    task_import_batch_size: int = Field(default=5_000)
+    summary_cache_ttl_seconds: int = Field(default=30)
+    summary_cache_max_entries: int = Field(default=10_000)
+    search_candidate_limit: int = Field(default=1_000, ge=1)
+    events_backend: Literal["memory", "postgres"] = Field(default="memory")
+    events_max_pending: int = Field(default=256, ge=1)
+    events_keepalive_seconds: float = Field(default=15.0, gt=0)
+    events_token_expire_seconds: int = Field(default=60, ge=1)
 
 
 @lru_cache
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from fastapi import Depends, HTTPException, status
+from typing import Any, Dict
+
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import decode_access_token
-from app.db.session import SessionLocal
+from app.core.principals import cache_principal, cached_principal
+from app.core.security import STREAM_SCOPE, decode_access_token
+from app.db.session import SessionLocal, get_async_sessionmaker
 from app.models.user import User
+from app.schemas.auth import Principal
 
 reuseable_oauth = HTTPBearer(auto_error=False)
 
@@ -19,23 +24,87 @@ def get_db():
         db.close()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials | None = Depends(reuseable_oauth),
-    session: Session = Depends(get_db),
-):
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+def _token_payload(
+    credentials: HTTPAuthorizationCredentials | None,
+    scope: str | None = None,
+) -> tuple[int, Dict[str, Any]]:
     if credentials is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing credentials")
     payload = decode_access_token(credentials.credentials)
     subject = payload.get("sub")
     if subject is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-    user = session.get(User, int(subject))
+    if payload.get("scope") != scope:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token scope")
+    return int(subject), payload
+
+
+def get_token_payload(
+    credentials: HTTPAuthorizationCredentials | None = Depends(reuseable_oauth),
+) -> Dict[str, Any]:
+    return _token_payload(credentials)[1]
+
+
+def _load_principal(user: User | None) -> Principal:
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    return cache_principal(user)
+
+
+def _ensure_token_version(principal: Principal, payload: Dict[str, Any]) -> Principal:
+    if payload.get("ver", 0) != principal.token_version:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+    return principal
+
+
+def _resolve_principal(session: Session, subject: int, payload: Dict[str, Any]) -> Principal:
+    principal = cached_principal(subject, payload)
+    if principal is None:
+        principal = _load_principal(session.get(User, subject))
+    return _ensure_token_version(principal, payload)
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(reuseable_oauth),
+    session: Session = Depends(get_db),
+) -> Principal:
+    return _resolve_principal(session, *_token_payload(credentials))
+
+
+def require_active_user(user: Principal = Depends(get_current_user)) -> Principal:
+    if not user.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
     return user
 
 
-def require_active_user(user: User = Depends(get_current_user)) -> User:
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials | None = Depends(reuseable_oauth),
+    session: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    subject, payload = _token_payload(credentials)
+    principal = cached_principal(subject, payload)
+    if principal is None:
+        principal = _load_principal(await session.get(User, subject))
+    return _ensure_token_version(principal, payload)
+
+
+async def require_active_user_async(user: Principal = Depends(get_current_user_async)) -> Principal:
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
     return user
+
+
+def require_stream_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(reuseable_oauth),
+    access_token: str | None = Query(default=None),
+    session: Session = Depends(get_db),
+) -> Principal:
+    if credentials is not None or not access_token:
+        return require_active_user(get_current_user(credentials, session))
+    stream_credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+    return require_active_user(_resolve_principal(session, *_token_payload(stream_credentials, STREAM_SCOPE)))
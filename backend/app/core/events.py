@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable
+
+import structlog
+from sqlalchemy.engine import make_url
+
+from app.core.config import Settings, get_settings
+
+Message = dict[str, Any]
+
+NOTIFY_CHANNEL = "ponte_events"
+NOTIFY_PAYLOAD_LIMIT = 7_900
+
+logger = structlog.get_logger("ponte.events")
+
+
+class Subscription:
+    def __init__(self, user_id: int, max_pending: int) -> None:
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[Message] = asyncio.Queue(max_pending)
+        self.overflowed = False
+
+    def push(self, message: Message) -> None:
+        if self.queue.full():
+            self.overflowed = True
+            return
+        self.queue.put_nowait(message)
+
+    async def get(self) -> Message:
+        return await self.queue.get()
+
+    def drain(self) -> list[Message]:
+        messages = []
+        while not self.queue.empty():
+            messages.append(self.queue.get_nowait())
+        return messages
+
+
+class EventBroker:
+    def __init__(self, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._invalidators: list[Callable[[int], None]] = []
+        self._lock = threading.Lock()
+
+    def on_dispatch(self, invalidate: Callable[[int], None]) -> None:
+        self._invalidators.append(invalidate)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[Subscription]:
+        subscription = Subscription(user_id, self.max_pending)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(user_id, set())
+                subscribers.discard(subscription)
+                if not subscribers:
+                    self._subscribers.pop(user_id, None)
+
+    def subscriber_count(self, user_id: int | None = None) -> int:
+        with self._lock:
+            if user_id is not None:
+                return len(self._subscribers.get(user_id, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def dispatch(self, user_id: int, message: Message) -> None:
+        for invalidate in self._invalidators:
+            invalidate(user_id)
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.push, message)
+            except RuntimeError:
+                continue
+
+    def publish(self, user_id: int, message: Message) -> None:
+        self.dispatch(user_id, message)
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+
+class PostgresEventBroker(EventBroker):
+    def __init__(self, dsn: str, max_pending: int) -> None:
+        super().__init__(max_pending)
+        self.dsn = dsn
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ponte-notify")
+        self._connection: Any = None
+        self._listener: asyncio.Task | None = None
+
+    def publish(self, user_id: int, message: Message) -> None:
+        payload = json.dumps({"user_id": user_id, "message": message}, separators=(",", ":"), default=str)
+        if len(payload.encode("utf-8")) > NOTIFY_PAYLOAD_LIMIT:
+            truncated = {"type": message.get("type"), "truncated": True}
+            payload = json.dumps({"user_id": user_id, "message": truncated}, separators=(",", ":"))
+        self._executor.submit(self._notify, payload)
+
+    def _notify(self, payload: str) -> None:
+        import psycopg
+
+        for attempt in range(2):
+            try:
+                if self._connection is None or self._connection.closed:
+                    self._connection = psycopg.connect(self.dsn, autocommit=True)
+                self._connection.execute("SELECT pg_notify(%s, %s)", (NOTIFY_CHANNEL, payload))
+                return
+            except psycopg.OperationalError:
+                self._connection = None
+                if attempt:
+                    logger.warning("event_notify_failed", channel=NOTIFY_CHANNEL)
+
+    async def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._executor.shutdown(wait=False)
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def _listen(self) -> None:
+        import psycopg
+
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(self.dsn, autocommit=True) as connection:
+                    await connection.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                    async for notify in connection.notifies():
+                        data = json.loads(notify.payload)
+                        self.dispatch(int(data["user_id"]), data["message"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("event_listener_disconnected", channel=NOTIFY_CHANNEL)
+                await asyncio.sleep(1)
+
+
+def libpq_dsn(url: str) -> str:
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def build_event_broker(settings: Settings) -> EventBroker:
+    if settings.events_backend == "postgres":
+        return PostgresEventBroker(libpq_dsn(settings.database_url), settings.events_max_pending)
+    return EventBroker(settings.events_max_pending)
+
+
+event_broker = build_event_broker(get_settings())
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import secrets
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable
+
+import bcrypt
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core import metrics
+from app.core.config import get_settings
+
+
+def _hash(password: bytes, rounds: int) -> str:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+def _check(password: bytes, hashed: bytes) -> bool:
+    try:
+        return bcrypt.checkpw(password, hashed)
+    except ValueError:
+        return False
+
+
+def hash_rounds(hashed_password: str) -> int | None:
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        rounds: int,
+        workers: int,
+        max_pending: int,
+        retry_after_seconds: int,
+        max_blocking: int | None = None,
+    ) -> None:
+        self.rounds = rounds
+        self.workers = workers
+        self.retry_after_seconds = retry_after_seconds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._blocking_slots = threading.BoundedSemaphore(max_pending if max_blocking is None else max_blocking)
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._dummy_hash: str | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._executor
+
+    def _acquire(self, slots: threading.BoundedSemaphore | None = None) -> None:
+        if not (slots or self._slots).acquire(blocking=False):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Password hashing capacity exhausted",
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+
+    def _submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        self._acquire()
+        try:
+            future = self._get_executor().submit(func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _run_inline(self, func: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        try:
+            return func(*args)
+        finally:
+            self._slots.release()
+
+    def _call(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        start = time.perf_counter()
+        self._acquire(self._blocking_slots)
+        try:
+            if self.workers <= 0:
+                return self._run_inline(func, *args)
+            return self._submit(func, *args).result()
+        finally:
+            self._blocking_slots.release()
+            metrics.password_hash_duration.observe(time.perf_counter() - start, operation=operation)
+
+    async def _call_async(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(self._run_inline, func, *args)
+            return await asyncio.wrap_future(self._submit(func, *args))
+        finally:
+            metrics.password_hash_duration.observe(time.perf_counter() - start, operation=operation)
+
+    def hash(self, password: str) -> str:
+        return self._call("hash", _hash, password.encode("utf-8"), self.rounds)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._call("verify", _check, password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    async def hash_async(self, password: str) -> str:
+        return await self._call_async("hash", _hash, password.encode("utf-8"), self.rounds)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        return await self._call_async("verify", _check, password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    def dummy_hash(self) -> str:
+        if self._dummy_hash is None:
+            self._dummy_hash = _hash(secrets.token_bytes(16), self.rounds)
+        return self._dummy_hash
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        rounds = hash_rounds(hashed_password)
+        return rounds is None or rounds < self.rounds
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+settings = get_settings()
+
+password_hasher = PasswordHasher(
+    rounds=settings.bcrypt_rounds,
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+    retry_after_seconds=settings.password_hash_retry_after_seconds,
+    max_blocking=settings.password_hash_max_blocking,
+)
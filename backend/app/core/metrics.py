@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, TypeVar
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = tuple[str, ...]
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    serialization_seconds: float = 0.0
+    statements: StatementCounter[str] | None = field(default=None)
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        ...
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._collectors: list[Callable[[], dict[LabelValues, float]]] = []
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def track(self, collector: Callable[[], dict[LabelValues, float]]) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = dict(self._values)
+            collectors = list(self._collectors)
+        for collector in collectors:
+            values.update(collector())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values.items()]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 3)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+        lines = []
+        for key, values in series.items():
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(cumulative)}")
+            inf = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, inf)} {_format_value(values[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(values[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(values[-1])}")
+        return lines
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: MetricT) -> MetricT:
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+registry = Registry()
+
+http_request_duration = registry.register(
+    Histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route", "status"))
+)
+http_request_db_queries = registry.register(
+    Histogram("http_request_db_queries", "SQL statements executed per request", ("route",), buckets=COUNT_BUCKETS)
+)
+http_request_db_duration = registry.register(
+    Histogram("http_request_db_duration_seconds", "Time spent in SQL per request", ("route",))
+)
+db_query_duration = registry.register(Histogram("db_query_duration_seconds", "SQL statement execution time"))
+db_pool_checkouts = registry.register(
+    Counter("db_pool_checkouts_total", "Connections handed out by the pool", ("pool",))
+)
+db_pool_checkout_wait = registry.register(
+    Histogram("db_pool_checkout_wait_seconds", "Time spent acquiring a connection from the pool", ("pool",))
+)
+db_pool_connect_duration = registry.register(
+    Histogram("db_pool_connect_seconds", "Time spent opening new pooled connections", ("pool",))
+)
+db_pool_state = registry.register(
+    Gauge("db_pool_connections", "Connection pool size, checked-out and overflow counts", ("pool", "state"))
+)
+password_hash_duration = registry.register(
+    Histogram("password_hash_duration_seconds", "bcrypt hash and verify latency", ("operation",))
+)
+response_serialization_duration = registry.register(
+    Histogram("response_serialization_duration_seconds", "Response body rendering time", ("route",))
+)
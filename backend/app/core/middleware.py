@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+import uuid
+from collections import Counter
+
+import structlog
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from structlog.contextvars import bind_contextvars
+
+from app.core import metrics
+from app.db.instrumentation import repeated_statements
+from app.db.routing import READ_YOUR_WRITES_HEADER, parse_write_window, write_window
+
+SECURITY_HEADERS = {
+    "X-Frame-Options": "DENY",
+    "X-Content-Type-Options": "nosniff",
+    "Strict-Transport-Security": "max-age=63072000; includeSubDomains",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "camera=(), microphone=(), geolocation=()",
+}
+
+
+class RequestContextMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        collect_metrics: bool = True,
+        query_debug: bool = False,
+        repeated_query_threshold: int = 3,
+    ) -> None:
+        self.app = app
+        self.collect_metrics = collect_metrics
+        self.query_debug = query_debug
+        self.repeated_query_threshold = repeated_query_threshold
+        self.logger = structlog.get_logger("ponte.api")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        bind_contextvars(path=scope["path"], method=scope["method"])
+        trace_id = str(uuid.uuid4())
+        start = time.perf_counter()
+        status_code = 500
+        stats = metrics.RequestStats(statements=Counter() if self.query_debug else None)
+        tracked = self.collect_metrics or self.query_debug
+        token = metrics.request_stats.set(stats) if tracked else None
+        window = parse_write_window(Headers(scope=scope).get(READ_YOUR_WRITES_HEADER))
+        window_token = write_window.set(window)
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(raw=list(message.get("headers", [])))
+                for name, value in SECURITY_HEADERS.items():
+                    headers[name] = value
+                headers["X-Trace-Id"] = trace_id
+                if self.query_debug:
+                    headers["X-DB-Queries"] = str(stats.queries)
+                if window.written_until:
+                    headers[READ_YOUR_WRITES_HEADER] = f"{window.written_until:.3f}"
+                message = {**message, "headers": headers.raw}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        except Exception:
+            elapsed = time.perf_counter() - start
+            self._record(scope, status_code, elapsed, stats)
+            self.logger.exception("request_error", trace_id=trace_id, duration_ms=round(elapsed * 1000, 2))
+            raise
+        finally:
+            write_window.reset(window_token)
+            if token is not None:
+                metrics.request_stats.reset(token)
+        elapsed = time.perf_counter() - start
+        self._record(scope, status_code, elapsed, stats)
+        if stats.statements:
+            self._report_repeats(scope, trace_id, stats.statements)
+        self.logger.info(
+            "request_completed",
+            trace_id=trace_id,
+            status_code=status_code,
+            duration_ms=round(elapsed * 1000, 2),
+            db_queries=stats.queries,
+        )
+
+    def _record(self, scope: Scope, status_code: int, elapsed: float, stats: metrics.RequestStats) -> None:
+        if not self.collect_metrics:
+            return
+        route = getattr(scope.get("route"), "path", "unmatched")
+        metrics.http_request_duration.observe(elapsed, method=scope["method"], route=route, status=str(status_code))
+        metrics.http_request_db_queries.observe(stats.queries, route=route)
+        metrics.http_request_db_duration.observe(stats.db_seconds, route=route)
+        metrics.response_serialization_duration.observe(stats.serialization_seconds, route=route)
+
+    def _report_repeats(self, scope: Scope, trace_id: str, statements: Counter[str]) -> None:
+        route = getattr(scope.get("route"), "path", "unmatched")
+        for statement, count in repeated_statements(statements, self.repeated_query_threshold):
+            self.logger.warning("possible_n_plus_one", trace_id=trace_id, route=route, count=count, statement=statement)
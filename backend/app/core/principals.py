@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import get_settings
+from app.models.user import User
+from app.schemas.auth import Principal
+from app.utils.cache import TTLCache
+
+settings = get_settings()
+
+principal_cache: TTLCache[Principal] = TTLCache(
+    max_entries=settings.principal_cache_max_entries,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+PENDING_INVALIDATIONS = "principal_invalidations"
+
+
+def principal_claims(user: User | Principal) -> Dict[str, Any]:
+    return {"email": user.email, "act": user.is_active, "ver": user.token_version}
+
+
+def principal_from_claims(subject: int, payload: Dict[str, Any]) -> Principal | None:
+    if not {"email", "act", "ver"} <= payload.keys():
+        return None
+    return Principal(id=subject, email=payload["email"], is_active=payload["act"], token_version=payload["ver"])
+
+
+def cached_principal(subject: int, payload: Dict[str, Any]) -> Principal | None:
+    if settings.auth_trust_token_claims:
+        principal = principal_from_claims(subject, payload)
+        if principal is not None:
+            return principal
+    return principal_cache.get(subject)
+
+
+def cache_principal(user: User) -> Principal:
+    principal = Principal.model_validate(user)
+    principal_cache.set(user.id, principal)
+    return principal
+
+
+def invalidate_principal(user_id: int) -> None:
+    principal_cache.pop(user_id)
+
+
+def _defer_invalidation(target: User) -> None:
+    session = object_session(target)
+    if session is None:
+        invalidate_principal(target.id)
+        return
+    session.info.setdefault(PENDING_INVALIDATIONS, set()).add(target.id)
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    if state.attrs.is_active.history.has_changes() or state.attrs.token_version.history.has_changes():
+        _defer_invalidation(target)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target: User) -> None:
+    _defer_invalidation(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_invalidations(session: Session) -> None:
+    for user_id in session.info.pop(PENDING_INVALIDATIONS, ()):
+        invalidate_principal(user_id)
+
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session: Session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS, None)
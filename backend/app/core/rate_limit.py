@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Protocol
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.db.session import SessionLocal
+from app.models.rate_limit import RateLimitCounter
+
+settings = get_settings()
+
+PRUNE_INTERVAL_SECONDS = 60.0
+
+WindowCounts = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    name: str
+    limit: int
+    window_seconds: float
+
+
+class RateLimitBackend(Protocol):
+    def increment(self, key: str, window: int, window_seconds: float) -> WindowCounts: ...
+
+    def reset(self, key: str) -> None: ...
+
+
+def _roll(entry: tuple[int, int, int] | None, window: int) -> WindowCounts:
+    if entry is None:
+        return 0, 0
+    start, current, previous = entry
+    if start == window:
+        return current, previous
+    if start == window - 1:
+        return 0, current
+    return 0, 0
+
+
+class MemoryRateLimitBackend:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def increment(self, key: str, window: int, window_seconds: float) -> WindowCounts:
+        with self._lock:
+            current, previous = _roll(self._entries.get(key), window)
+            self._entries[key] = (window, current + 1, previous)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return current + 1, previous
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DatabaseRateLimitBackend:
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self.session_factory = session_factory
+        self._next_prune = 0.0
+
+    @staticmethod
+    def _counts(session: Session, key: str, window: int) -> WindowCounts:
+        counter = RateLimitCounter
+        rows = dict(
+            session.execute(
+                select(counter.window, counter.count).where(
+                    counter.key == key,
+                    counter.window.in_((window, window - 1)),
+                )
+            ).all()
+        )
+        return rows.get(window, 0), rows.get(window - 1, 0)
+
+    def increment(self, key: str, window: int, window_seconds: float) -> WindowCounts:
+        now = datetime.now(timezone.utc)
+        with self.session_factory() as session:
+            dialect = session.get_bind().dialect.name
+            statement = (postgresql.insert if dialect == "postgresql" else sqlite.insert)(RateLimitCounter).values(
+                key=key,
+                window=window,
+                count=1,
+                expires_at=now + timedelta(seconds=2 * window_seconds),
+            )
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[RateLimitCounter.key, RateLimitCounter.window],
+                    set_={"count": RateLimitCounter.count + 1},
+                )
+            )
+            counts = self._counts(session, key, window)
+            if time.monotonic() >= self._next_prune:
+                self._next_prune = time.monotonic() + PRUNE_INTERVAL_SECONDS
+                session.execute(delete(RateLimitCounter).where(RateLimitCounter.expires_at <= now))
+            session.commit()
+        return counts
+
+    def reset(self, key: str) -> None:
+        with self.session_factory() as session:
+            session.execute(delete(RateLimitCounter).where(RateLimitCounter.key == key))
+            session.commit()
+
+
+class RateLimiter:
+    def __init__(self, backend: RateLimitBackend, enabled: bool = True) -> None:
+        self.backend = backend
+        self.enabled = enabled
+
+    @staticmethod
+    def _key(rule: RateLimit, identity: str) -> str:
+        return f"{rule.name}:{identity}"[:255]
+
+    @staticmethod
+    def _position(rule: RateLimit) -> tuple[int, float]:
+        position = time.time() / rule.window_seconds
+        window = int(position)
+        return window, position - window
+
+    @staticmethod
+    def _estimate(counts: WindowCounts, elapsed: float) -> float:
+        current, previous = counts
+        return current + previous * (1 - elapsed)
+
+    @staticmethod
+    def _reject(rule: RateLimit, elapsed: float) -> HTTPException:
+        retry_after = max(1, math.ceil(rule.window_seconds * (1 - elapsed)))
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    def record(self, rule: RateLimit, identity: str) -> float:
+        if not self.enabled:
+            return 0.0
+        window, elapsed = self._position(rule)
+        return self._estimate(self.backend.increment(self._key(rule, identity), window, rule.window_seconds), elapsed)
+
+    def consume(self, rule: RateLimit, identity: str) -> None:
+        if self.record(rule, identity) > rule.limit:
+            raise self._reject(rule, self._position(rule)[1])
+
+    def reset(self, rule: RateLimit, identity: str) -> None:
+        if self.enabled:
+            self.backend.reset(self._key(rule, identity))
+
+
+def build_rate_limiter(config: Settings) -> RateLimiter:
+    if config.rate_limit_backend == "database":
+        backend: RateLimitBackend = DatabaseRateLimitBackend(SessionLocal)
+    else:
+        backend = MemoryRateLimitBackend(config.rate_limit_max_entries)
+    return RateLimiter(backend, enabled=config.rate_limit_enabled)
+
+
+def client_address(request: Request) -> str:
+    if settings.rate_limit_client_header:
+        forwarded = request.headers.get(settings.rate_limit_client_header)
+        if forwarded:
+            return forwarded.rsplit(",", 1)[-1].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(rule: RateLimit) -> Callable[[Request], None]:
+    def dependency(request: Request) -> None:
+        rate_limiter.consume(rule, client_address(request))
+
+    return dependency
+
+
+rate_limiter = build_rate_limiter(settings)
+
+LOGIN_PER_IP = RateLimit(
+    "login-ip",
+    settings.login_rate_limit_per_ip,
+    settings.login_rate_limit_window_seconds,
+)
+LOGIN_PER_EMAIL = RateLimit(
+    "login-email",
+    settings.login_rate_limit_per_email,
+    settings.login_rate_limit_window_seconds,
+)
+REGISTER_PER_IP = RateLimit(
+    "register-ip",
+    settings.register_rate_limit_per_ip,
+    settings.register_rate_limit_window_seconds,
+)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from app.core import metrics
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class InstrumentedJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        start = time.perf_counter()
+        body = orjson.dumps(content, option=ORJSON_OPTIONS)
+        stats = metrics.request_stats.get()
+        if stats is not None:
+            stats.serialization_seconds += time.perf_counter() - start
+        return body
+
+
+def json_response(content: Any, response: Response | None = None, status_code: int = 200) -> InstrumentedJSONResponse:
+    headers = None
+    if response is not None:
+        headers = {name: value for name, value in response.headers.items() if name != "content-length"}
+    return InstrumentedJSONResponse(content, status_code=status_code, headers=headers)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Mapping, Protocol
+
+import structlog
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.models.token_revocation import TokenRevocation
+from app.utils.timestamps import utcnow
+
+settings = get_settings()
+logger = structlog.get_logger("ponte.auth")
+
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+def _timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@dataclass(frozen=True)
+class Revocation:
+    user_id: int
+    expires_at: datetime
+    jti: str | None = None
+    min_version: int | None = None
+
+
+class RevocationBackend(Protocol):
+    def add(self, revocation: Revocation) -> None: ...
+
+    def since(self, watermark: float) -> tuple[list[Revocation], float]: ...
+
+    def prune(self, now: datetime) -> int: ...
+
+
+class MemoryRevocationBackend:
+    def __init__(self) -> None:
+        self._entries: dict[int, Revocation] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def add(self, revocation: Revocation) -> None:
+        with self._lock:
+            self._entries[self._next_id] = revocation
+            self._next_id += 1
+
+    def since(self, watermark: float) -> tuple[list[Revocation], float]:
+        with self._lock:
+            entries = [revocation for key, revocation in self._entries.items() if key > watermark]
+            return entries, float(self._next_id - 1)
+
+    def prune(self, now: datetime) -> int:
+        with self._lock:
+            expired = [key for key, revocation in self._entries.items() if revocation.expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+
+class DatabaseRevocationBackend:
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self.session_factory = session_factory
+
+    def add(self, revocation: Revocation) -> None:
+        with self.session_factory() as session:
+            session.add(
+                TokenRevocation(
+                    user_id=revocation.user_id,
+                    jti=revocation.jti,
+                    min_version=revocation.min_version,
+                    expires_at=revocation.expires_at,
+                )
+            )
+            session.commit()
+
+    def since(self, watermark: float) -> tuple[list[Revocation], float]:
+        statement = select(TokenRevocation).where(TokenRevocation.expires_at > utcnow())
+        if watermark:
+            after = datetime.fromtimestamp(watermark, timezone.utc) - REFRESH_OVERLAP
+            statement = statement.where(TokenRevocation.created_at >= after)
+        with self.session_factory() as session:
+            rows = session.scalars(statement).all()
+        entries = [
+            Revocation(user_id=row.user_id, expires_at=row.expires_at, jti=row.jti, min_version=row.min_version)
+            for row in rows
+        ]
+        return entries, max((_timestamp(row.created_at) for row in rows), default=watermark)
+
+    def prune(self, now: datetime) -> int:
+        with self.session_factory() as session:
+            result = session.execute(delete(TokenRevocation).where(TokenRevocation.expires_at <= now))
+            session.commit()
+        return result.rowcount
+
+
+class RevocationStore:
+    def __init__(self, backend: RevocationBackend, refresh_seconds: float) -> None:
+        self.backend = backend
+        self.refresh_seconds = refresh_seconds
+        self._tokens: dict[str, float] = {}
+        self._users: dict[str, tuple[int, float]] = {}
+        self._watermark = 0.0
+        self._lock = threading.Lock()
+        self._refresher: asyncio.Task | None = None
+
+    def is_revoked(self, payload: Mapping[str, Any]) -> bool:
+        if payload.get("jti") in self._tokens:
+            return True
+        cutoff = self._users.get(payload.get("sub"))
+        return cutoff is not None and payload.get("ver", 0) < cutoff[0]
+
+    def revoke_token(self, jti: str, user_id: int, expires_at: datetime) -> None:
+        revocation = Revocation(user_id=user_id, expires_at=expires_at, jti=jti)
+        self.backend.add(revocation)
+        self._apply([revocation])
+
+    def revoke_user(self, user_id: int, min_version: int, expires_at: datetime) -> None:
+        revocation = Revocation(user_id=user_id, expires_at=expires_at, min_version=min_version)
+        self.backend.add(revocation)
+        self._apply([revocation])
+
+    def _apply(self, revocations: list[Revocation]) -> None:
+        with self._lock:
+            for revocation in revocations:
+                expires = _timestamp(revocation.expires_at)
+                if revocation.jti is not None:
+                    self._tokens[revocation.jti] = expires
+                if revocation.min_version is not None:
+                    key = str(revocation.user_id)
+                    current = self._users.get(key, (0, 0.0))
+                    self._users[key] = (max(current[0], revocation.min_version), max(current[1], expires))
+
+    def refresh(self) -> int:
+        revocations, watermark = self.backend.since(self._watermark)
+        self._apply(revocations)
+        self._watermark = watermark
+        now = time.time()
+        with self._lock:
+            if any(expires <= now for expires in self._tokens.values()):
+                self._tokens = {jti: expires for jti, expires in self._tokens.items() if expires > now}
+            if any(expires <= now for _, expires in self._users.values()):
+                self._users = {key: value for key, value in self._users.items() if value[1] > now}
+        return len(revocations)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens = {}
+            self._users = {}
+            self._watermark = 0.0
+
+    def __len__(self) -> int:
+        return len(self._tokens) + len(self._users)
+
+    async def start(self) -> None:
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+
+    async def _refresh_forever(self) -> None:
+        try:
+            await run_in_threadpool(self.backend.prune, utcnow())
+        except Exception:
+            logger.warning("token_revocation_prune_failed")
+        while True:
+            try:
+                await run_in_threadpool(self.refresh)
+            except Exception:
+                logger.warning("token_revocation_refresh_failed")
+            await asyncio.sleep(self.refresh_seconds)
+
+
+token_revocations = RevocationStore(
+    DatabaseRevocationBackend(SessionLocal),
+    refresh_seconds=settings.token_revocation_refresh_seconds,
+)
@@ -4,27 +4,47 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
-import bcrypt
 import jwt
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import get_settings
+from app.core.hashing import password_hasher
+from app.core.revocation import token_revocations
+from app.core.tokens import token_verifier
 
 
 settings = get_settings()
 
+STREAM_SCOPE = "stream"
+
 
 def get_password_hash(password: str) -> str:
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed.decode("utf-8")
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    try:
-        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
-    except ValueError:
-        return False
+    return password_hasher.verify(plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.hash_async(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify_async(plain_password, hashed_password)
+
+
+def burn_password_check(plain_password: str) -> None:
+    password_hasher.verify(plain_password, password_hasher.dummy_hash())
+
+
+async def burn_password_check_async(plain_password: str) -> None:
+    await password_hasher.verify_async(plain_password, await run_in_threadpool(password_hasher.dummy_hash))
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return password_hasher.needs_rehash(hashed_password)
 
 
 def create_access_token(
@@ -42,11 +62,22 @@ def create_access_token(
     }
     if extra_claims:
         payload.update(extra_claims)
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.jwt_algorithm)
+    return token_verifier.sign(payload)
+
+
+def create_stream_token(subject: str | int, claims: Dict[str, Any]) -> str:
+    return create_access_token(
+        subject,
+        expires_delta=timedelta(seconds=settings.events_token_expire_seconds),
+        extra_claims={**claims, "scope": STREAM_SCOPE},
+    )
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
     try:
-        return jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
+        payload = token_verifier.verify(token)
     except jwt.PyJWTError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
+    if token_revocations.is_revoked(payload):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+    return payload
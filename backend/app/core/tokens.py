@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+
+from app.core.config import Settings, get_settings
+from app.utils.cache import TTLCache
+
+ASYMMETRIC_ALGORITHMS = frozenset({"ES256", "EdDSA"})
+
+
+def _material(value: str) -> bytes:
+    if value.lstrip().startswith("-----BEGIN"):
+        return value.encode("utf-8")
+    return Path(value).read_bytes()
+
+
+def load_private_key(value: str) -> Any:
+    return serialization.load_pem_private_key(_material(value), password=None)
+
+
+def load_public_key(value: str) -> Any:
+    return serialization.load_pem_public_key(_material(value))
+
+
+class KeyRing:
+    def __init__(
+        self,
+        algorithm: str,
+        signing_kid: str,
+        signing_key: Any,
+        verification_keys: Dict[str, Any],
+    ) -> None:
+        self.algorithm = algorithm
+        self.signing_kid = signing_kid
+        self.signing_key = signing_key
+        self.verification_keys = verification_keys
+
+    @classmethod
+    def from_settings(cls, config: Settings) -> KeyRing:
+        if config.jwt_algorithm not in ASYMMETRIC_ALGORITHMS:
+            keys = {kid: secret.encode("utf-8") for kid, secret in config.jwt_verification_keys.items()}
+            signing_key = config.secret_key.encode("utf-8")
+            keys[config.jwt_key_id] = signing_key
+            return cls(config.jwt_algorithm, config.jwt_key_id, signing_key, keys)
+        if not config.jwt_private_key:
+            raise ValueError(f"JWT_PRIVATE_KEY is required for {config.jwt_algorithm} tokens")
+        private_key = load_private_key(config.jwt_private_key)
+        keys = {kid: load_public_key(value) for kid, value in config.jwt_verification_keys.items()}
+        keys[config.jwt_key_id] = private_key.public_key()
+        return cls(config.jwt_algorithm, config.jwt_key_id, private_key, keys)
+
+    def sign(self, payload: Dict[str, Any]) -> str:
+        return jwt.encode(payload, self.signing_key, algorithm=self.algorithm, headers={"kid": self.signing_kid})
+
+    def verification_key(self, token: str) -> Any:
+        if len(self.verification_keys) == 1:
+            return self.verification_keys[self.signing_kid]
+        kid = jwt.get_unverified_header(token).get("kid", self.signing_kid)
+        key = self.verification_keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown key id {kid!r}")
+        return key
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        key = self.verification_key(token)
+        return jwt.decode(token, key, algorithms=[self.algorithm], options={"require": ["exp"]})
+
+
+class TokenVerifier:
+    def __init__(self, keyring: KeyRing, max_entries: int) -> None:
+        self.keyring = keyring
+        self.cache: TTLCache[Dict[str, Any]] = TTLCache(max_entries=max_entries, ttl_seconds=0)
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        payload = self.cache.get(token)
+        if payload is None:
+            payload = self.keyring.verify(token)
+            self.cache.set(token, payload, ttl_seconds=payload["exp"] - time.time())
+        return dict(payload)
+
+    def sign(self, payload: Dict[str, Any]) -> str:
+        return self.keyring.sign(payload)
+
+
+def build_token_verifier(config: Settings) -> TokenVerifier:
+    return TokenVerifier(KeyRing.from_settings(config), max_entries=config.token_cache_max_entries)
+
+
+token_verifier = build_token_verifier(get_settings())
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+import structlog
+from fastapi import FastAPI
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.core.hashing import password_hasher
+from app.core.tokens import token_verifier
+from app.db.session import engine, get_async_sessionmaker, read_engines
+
+settings = get_settings()
+logger = structlog.get_logger("ponte.server")
+
+
+def warm_pool(target: Engine, connections: int) -> int:
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = target.connect()
+            opened.append(connection)
+            connection.exec_driver_sql("SELECT 1")
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+async def warm_async_pool(target: AsyncEngine, connections: int) -> int:
+    async def ping() -> None:
+        async with target.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+
+    await asyncio.gather(*(ping() for _ in range(connections)))
+    return connections
+
+
+def warm_connection_count() -> int:
+    if settings.db_pool_mode == "null":
+        return 0
+    return min(settings.server_warmup_connections, settings.db_pool_size)
+
+
+async def warm_database() -> None:
+    connections = warm_connection_count()
+    for target in (engine, *read_engines):
+        await run_in_threadpool(warm_pool, target, connections)
+    if settings.database_mode == "async":
+        await warm_async_pool(get_async_sessionmaker().kw["bind"], connections)
+
+
+async def warm_tokens() -> None:
+    keyring = token_verifier.keyring
+    keyring.verify(keyring.sign({"sub": "0", "exp": int(time.time()) + 60}))
+
+
+async def warm_password_hasher() -> None:
+    dummy_hash = await run_in_threadpool(password_hasher.dummy_hash)
+    workers = max(password_hasher.workers, 1)
+    await asyncio.gather(*(password_hasher.verify_async("warmup", dummy_hash) for _ in range(workers)))
+
+
+async def request(application: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"warmup")],
+        "client": ("127.0.0.1", 0),
+        "server": ("warmup", 80),
+    }
+    messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+    statuses: list[int] = []
+
+    async def receive():
+        return next(messages, {"type": "http.disconnect"})
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    await application(scope, receive, send)
+    return statuses[0]
+
+
+def warm_routes(application: FastAPI) -> Callable[[], Awaitable[None]]:
+    async def warm() -> None:
+        application.openapi()
+        await asyncio.create_task(request(application, "/health"))
+
+    return warm
+
+
+async def warm_up(application: FastAPI) -> dict[str, float]:
+    steps: dict[str, Callable[[], Awaitable[None]]] = {
+        "database": warm_database,
+        "tokens": warm_tokens,
+        "password_hasher": warm_password_hasher,
+        "routes": warm_routes(application),
+    }
+    timings: dict[str, float] = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        try:
+            await step()
+        except Exception as error:
+            logger.warning("warmup_step_failed", step=name, error=str(error))
+            continue
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info("worker_warmed", **{f"{name}_ms": value for name, value in timings.items()})
+    return timings
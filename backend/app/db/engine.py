@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.core.config import Settings, get_settings
+from app.db.instrumentation import instrument_engine
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+psycopg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def uses_queue_pool(url: str) -> bool:
+    parsed = make_url(url)
+    return issubclass(parsed.get_dialect().get_pool_class(parsed), QueuePool)
+
+
+def engine_options(url: str, settings: Settings) -> dict[str, Any]:
+    options: dict[str, Any] = {"pool_pre_ping": settings.db_pool_pre_ping == "always"}
+    if settings.db_pool_mode == "null":
+        options["poolclass"] = NullPool
+    elif uses_queue_pool(url):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    if settings.db_pgbouncer and make_url(url).get_backend_name() == "postgresql":
+        options["connect_args"] = {"prepare_threshold": None}
+    return options
+
+
+def _ping_idle_connections(engine: Engine, idle_seconds: float) -> None:
+    @event.listens_for(engine, "checkin")
+    def mark_checkin(dbapi_connection, connection_record) -> None:
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def ping_after_idle(dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as error:
+            raise exc.DisconnectionError() from error
+
+
+def _configure(engine: Engine, settings: Settings, name: str) -> None:
+    if settings.db_pool_pre_ping == "idle" and settings.db_pool_mode != "null":
+        _ping_idle_connections(engine, settings.db_pool_idle_ping_seconds)
+    if settings.metrics_enabled or settings.query_debug:
+        instrument_engine(engine, name=name)
+
+
+def build_engine(url: str, settings: Settings | None = None, name: str = "primary") -> Engine:
+    settings = settings or get_settings()
+    engine = create_engine(url, future=True, **engine_options(url, settings))
+    _configure(engine, settings, name)
+    return engine
+
+
+def build_async_engine(url: str, settings: Settings | None = None, name: str = "primary_async") -> AsyncEngine:
+    settings = settings or get_settings()
+    async_url = async_database_url(url)
+    async_engine = create_async_engine(async_url, **engine_options(async_url, settings))
+    _configure(async_engine.sync_engine, settings, name)
+    return async_engine
+
+
+def pool_summary(engine: Engine, settings: Settings | None = None) -> dict[str, Any]:
+    settings = settings or get_settings()
+    summary: dict[str, Any] = {
+        "backend": engine.url.get_backend_name(),
+        "pool": type(engine.pool).__name__,
+        "pre_ping": settings.db_pool_pre_ping,
+        "pgbouncer": settings.db_pgbouncer,
+    }
+    if isinstance(engine.pool, QueuePool):
+        summary.update(
+            size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            timeout=settings.db_pool_timeout,
+            recycle=settings.db_pool_recycle,
+        )
+    return summary
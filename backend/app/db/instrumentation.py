@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import metrics
+
+_query_captures: ContextVar[tuple[list[str], ...]] = ContextVar("query_captures", default=())
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get("query_started_at")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    metrics.db_query_duration.observe(elapsed)
+    stats = metrics.request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if stats.statements is not None:
+            stats.statements[statement] += 1
+    captures = _query_captures.get()
+    if captures:
+        for captured in captures:
+            captured.append(statement)
+
+
+@contextmanager
+def capture_queries() -> Iterator[list[str]]:
+    captured: list[str] = []
+    token = _query_captures.set((*_query_captures.get(), captured))
+    try:
+        yield captured
+    finally:
+        _query_captures.reset(token)
+
+
+def repeated_statements(statements: dict[str, int], threshold: int) -> list[tuple[str, int]]:
+    return sorted(
+        ((statement, count) for statement, count in statements.items() if count >= threshold),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+
+def _handle_error(context) -> None:
+    started = context.connection.info.get("query_started_at") if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+def _time_connections(engine: Engine, name: str) -> None:
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            metrics.db_pool_checkout_wait.observe(time.perf_counter() - started, pool=name)
+
+    engine.raw_connection = timed_raw_connection
+
+    @event.listens_for(engine, "do_connect")
+    def connect_started(dialect, connection_record, cargs, cparams) -> None:
+        connection_record.info["connect_started_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "connect")
+    def connected(dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("connect_started_at", None)
+        if started is not None:
+            metrics.db_pool_connect_duration.observe(time.perf_counter() - started, pool=name)
+
+    @event.listens_for(engine, "checkout")
+    def checked_out(dbapi_connection, connection_record, connection_proxy) -> None:
+        metrics.db_pool_checkouts.inc(pool=name)
+
+
+def _pool_state(engine: Engine, name: str) -> dict[tuple[str, ...], float]:
+    pool = engine.pool
+    state: dict[tuple[str, ...], float] = {}
+    for reading in ("size", "checkedout", "overflow"):
+        reader = getattr(pool, reading, None)
+        if callable(reader):
+            state[(name, reading)] = reader()
+    return state
+
+
+def instrument_engine(engine: Engine, name: str = "primary") -> Engine:
+    if getattr(engine, "_ponte_instrumented", False):
+        return engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    _time_connections(engine, name)
+    metrics.db_pool_state.track(lambda: _pool_state(engine, name))
+    engine._ponte_instrumented = True
+    return engine
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterator, Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.utils.cache import TTLCache
+
+settings = get_settings()
+
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+
+recent_writes: TTLCache[bool] = TTLCache(
+    max_entries=settings.read_your_writes_max_entries,
+    ttl_seconds=settings.read_your_writes_seconds,
+)
+
+
+@dataclass
+class WriteWindow:
+    requested_until: float = 0.0
+    written_until: float = 0.0
+
+    def active(self) -> bool:
+        return max(self.requested_until, self.written_until) > time.time()
+
+
+write_window: ContextVar[WriteWindow | None] = ContextVar("write_window", default=None)
+
+
+def parse_write_window(value: str | None) -> WriteWindow:
+    window = WriteWindow()
+    try:
+        requested = float(value) if value else 0.0
+    except ValueError:
+        return window
+    if requested <= time.time() + settings.read_your_writes_seconds:
+        window.requested_until = requested
+    return window
+
+
+class RoutingSession(Session):
+    def __init__(self, *args: Any, replicas: Sequence[Engine] = (), **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+        self.read_bind: Engine | None = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs: Any):
+        if self.read_bind is not None and not self._flushing and getattr(clause, "is_select", False):
+            return self.read_bind
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def mark_recent_write(key: Hashable) -> None:
+    if settings.read_your_writes_seconds > 0:
+        recent_writes.set(key, True)
+        window = write_window.get()
+        if window is not None:
+            window.written_until = time.time() + settings.read_your_writes_seconds
+
+
+def in_write_window(key: Hashable) -> bool:
+    window = write_window.get()
+    return bool(recent_writes.get(key)) or (window is not None and window.active())
+
+
+@contextmanager
+def replica_reads(session: Session | AsyncSession, key: Hashable | None = None) -> Iterator[None]:
+    target = session.sync_session if isinstance(session, AsyncSession) else session
+    pinned = key is not None and in_write_window(key)
+    if not isinstance(target, RoutingSession) or not target.replicas or pinned:
+        yield
+        return
+    previous = target.read_bind
+    target.read_bind = random.choice(target.replicas)
+    try:
+        yield
+    finally:
+        target.read_bind = previous
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, Table, event
+
+SEARCH_CONFIG = "ponte_search"
+
+POSTGRES_CONFIG_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    f"""
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{SEARCH_CONFIG}') THEN
+            CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = simple);
+            ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG}
+                ALTER MAPPING FOR asciiword, asciihword, hword_asciipart, word, hword, hword_part
+                WITH unaccent, simple;
+        END IF;
+    END
+    $$
+    """,
+)
+
+POSTGRES_DDL = (
+    *POSTGRES_CONFIG_DDL,
+    f"""
+    ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING gin (search_vector)",
+)
+
+SQLITE_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, owner_id, content='tasks', content_rowid='id', prefix='2 3 4',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description, owner_id)
+        VALUES (new.id, new.title, new.description, new.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description, owner_id ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+        INSERT INTO tasks_fts(rowid, title, description, owner_id)
+        VALUES (new.id, new.title, new.description, new.owner_id);
+    END
+    """,
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+)
+
+SQLITE_DROP_DDL = ("DROP TABLE IF EXISTS tasks_fts",)
+
+
+def install_search_ddl(table: Table) -> None:
+    for statement in POSTGRES_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    for statement in SQLITE_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in SQLITE_DROP_DDL:
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
@@ -1,11 +1,40 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
+from app.db.engine import build_async_engine, build_engine
+from app.db.routing import RoutingSession
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, pool_pre_ping=True, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+engine = build_engine(settings.database_url)
+read_engines = [
+    build_engine(url, name=f"replica_{index}") for index, url in enumerate(settings.database_read_urls)
+]
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    bind=engine,
+    replicas=read_engines,
+    autoflush=False,
+    autocommit=False,
+    future=True,
+)
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    replicas = [
+        build_async_engine(url, name=f"replica_{index}_async").sync_engine
+        for index, url in enumerate(settings.database_read_urls)
+    ]
+    return async_sessionmaker(
+        bind=build_async_engine(settings.database_url),
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+        autoflush=False,
+        expire_on_commit=False,
+    )
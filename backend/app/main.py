@@ -1,24 +1,48 @@
 from __future__ import annotations
 
 import logging
-import time
-import uuid
+import re
+from contextlib import asynccontextmanager
 
 import structlog
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from structlog.contextvars import bind_contextvars
-from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.api.routes import api_router
+from app.api.routes import build_api_router
 from app.core.config import get_settings
+from app.core.events import event_broker
+from app.core.revocation import token_revocations
+from app.core.hashing import password_hasher
+from app.core.metrics import registry
+from app.core.middleware import RequestContextMiddleware
+from app.core.responses import InstrumentedJSONResponse
+from app.core.warmup import warm_up
+from app.db.engine import pool_summary
+from app.db.routing import READ_YOUR_WRITES_HEADER
+from app.db.session import engine, read_engines
 
 settings = get_settings()
 
+ACCESS_TOKEN_PARAMETER = re.compile(r"(access_token=)[^&\s]+")
+
+
+class RedactAccessTokens(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple):
+            record.args = tuple(
+                ACCESS_TOKEN_PARAMETER.sub(r"\1[redacted]", arg) if isinstance(arg, str) else arg
+                for arg in record.args
+            )
+        return True
+
 
 def configure_logging() -> None:
     level = getattr(logging, settings.log_level.upper(), logging.INFO)
     logging.basicConfig(level=level, format="%(message)s")
+    access_logger = logging.getLogger("uvicorn.access")
+    if not any(isinstance(existing, RedactAccessTokens) for existing in access_logger.filters):
+        access_logger.addFilter(RedactAccessTokens())
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -31,59 +55,55 @@ def configure_logging() -> None:
     )
 
 
-def create_app() -> FastAPI:
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    structlog.get_logger("ponte.db").info("database_pool", replicas=len(read_engines), **pool_summary(engine))
+    await event_broker.start()
+    await token_revocations.start()
+    if settings.server_warmup:
+        await warm_up(application)
+    yield
+    await token_revocations.stop()
+    await event_broker.stop()
+    password_hasher.shutdown()
+
+
+def create_app(database_mode: str | None = None) -> FastAPI:
     configure_logging()
-    application = FastAPI(title=settings.project_name, version="1.0.0")
+    application = FastAPI(
+        title=settings.project_name,
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=InstrumentedJSONResponse,
+    )
     application.add_middleware(
         CORSMiddleware,
         allow_origins=settings.backend_cors_origins or ["*"],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[READ_YOUR_WRITES_HEADER],
     )
-    application.add_middleware(SecureHeadersMiddleware)
-
-    logger = structlog.get_logger("ponte.api")
-
-    @application.middleware("http")
-    async def log_requests(request: Request, call_next):
-        bind_contextvars(path=request.url.path, method=request.method)
-        trace_id = str(uuid.uuid4())
-        start = time.perf_counter()
-        try:
-            response = await call_next(request)
-        except Exception:
-            duration = round((time.perf_counter() - start) * 1000, 2)
-            logger.exception("request_error", trace_id=trace_id, duration_ms=duration)
-            raise
-        duration = round((time.perf_counter() - start) * 1000, 2)
-        logger.info(
-            "request_completed",
-            trace_id=trace_id,
-            status_code=response.status_code,
-            duration_ms=duration,
-        )
-        response.headers["X-Trace-Id"] = trace_id
-        return response
-
-    application.include_router(api_router)
+    application.add_middleware(
+        RequestContextMiddleware,
+        collect_metrics=settings.metrics_enabled,
+        query_debug=settings.query_debug,
+        repeated_query_threshold=settings.query_debug_repeat_threshold,
+    )
+
+    application.include_router(build_api_router(database_mode or settings.database_mode))
 
     @application.get("/health", tags=["health"])
     def health_check():
         return {"status": "ok", "environment": settings.environment}
 
-    return application
+    if settings.metrics_enabled:
 
+        @application.get("/metrics", tags=["health"], include_in_schema=False)
+        def metrics():
+            return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
-class SecureHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        response = await call_next(request)
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["Strict-Transport-Security"] = "max-age=63072000; includeSubDomains"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-        return response
+    return application
 
 
 app = create_app()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.services import task_stats
+
+MAX_REPORTED_ROWS = 50
+
+
+def reconcile(check_only: bool = False) -> int:
+    session: Session = SessionLocal()
+    try:
+        drift = task_stats.reconcile(session, apply=not check_only)
+        session.commit()
+    finally:
+        session.close()
+    users = {user_id for user_id, _, _ in drift}
+    action = "found" if check_only else "repaired"
+    print(f"{action} {len(drift)} drifted stat rows across {len(users)} users")
+    for (user_id, kind, key), (stored, expected) in sorted(drift.items())[:MAX_REPORTED_ROWS]:
+        print(f"user={user_id} kind={kind} key={key or '-'} stored={stored} expected={expected}")
+    return 1 if check_only and drift else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild user_task_stats from tasks and report drift")
+    parser.add_argument("--check", action="store_true", help="report drift without rewriting the table")
+    args = parser.parse_args(argv)
+    return reconcile(check_only=args.check)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.revocation import token_revocations
+from app.db.session import SessionLocal
+from app.models.user import User
+from app.services import auth_service
+from app.utils.timestamps import utcnow
+
+
+def revoke(email: str) -> int:
+    session: Session = SessionLocal()
+    try:
+        user = session.scalar(select(User).where(User.email == email))
+        if user is None:
+            print(f"no user with email {email}")
+            return 1
+        auth_service.revoke_user_tokens(session, user.id)
+        print(f"revoked tokens for user={user.id} token_version={user.token_version}")
+    finally:
+        session.close()
+    return 0
+
+
+def prune() -> int:
+    removed = token_revocations.backend.prune(utcnow())
+    print(f"pruned {removed} expired revocations")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Revoke every access token issued to a user")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--email", help="revoke all tokens for the user with this email")
+    group.add_argument("--prune", action="store_true", help="delete revocations whose tokens have expired")
+    args = parser.parse_args(argv)
+    return prune() if args.prune else revoke(args.email)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
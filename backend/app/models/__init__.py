@@ -1,5 +1,8 @@
+from app.models.rate_limit import RateLimitCounter
 from app.models.task import Task
+from app.models.task_stats import UserTaskStat
+from app.models.token_revocation import TokenRevocation
 from app.models.user import User
 
 
-__all__ = ["User", "Task"]
+__all__ = ["User", "Task", "UserTaskStat", "TokenRevocation", "RateLimitCounter"]
@@ -4,10 +4,11 @@ import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.search import install_search_ddl
 from app.utils.timestamps import utcnow
 
 
@@ -19,6 +20,13 @@ class TaskStatus(str, enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_owner_created_id", "owner_id", "created_at", "id"),
+        Index("ix_tasks_owner_status_created_id", "owner_id", "status", "created_at", "id"),
+        Index("ix_tasks_owner_priority_created_id", "owner_id", "priority", "created_at", "id"),
+        Index("ix_tasks_owner_due_date", "owner_id", "due_date"),
+        Index("ix_tasks_owner_updated_at", "owner_id", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255))
@@ -31,3 +39,6 @@ class Task(Base):
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
 
     owner: Mapped["User"] = relationship("User", back_populates="tasks")
+
+
+install_search_ddl(Task.__table__)
@@ -1,12 +1,48 @@
-from app.schemas.auth import AuthRequest, AuthResponse
-from app.schemas.task import DashboardSummary, TaskCreate, TaskRead, TaskUpdate
+from app.schemas.auth import AuthRequest, AuthResponse, Principal
+from app.schemas.task import (
+    BulkItemError,
+    DashboardSummary,
+    ImportRowError,
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkResult,
+    TaskBulkUpdate,
+    TaskBulkUpdateItem,
+    TaskChangeEvent,
+    TaskCreate,
+    TaskFilters,
+    TaskImportSummary,
+    TaskPage,
+    TaskProjection,
+    TaskRead,
+    TaskSearchHit,
+    TaskSearchPage,
+    TaskSummary,
+    TaskUpdate,
+)
 from app.schemas.user import UserCreate, UserRead
 
 __all__ = [
     "AuthRequest",
     "AuthResponse",
+    "Principal",
+    "BulkItemError",
+    "TaskBulkCreate",
+    "TaskBulkDelete",
+    "TaskBulkResult",
+    "TaskBulkUpdate",
+    "TaskBulkUpdateItem",
+    "TaskChangeEvent",
     "TaskCreate",
+    "TaskFilters",
+    "TaskImportSummary",
+    "ImportRowError",
+    "TaskPage",
+    "TaskProjection",
     "TaskRead",
+    "TaskSearchHit",
+    "TaskSearchPage",
+    "TaskSummary",
     "TaskUpdate",
     "UserCreate",
     "UserRead",
@@ -10,8 +10,22 @@ class AuthRequest(BaseModel):
     password: str = Field(min_length=8)
 
 
+class Principal(BaseModel):
+    id: int
+    email: str
+    is_active: bool
+    token_version: int = 0
+
+    model_config = {"from_attributes": True, "frozen": True}
+
+
 class AuthResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
     expires_in: int
     user: UserRead
+
+
+class StreamTokenResponse(BaseModel):
+    stream_token: str
+    expires_in: int
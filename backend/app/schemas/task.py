@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -37,6 +37,96 @@ class TaskRead(TaskBase):
     model_config = {"from_attributes": True}
 
 
+class TaskProjection(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[str] = None
+    due_date: Optional[datetime] = None
+    owner_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class TaskSummary(BaseModel):
+    id: int
+    title: str
+    status: TaskStatus
+    priority: str
+    due_date: Optional[datetime] = None
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class TaskBulkCreate(BaseModel):
+    items: list[TaskCreate] = Field(min_length=1, max_length=5000)
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+
+class TaskBulkUpdate(BaseModel):
+    items: list[TaskBulkUpdateItem] = Field(min_length=1, max_length=5000)
+
+
+class TaskBulkDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=5000)
+
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[int] = None
+    detail: str
+
+
+class TaskBulkResult(BaseModel):
+    items: list[TaskRead] = Field(default_factory=list)
+    deleted_ids: list[int] = Field(default_factory=list)
+    errors: list[BulkItemError] = Field(default_factory=list)
+
+
+class ImportRowError(BaseModel):
+    line: int
+    detail: str
+
+
+class TaskImportSummary(BaseModel):
+    imported: int
+    rejected: int
+    errors: list[ImportRowError] = Field(default_factory=list)
+
+
+class TaskFilters(BaseModel):
+    status: Optional[TaskStatus] = None
+    priority: Optional[str] = Field(default=None, max_length=50)
+    due_after: Optional[datetime] = None
+    due_before: Optional[datetime] = None
+
+
+class TaskPage(BaseModel):
+    items: list[TaskRead]
+    next_cursor: Optional[str] = None
+
+
+class TaskSearchHit(TaskRead):
+    rank: float
+    snippet: Optional[str] = None
+
+
+class TaskSearchPage(BaseModel):
+    items: list[TaskSearchHit]
+    next_offset: Optional[int] = None
+
+
+class TaskChangeEvent(BaseModel):
+    type: Literal["task.created", "task.updated", "task.deleted", "task.imported"]
+    tasks: list[TaskRead] = Field(default_factory=list)
+    deleted_ids: list[int] = Field(default_factory=list)
+
+
 class DashboardSummary(BaseModel):
     total_tasks: int
     completed_tasks: int
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterator
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.security import get_password_hash
+from app.db.session import SessionLocal
+from app.models.user import User
+from app.seeds.seed_data import SEED_DOMAIN, SEED_PASSWORD, insert_tasks, insert_users, task_rows
+from app.services import task_stats
+
+Chunk = list[tuple[int, int]]
+
+
+def generate_chunk(chunk: Chunk, tasks_per_user: int, now: datetime) -> list[dict]:
+    rows: list[dict] = []
+    for user_id, seed in chunk:
+        rows.extend(task_rows(user_id, tasks_per_user, seed, now))
+    return rows
+
+
+def chunks(user_ids: list[int], first_seed: int, users_per_chunk: int) -> Iterator[Chunk]:
+    for offset in range(0, len(user_ids), users_per_chunk):
+        batch = user_ids[offset : offset + users_per_chunk]
+        yield [(user_id, first_seed + offset + index) for index, user_id in enumerate(batch)]
+
+
+def generated_batches(work: Iterator[Chunk], tasks_per_user: int, workers: int) -> Iterator[list[dict]]:
+    now = datetime.now(timezone.utc)
+    if workers <= 1:
+        for chunk in work:
+            yield generate_chunk(chunk, tasks_per_user, now)
+        return
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending: deque[Future] = deque()
+        for chunk in work:
+            pending.append(executor.submit(generate_chunk, chunk, tasks_per_user, now))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class Progress:
+    def __init__(self, total: int, interval_seconds: float = 1.0) -> None:
+        self.total = total
+        self.interval_seconds = interval_seconds
+        self.done = 0
+        self.started = time.perf_counter()
+        self._last_report = 0.0
+
+    def advance(self, count: int) -> None:
+        self.done += count
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval_seconds or self.done >= self.total:
+            self._last_report = now
+            rate = self.done / max(now - self.started, 1e-9)
+            percent = self.done / self.total if self.total else 1.0
+            print(f"tasks {self.done:,}/{self.total:,} ({percent:.0%}, {rate:,.0f}/s)", flush=True)
+
+
+def record_stats(session: Session, rows: list[dict]) -> None:
+    for owner_id, owned in groupby(rows, key=itemgetter("owner_id")):
+        task_stats.record(session, owner_id, added=owned)
+
+
+def bulk_seed(
+    session: Session,
+    users: int,
+    tasks_per_user: int,
+    seed_value: int = 42,
+    batch_size: int = 5_000,
+    workers: int = 1,
+    password_hash: str | None = None,
+    progress: Progress | None = None,
+) -> list[int]:
+    start = session.scalar(select(func.count(User.id)).where(User.email.endswith(SEED_DOMAIN)))
+    hashed_password = password_hash or get_password_hash(SEED_PASSWORD)
+    user_ids = insert_users(session, start, users, hashed_password, batch_size)
+    session.commit()
+    users_per_chunk = max(1, batch_size // max(tasks_per_user, 1))
+    work = chunks(user_ids, seed_value + start, users_per_chunk)
+    for rows in generated_batches(work, tasks_per_user, workers):
+        insert_tasks(session, rows)
+        record_stats(session, rows)
+        session.commit()
+        if progress is not None:
+            progress.advance(len(rows))
+    return user_ids
+
+
+def seed(
+    users: int,
+    tasks_per_user: int,
+    workers: int,
+    seed_value: int,
+    batch_size: int,
+    password_hash: str | None,
+) -> int:
+    session: Session = SessionLocal()
+    try:
+        started = time.perf_counter()
+        progress = Progress(users * tasks_per_user)
+        user_ids = bulk_seed(
+            session, users, tasks_per_user, seed_value, batch_size, workers, password_hash, progress
+        )
+        elapsed = time.perf_counter() - started
+        print(f"seeded {len(user_ids):,} users and {progress.done:,} tasks in {elapsed:.1f}s", flush=True)
+    finally:
+        session.close()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.seeds", description="Generate a large synthetic dataset")
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--tasks-per-user", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="Faker processes")
+    parser.add_argument("--seed", type=int, default=42, help="base seed; the same value regenerates the same data")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="rows per insert or COPY batch")
+    parser.add_argument("--password-hash", help=f"bcrypt hash shared by every user (default: {SEED_PASSWORD})")
+    args = parser.parse_args(argv)
+    return seed(args.users, args.tasks_per_user, args.workers, args.seed, args.batch_size, args.password_hash)
@@ -1,17 +1,106 @@
 from __future__ import annotations
 
+import random
 from datetime import datetime, timedelta, timezone
 
 from faker import Faker
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.auth import Principal
 from app.schemas.task import TaskCreate, TaskStatus
 from app.schemas.user import UserCreate
 from app.services import task_service, user_service
 
 fake = Faker()
 
+SEED_PASSWORD = "PonteTech123"
+SEED_DOMAIN = "@seed.pontetech.com"
+SEED_PRIORITIES = ("low", "medium", "high", "critical")
+SEED_STATUSES = tuple(status.value for status in TaskStatus)
+TASK_COLUMNS = (
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "created_at",
+    "updated_at",
+    "owner_id",
+)
+
+
+def seed_email(index: int) -> str:
+    return f"crew{index}{SEED_DOMAIN}"
+
+
+def user_rows(start: int, count: int, hashed_password: str) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "email": seed_email(index),
+            "full_name": f"Crew Member {index}",
+            "hashed_password": hashed_password,
+            "is_active": True,
+            "token_version": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(start, start + count)
+    ]
+
+
+def task_rows(owner_id: int, count: int, seed: int, now: datetime | None = None) -> list[dict]:
+    fake.seed_instance(seed)
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    rows = []
+    for index in range(count):
+        created_at = now - timedelta(minutes=rng.randint(0, 60 * 24 * 180))
+        due_date = now + timedelta(hours=rng.randint(-24 * 14, 24 * 60)) if rng.random() < 0.7 else None
+        rows.append(
+            {
+                "title": fake.sentence(nb_words=rng.randint(3, 8))[:255],
+                "description": fake.paragraph(nb_sentences=2) if rng.random() < 0.8 else None,
+                "status": rng.choice(SEED_STATUSES),
+                "priority": rng.choice(SEED_PRIORITIES),
+                "due_date": due_date,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "owner_id": owner_id,
+            }
+        )
+    return rows
+
+
+def insert_users(
+    session: Session,
+    start: int,
+    count: int,
+    hashed_password: str,
+    batch_size: int,
+) -> list[int]:
+    statement = insert(User).returning(User.id, sort_by_parameter_order=True)
+    user_ids: list[int] = []
+    for offset in range(start, start + count, batch_size):
+        rows = user_rows(offset, min(batch_size, start + count - offset), hashed_password)
+        user_ids.extend(session.scalars(statement, rows))
+    return user_ids
+
+
+def insert_tasks(session: Session, rows: list[dict]) -> None:
+    if session.get_bind().dialect.name != "postgresql":
+        session.execute(insert(Task.__table__), rows)
+        return
+    columns = ", ".join(TASK_COLUMNS)
+    cursor = session.connection().connection.driver_connection.cursor()
+    with cursor, cursor.copy(f"COPY tasks ({columns}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(tuple(row[column] for column in TASK_COLUMNS))
+
 
 def seed() -> None:
     session: Session = SessionLocal()
@@ -30,12 +119,13 @@ def seed() -> None:
             session.commit()
             session.refresh(user)
 
-        existing_tasks = task_service.list_tasks(session, user)
+        principal = Principal.model_validate(user)
+        existing_tasks = task_service.list_tasks(session, principal)
         if not existing_tasks:
             for index in range(5):
                 task_service.create_task(
                     session,
-                    user,
+                    principal,
                     TaskCreate(
                         title=f"Initiative {index + 1}",
                         description=fake.paragraph(nb_sentences=3),
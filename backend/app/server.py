@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import signal
+import socket
+import sys
+import time
+from multiprocessing.connection import wait
+from multiprocessing.context import SpawnProcess
+from pathlib import Path
+from typing import Any
+
+import structlog
+import uvicorn
+from uvicorn._subprocess import get_subprocess
+
+from app.core.config import Settings, get_settings
+
+APP = "app.main:app"
+STARTUP_GRACE_SECONDS = 10.0
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+logger = structlog.get_logger("ponte.server")
+
+
+def cgroup_cpu_limit(path: Path | None = None) -> float | None:
+    try:
+        quota, period = (path or CGROUP_CPU_MAX).read_text().split()[:2]
+    except (OSError, ValueError):
+        return None
+    if quota == "max":
+        return None
+    return int(quota) / int(period)
+
+
+def available_cpus() -> int:
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        count = min(count, max(1, math.ceil(limit)))
+    return count
+
+
+def worker_count(settings: Settings) -> int:
+    return settings.server_workers or available_cpus()
+
+
+def per_worker_backends(settings: Settings) -> list[str]:
+    backends = {"EVENTS_BACKEND": settings.events_backend, "RATE_LIMIT_BACKEND": settings.rate_limit_backend}
+    return [name for name, backend in backends.items() if backend == "memory"]
+
+
+def worker_environment(settings: Settings, workers: int) -> dict[str, str]:
+    if workers > 1 and settings.events_backend == "memory":
+        return {"SUMMARY_CACHE_TTL_SECONDS": "0"}
+    return {}
+
+
+def build_config(settings: Settings, **overrides: Any) -> uvicorn.Config:
+    options: dict[str, Any] = {
+        "host": settings.server_host,
+        "port": settings.server_port,
+        "loop": settings.server_loop,
+        "http": settings.server_http,
+        "backlog": settings.server_backlog,
+        "timeout_keep_alive": settings.server_keepalive_seconds,
+        "timeout_graceful_shutdown": settings.server_graceful_shutdown_seconds,
+        "limit_concurrency": settings.server_limit_concurrency,
+        "limit_max_requests": settings.server_max_requests,
+        "proxy_headers": settings.server_proxy_headers,
+        "forwarded_allow_ips": settings.server_forwarded_allow_ips,
+        "lifespan": "on",
+        "log_level": settings.log_level.lower(),
+    }
+    options.update(overrides)
+    return uvicorn.Config(APP, **options)
+
+
+def max_requests_for_worker(settings: Settings, rng: random.Random | None = None) -> int | None:
+    if not settings.server_max_requests:
+        return None
+    jitter = (rng or random.Random()).randint(0, settings.server_max_requests_jitter)
+    return settings.server_max_requests + jitter
+
+
+class Supervisor:
+    def __init__(self, settings: Settings, workers: int) -> None:
+        self.settings = settings
+        self.workers = workers
+        self.config = build_config(settings)
+        self.processes: list[SpawnProcess] = []
+        self.started_at: dict[int, float] = {}
+        self.socket: socket.socket | None = None
+        self.should_exit = False
+        self.failed = False
+
+    def spawn(self) -> SpawnProcess:
+        config = build_config(self.settings, limit_max_requests=max_requests_for_worker(self.settings))
+        server = uvicorn.Server(config)
+        process = get_subprocess(config=config, target=server.run, sockets=[self.socket])
+        process.start()
+        self.started_at[process.pid] = time.monotonic()
+        return process
+
+    def replace(self, index: int) -> None:
+        process = self.processes[index]
+        uptime = time.monotonic() - self.started_at.pop(process.pid, 0.0)
+        if process.exitcode != 0 and uptime < STARTUP_GRACE_SECONDS:
+            logger.error("worker_failed_to_start", pid=process.pid, exitcode=process.exitcode)
+            self.failed = self.should_exit = True
+            return
+        logger.info("worker_recycled", pid=process.pid, exitcode=process.exitcode, uptime=round(uptime))
+        self.processes[index] = self.spawn()
+
+    def handle_exit(self, signum: int, frame: Any) -> None:
+        self.should_exit = True
+
+    def run(self) -> int:
+        self.socket = self.config.bind_socket()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self.handle_exit)
+        logger.info(
+            "server_starting",
+            workers=self.workers,
+            host=self.settings.server_host,
+            port=self.settings.server_port,
+        )
+        isolated = per_worker_backends(self.settings)
+        if self.workers > 1 and isolated:
+            logger.warning(
+                "per_worker_state",
+                workers=self.workers,
+                settings=isolated,
+                detail="memory backends are not shared: events and rate limits only see their own worker",
+            )
+        environment = worker_environment(self.settings, self.workers)
+        if environment:
+            logger.warning("summary_cache_disabled", workers=self.workers, reason="EVENTS_BACKEND=memory")
+            os.environ.update(environment)
+        self.processes = [self.spawn() for _ in range(self.workers)]
+        while not self.should_exit:
+            wait([process.sentinel for process in self.processes], timeout=0.5)
+            for index, process in enumerate(self.processes):
+                if not process.is_alive() and not self.should_exit:
+                    self.replace(index)
+        self.shutdown()
+        return 1 if self.failed else 0
+
+    def shutdown(self) -> None:
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + self.settings.server_graceful_shutdown_seconds + 5
+        for process in self.processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+        if self.socket is not None:
+            self.socket.close()
+
+
+def main() -> int:
+    settings = get_settings()
+    return Supervisor(settings, worker_count(settings)).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,21 @@
-from app.services import auth_service, task_service, user_service
+from app.services import (
+    async_auth_service,
+    async_task_service,
+    async_user_service,
+    auth_service,
+    export_service,
+    import_service,
+    task_service,
+    user_service,
+)
 
-__all__ = ["auth_service", "task_service", "user_service"]
+__all__ = [
+    "auth_service",
+    "export_service",
+    "import_service",
+    "task_service",
+    "user_service",
+    "async_auth_service",
+    "async_task_service",
+    "async_user_service",
+]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.core.principals import principal_claims
+from app.core.rate_limit import LOGIN_PER_EMAIL, rate_limiter
+from app.core.revocation import token_revocations
+from app.core.security import create_access_token
+from app.models.user import User
+from app.schemas.auth import AuthRequest, AuthResponse
+from app.schemas.user import UserCreate, UserRead
+from app.services import async_user_service, auth_service
+
+settings = get_settings()
+
+
+async def register_user(session: AsyncSession, user_in: UserCreate) -> UserRead:
+    await async_user_service.ensure_unique_email(session, user_in.email)
+    user = await async_user_service.create_user(session, user_in)
+    await session.commit()
+    await session.refresh(user)
+    return UserRead.model_validate(user)
+
+
+async def login(session: AsyncSession, credentials: AuthRequest) -> AuthResponse:
+    email = credentials.email.lower()
+    await run_in_threadpool(rate_limiter.consume, LOGIN_PER_EMAIL, email)
+    user = await async_user_service.authenticate_user(session, credentials.email, credentials.password)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    access_token = create_access_token(
+        subject=user.id,
+        extra_claims=principal_claims(user),
+    )
+    await run_in_threadpool(rate_limiter.reset, LOGIN_PER_EMAIL, email)
+    async_user_service.touch_last_login(session, user)
+    await session.commit()
+    await session.refresh(user)
+    return AuthResponse(
+        access_token=access_token,
+        expires_in=settings.access_token_expire_minutes * 60,
+        user=UserRead.model_validate(user),
+    )
+
+
+async def logout(payload: Dict[str, Any]) -> None:
+    await run_in_threadpool(auth_service.logout, payload)
+
+
+async def revoke_user_tokens(session: AsyncSession, user_id: int) -> None:
+    user = await session.get(User, user_id, with_for_update=True, populate_existing=True)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    user.token_version += 1
+    await session.commit()
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
+    await run_in_threadpool(token_revocations.revoke_user, user.id, user.token_version, expires_at)
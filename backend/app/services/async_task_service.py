@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.routing import replica_reads
+from app.models.task import Task
+from app.schemas.auth import Principal
+from app.schemas.task import (
+    DashboardSummary,
+    TaskChangeEvent,
+    TaskCreate,
+    TaskFilters,
+    TaskPage,
+    TaskRead,
+    TaskSearchPage,
+    TaskUpdate,
+)
+from app.services import task_queries, task_search, task_stats
+from app.services.task_events import summary_cache, tasks_changed
+from app.utils.etags import parse_task_etag
+
+settings = get_settings()
+
+
+async def list_tasks(session: AsyncSession, user: Principal, filters: TaskFilters | None = None) -> list[TaskRead]:
+    with replica_reads(session, user.id):
+        tasks = (await session.scalars(task_queries.list_statement(user.id, filters))).all()
+    return [TaskRead.model_validate(task) for task in tasks]
+
+
+async def list_task_payloads(
+    session: AsyncSession,
+    user: Principal,
+    filters: TaskFilters | None = None,
+    fields: Sequence[str] = task_queries.TASK_FIELDS,
+) -> list[dict[str, Any]]:
+    with replica_reads(session, user.id):
+        rows = (await session.execute(task_queries.list_rows_statement(user.id, filters, fields))).all()
+    return task_queries.task_payloads(rows, fields)
+
+
+async def list_tasks_page(
+    session: AsyncSession,
+    user: Principal,
+    limit: int,
+    cursor: str | None = None,
+    filters: TaskFilters | None = None,
+) -> TaskPage:
+    with replica_reads(session, user.id):
+        tasks = (await session.scalars(task_queries.page_statement(user.id, limit, cursor, filters))).all()
+    return task_queries.build_page(tasks, limit)
+
+
+async def search_tasks(
+    session: AsyncSession,
+    user: Principal,
+    query: str,
+    limit: int,
+    offset: int = 0,
+) -> TaskSearchPage:
+    terms = task_search.search_terms(query)
+    if not terms:
+        return TaskSearchPage(items=[])
+    with replica_reads(session, user.id):
+        dialect = session.get_bind(clause=select(Task)).dialect.name
+        statement = task_search.search_statement(
+            dialect, user.id, terms, limit, offset, settings.search_candidate_limit
+        )
+        rows = (await session.execute(statement)).all()
+    return task_search.build_search_page(rows, limit, offset, settings.search_candidate_limit)
+
+
+async def create_task(session: AsyncSession, user: Principal, task_in: TaskCreate) -> TaskRead:
+    task = task_queries.new_task(user.id, task_in)
+    session.add(task)
+    await task_stats.record_async(session, user.id, added=[task])
+    await session.commit()
+    await session.refresh(task)
+    result = TaskRead.model_validate(task)
+    tasks_changed(user.id, TaskChangeEvent(type="task.created", tasks=[result]))
+    return result
+
+
+async def _get_user_task(session: AsyncSession, user: Principal, task_id: int, for_update: bool = False) -> Task:
+    if for_update:
+        task = await session.get(Task, task_id, with_for_update=True, populate_existing=True)
+    else:
+        task = await session.get(Task, task_id)
+    if task is None or task.owner_id != user.id:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
+async def get_task(session: AsyncSession, user: Principal, task_id: int) -> TaskRead:
+    return TaskRead.model_validate(await _get_user_task(session, user, task_id))
+
+
+async def task_collection_version(session: AsyncSession, user: Principal) -> str:
+    with replica_reads(session, user.id):
+        count, latest = (await session.execute(task_queries.collection_version_statement(user.id))).one()
+    return f"{count}:{latest.isoformat() if latest else ''}"
+
+
+async def task_version(session: AsyncSession, user: Principal, task_id: int) -> datetime:
+    updated_at = await session.scalar(task_queries.task_version_statement(user.id, task_id))
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return updated_at
+
+
+async def _update_task_if_match(
+    session: AsyncSession,
+    user: Principal,
+    task_id: int,
+    task_in: TaskUpdate,
+    if_match: str,
+) -> TaskRead:
+    expected = parse_task_etag(if_match, task_id)
+    if expected is None:
+        await task_version(session, user, task_id)
+        raise HTTPException(status_code=412, detail="Precondition failed")
+    values = task_queries.update_payload(task_in)
+    previous = []
+    if task_stats.touches_stats(values):
+        statement = task_stats.previous_facts_statement(user.id, [task_id], expected)
+        previous = (await session.execute(statement)).all()
+    statement = task_queries.conditional_update_statement(user.id, task_id, expected, values)
+    task = (await session.scalars(statement)).one_or_none()
+    if task is None:
+        await session.rollback()
+        await task_version(session, user, task_id)
+        raise HTTPException(status_code=412, detail="Precondition failed")
+    if previous:
+        await task_stats.record_async(session, user.id, removed=previous, added=[task])
+    result = TaskRead.model_validate(task)
+    await session.commit()
+    tasks_changed(user.id, TaskChangeEvent(type="task.updated", tasks=[result]))
+    return result
+
+
+async def update_task(
+    session: AsyncSession,
+    user: Principal,
+    task_id: int,
+    task_in: TaskUpdate,
+    if_match: str | None = None,
+) -> TaskRead:
+    if if_match is not None and if_match.strip() != "*":
+        return await _update_task_if_match(session, user, task_id, task_in, if_match)
+    task = await _get_user_task(session, user, task_id, for_update=True)
+    previous = task_stats.facts(task)
+    for field, value in task_queries.update_payload(task_in).items():
+        setattr(task, field, value)
+    session.add(task)
+    await task_stats.record_async(session, user.id, removed=[previous], added=[task])
+    await session.commit()
+    await session.refresh(task)
+    result = TaskRead.model_validate(task)
+    tasks_changed(user.id, TaskChangeEvent(type="task.updated", tasks=[result]))
+    return result
+
+
+async def delete_task(session: AsyncSession, user: Principal, task_id: int) -> None:
+    task = await _get_user_task(session, user, task_id, for_update=True)
+    await session.delete(task)
+    await task_stats.record_async(session, user.id, removed=[task])
+    await session.commit()
+    tasks_changed(user.id, TaskChangeEvent(type="task.deleted", deleted_ids=[task_id]))
+
+
+async def generate_dashboard_summary(session: AsyncSession, user: Principal) -> DashboardSummary:
+    cached = summary_cache.get(user.id)
+    if cached is not None:
+        return cached
+    with replica_reads(session, user.id):
+        row = (await session.execute(task_stats.summary_statement(user.id))).one()
+    summary = task_queries.build_summary(row)
+    summary_cache.set(user.id, summary)
+    return summary
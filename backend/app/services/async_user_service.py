@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import (
+    burn_password_check_async,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+)
+from app.db.routing import mark_recent_write, replica_reads
+from app.models.user import User
+from app.schemas.user import UserCreate
+from app.utils.timestamps import utcnow
+from app.utils.validators import ensure_password_strength
+
+
+async def get_user_by_email(session: AsyncSession, email: str) -> User | None:
+    return await session.scalar(select(User).where(User.email == email.lower()))
+
+
+async def create_user(session: AsyncSession, user_in: UserCreate) -> User:
+    ensure_password_strength(user_in.password)
+    user = User(
+        email=user_in.email.lower(),
+        full_name=user_in.full_name,
+        hashed_password=await get_password_hash_async(user_in.password),
+    )
+    session.add(user)
+    await session.flush()
+    mark_recent_write(("email", user.email))
+    return user
+
+
+async def authenticate_user(session: AsyncSession, email: str, password: str) -> User | None:
+    with replica_reads(session, ("email", email.lower())):
+        user = await get_user_by_email(session, email)
+    if user is None:
+        await burn_password_check_async(password)
+        return None
+    if await verify_password_async(password, user.hashed_password):
+        if password_needs_rehash(user.hashed_password):
+            user.hashed_password = await get_password_hash_async(password)
+            session.add(user)
+        return user
+    return None
+
+
+async def ensure_unique_email(session: AsyncSession, email: str) -> None:
+    if await get_user_by_email(session, email):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
+
+
+def touch_last_login(session: AsyncSession, user: User) -> None:
+    user.last_login = utcnow()
+    session.add(user)
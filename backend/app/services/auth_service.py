@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.principals import principal_claims
+from app.core.rate_limit import LOGIN_PER_EMAIL, rate_limiter
+from app.core.revocation import token_revocations
 from app.core.security import create_access_token
+from app.models.user import User
 from app.schemas.auth import AuthRequest, AuthResponse
 from app.schemas.user import UserCreate, UserRead
 from app.services import user_service
@@ -21,13 +28,16 @@ def register_user(session: Session, user_in: UserCreate) -> UserRead:
 
 
 def login(session: Session, credentials: AuthRequest) -> AuthResponse:
+    email = credentials.email.lower()
+    rate_limiter.consume(LOGIN_PER_EMAIL, email)
     user = user_service.authenticate_user(session, credentials.email, credentials.password)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     access_token = create_access_token(
         subject=user.id,
-        extra_claims={"email": user.email},
+        extra_claims=principal_claims(user),
     )
+    rate_limiter.reset(LOGIN_PER_EMAIL, email)
     user_service.touch_last_login(session, user)
     session.commit()
     session.refresh(user)
@@ -36,3 +46,23 @@ def login(session: Session, credentials: AuthRequest) -> AuthResponse:
         expires_in=settings.access_token_expire_minutes * 60,
         user=UserRead.model_validate(user),
     )
+
+
+def token_expiry(payload: Dict[str, Any]) -> datetime:
+    return datetime.fromtimestamp(payload["exp"], timezone.utc)
+
+
+def logout(payload: Dict[str, Any]) -> None:
+    if not payload.get("jti"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Token cannot be revoked")
+    token_revocations.revoke_token(payload["jti"], int(payload["sub"]), token_expiry(payload))
+
+
+def revoke_user_tokens(session: Session, user_id: int) -> None:
+    user = session.get(User, user_id, with_for_update=True, populate_existing=True)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    user.token_version += 1
+    session.commit()
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
+    token_revocations.revoke_user(user.id, user.token_version, expires_at)
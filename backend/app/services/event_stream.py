@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.events import EventBroker
+from app.schemas.auth import Principal
+from app.schemas.task import DashboardSummary
+from app.services import task_service
+
+RETRY_MILLISECONDS = 3_000
+
+SummaryLoader = Callable[[], Awaitable[DashboardSummary]]
+
+
+def format_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def summary_loader(session: Session, user: Principal) -> SummaryLoader:
+    def load() -> DashboardSummary:
+        try:
+            return task_service.generate_dashboard_summary(session, user)
+        finally:
+            session.close()
+
+    async def load_async() -> DashboardSummary:
+        return await run_in_threadpool(load)
+
+    return load_async
+
+
+async def event_stream(
+    broker: EventBroker,
+    user: Principal,
+    load_summary: SummaryLoader,
+    keepalive_seconds: float,
+) -> AsyncIterator[str]:
+    async with broker.subscribe(user.id) as subscription:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        yield format_event("summary", (await load_summary()).model_dump(mode="json"))
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.get(), keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            messages = [message, *subscription.drain()]
+            if subscription.overflowed:
+                subscription.overflowed = False
+                subscription.drain()
+                yield format_event("resync", {"reason": "overflow"})
+            else:
+                for message in messages:
+                    yield format_event(message["type"], message)
+            yield format_event("summary", (await load_summary()).model_dump(mode="json"))
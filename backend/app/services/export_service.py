@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import csv
+import io
+from datetime import datetime
+from typing import Any, Iterator, Literal, Sequence
+
+import orjson
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.schemas.auth import Principal
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.created_at,
+    Task.updated_at,
+    Task.owner_id,
+)
+FIELD_NAMES = [column.key for column in EXPORT_COLUMNS]
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _ndjson_chunk(rows: Sequence[Row]) -> bytes:
+    return b"".join(orjson.dumps(dict(zip(FIELD_NAMES, row)), option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None:
+        return ""
+    return getattr(value, "value", value)
+
+
+def _csv_chunk(rows: Sequence[Row], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(FIELD_NAMES)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def iter_export(
+    session: Session,
+    user: Principal,
+    export_format: ExportFormat,
+    batch_size: int = 1000,
+) -> Iterator[bytes]:
+    statement = (
+        select(*EXPORT_COLUMNS)
+        .where(Task.owner_id == user.id)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .execution_options(yield_per=batch_size)
+    )
+    result = session.execute(statement)
+    if export_format == "csv":
+        yield _csv_chunk([], header=True)
+    for rows in result.partitions():
+        yield _csv_chunk(rows) if export_format == "csv" else _ndjson_chunk(rows)
+
+
+def stream_export(session: Session, user: Principal, export_format: ExportFormat) -> Iterator[bytes]:
+    try:
+        yield from iter_export(session, user, export_format)
+    finally:
+        session.close()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, BinaryIO, Iterator, Literal
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.schemas.auth import Principal
+from app.schemas.task import ImportRowError, TaskChangeEvent, TaskCreate, TaskImportSummary
+from app.services import task_queries, task_stats
+from app.services.task_events import tasks_changed
+from app.utils.timestamps import utcnow
+
+ImportFormat = Literal["ndjson", "csv"]
+
+MAX_REPORTED_ERRORS = 100
+COPY_COLUMNS = ("title", "description", "status", "priority", "due_date", "created_at", "updated_at", "owner_id")
+OPTIONAL_CSV_FIELDS = ("description", "due_date", "status", "priority")
+
+
+def detect_format(filename: str | None) -> ImportFormat:
+    if filename and filename.lower().endswith(".csv"):
+        return "csv"
+    return "ndjson"
+
+
+def _ndjson_records(text: io.TextIOBase) -> Iterator[tuple[int, Any]]:
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError:
+            yield line_number, None
+
+
+def _csv_records(text: io.TextIOBase) -> Iterator[tuple[int, Any]]:
+    reader = csv.DictReader(text)
+    for record in reader:
+        for field in OPTIONAL_CSV_FIELDS:
+            if record.get(field) in ("", None):
+                record.pop(field, None)
+        yield reader.line_num, record
+
+
+def _validation_detail(exc: ValidationError) -> str:
+    error = exc.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def _write_batch(session: Session, user_id: int, rows: list[dict[str, Any]]) -> None:
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        with connection.connection.driver_connection.cursor() as cursor:
+            with cursor.copy(f"COPY tasks ({', '.join(COPY_COLUMNS)}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(
+                        tuple(row[column].value if column == "status" else row[column] for column in COPY_COLUMNS)
+                    )
+    else:
+        connection.execute(insert(Task.__table__), rows)
+    task_stats.record(session, user_id, added=rows)
+    session.commit()
+
+
+def import_tasks(
+    session: Session,
+    user: Principal,
+    stream: BinaryIO,
+    import_format: ImportFormat,
+    batch_size: int,
+) -> TaskImportSummary:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    records = _csv_records(text) if import_format == "csv" else _ndjson_records(text)
+    summary = TaskImportSummary(imported=0, rejected=0)
+    batch: list[dict[str, Any]] = []
+    try:
+        for line_number, record in records:
+            try:
+                if not isinstance(record, dict):
+                    raise ValueError("Row is not a JSON object")
+                task_in = TaskCreate.model_validate(record)
+            except (ValidationError, ValueError) as exc:
+                summary.rejected += 1
+                if len(summary.errors) < MAX_REPORTED_ERRORS:
+                    detail = _validation_detail(exc) if isinstance(exc, ValidationError) else str(exc)
+                    summary.errors.append(ImportRowError(line=line_number, detail=detail))
+                continue
+            now = utcnow()
+            batch.append({**task_queries.task_values(user.id, task_in), "created_at": now, "updated_at": now})
+            if len(batch) >= batch_size:
+                _write_batch(session, user.id, batch)
+                summary.imported += len(batch)
+                batch.clear()
+        if batch:
+            _write_batch(session, user.id, batch)
+            summary.imported += len(batch)
+    except (UnicodeDecodeError, csv.Error) as exc:
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unreadable upload after {summary.imported} imported rows",
+        ) from exc
+    finally:
+        text.detach()
+        if summary.imported:
+            tasks_changed(user.id, TaskChangeEvent(type="task.imported"))
+    return summary
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from app.core.config import get_settings
+from app.core.events import event_broker
+from app.db.routing import mark_recent_write
+from app.schemas.task import DashboardSummary, TaskChangeEvent
+from app.utils.cache import TTLCache
+
+settings = get_settings()
+
+summary_cache: TTLCache[DashboardSummary] = TTLCache(
+    max_entries=settings.summary_cache_max_entries,
+    ttl_seconds=settings.summary_cache_ttl_seconds,
+)
+event_broker.on_dispatch(summary_cache.pop)
+
+
+def tasks_changed(user_id: int, event: TaskChangeEvent | None = None) -> None:
+    summary_cache.pop(user_id)
+    mark_recent_write(user_id)
+    if event is not None:
+        event_broker.publish(user_id, event.model_dump(mode="json"))
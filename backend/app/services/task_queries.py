@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row, Select, Update, func, select, tuple_, update
+
+from app.models.task import Task
+from app.schemas.task import DashboardSummary, TaskCreate, TaskFilters, TaskPage, TaskRead, TaskSummary
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.timestamps import utcnow
+
+
+def normalize_due_date(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def task_values(owner_id: int, task_in: TaskCreate) -> dict[str, Any]:
+    return {
+        "title": task_in.title,
+        "description": task_in.description,
+        "status": task_in.status,
+        "priority": task_in.priority,
+        "due_date": normalize_due_date(task_in.due_date),
+        "owner_id": owner_id,
+    }
+
+
+def new_task(owner_id: int, task_in: TaskCreate) -> Task:
+    return Task(**task_values(owner_id, task_in))
+
+
+def update_payload(task_in: Any) -> dict[str, Any]:
+    payload = task_in.model_dump(exclude_unset=True)
+    if "due_date" in payload:
+        payload["due_date"] = normalize_due_date(payload["due_date"])
+    return payload
+
+
+def apply_filters(statement: Select, filters: TaskFilters | None) -> Select:
+    if filters is None:
+        return statement
+    if filters.status is not None:
+        statement = statement.where(Task.status == filters.status)
+    if filters.priority is not None:
+        statement = statement.where(Task.priority == filters.priority)
+    if filters.due_after is not None:
+        statement = statement.where(Task.due_date >= normalize_due_date(filters.due_after))
+    if filters.due_before is not None:
+        statement = statement.where(Task.due_date <= normalize_due_date(filters.due_before))
+    return statement
+
+
+TASK_FIELDS = tuple(TaskRead.model_fields)
+TASK_SUMMARY_FIELDS = tuple(TaskSummary.model_fields)
+
+
+def list_statement(owner_id: int, filters: TaskFilters | None = None) -> Select:
+    statement = apply_filters(select(Task).where(Task.owner_id == owner_id), filters)
+    return statement.order_by(Task.created_at.desc(), Task.id.desc())
+
+
+def resolve_fields(fields: str | None) -> tuple[str, ...]:
+    if not fields or not fields.strip():
+        return TASK_FIELDS
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in TASK_FIELDS]
+    if unknown:
+        detail = f"Unknown fields: {', '.join(unknown)}"
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
+    return tuple(dict.fromkeys(["id", *requested]))
+
+
+def list_rows_statement(
+    owner_id: int,
+    filters: TaskFilters | None = None,
+    fields: Sequence[str] = TASK_FIELDS,
+) -> Select:
+    columns = [getattr(Task, field) for field in fields]
+    statement = apply_filters(select(*columns).where(Task.owner_id == owner_id), filters)
+    return statement.order_by(Task.created_at.desc(), Task.id.desc())
+
+
+def task_payloads(rows: Sequence[Row], fields: Sequence[str] = TASK_FIELDS) -> list[dict[str, Any]]:
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def page_statement(owner_id: int, limit: int, cursor: str | None, filters: TaskFilters | None) -> Select:
+    statement = select(Task).where(Task.owner_id == owner_id)
+    if cursor:
+        created_at, task_id = decode_cursor(cursor)
+        statement = statement.where(tuple_(Task.created_at, Task.id) < tuple_(created_at, task_id))
+    statement = apply_filters(statement, filters)
+    return statement.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit + 1)
+
+
+def build_page(tasks: Sequence[Task], limit: int) -> TaskPage:
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(tasks[-1].created_at, tasks[-1].id)
+    return TaskPage(items=[TaskRead.model_validate(task) for task in tasks], next_cursor=next_cursor)
+
+
+def collection_version_statement(owner_id: int) -> Select:
+    return select(func.count(Task.id), func.max(Task.updated_at)).where(Task.owner_id == owner_id)
+
+
+def task_version_statement(owner_id: int, task_id: int) -> Select:
+    return select(Task.updated_at).where(Task.id == task_id, Task.owner_id == owner_id)
+
+
+def conditional_update_statement(owner_id: int, task_id: int, expected: datetime, values: dict[str, Any]) -> Update:
+    return (
+        update(Task)
+        .where(Task.id == task_id, Task.owner_id == owner_id, Task.updated_at == expected)
+        .values(**values, updated_at=utcnow())
+        .returning(Task)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def build_summary(row: Row) -> DashboardSummary:
+    total_tasks, completed_tasks, upcoming_tasks, active_projects = (value or 0 for value in row)
+    completion_rate = round((completed_tasks / total_tasks) * 100, 2) if total_tasks else 0.0
+    return DashboardSummary(
+        total_tasks=total_tasks,
+        completed_tasks=completed_tasks,
+        completion_rate=completion_rate,
+        upcoming_tasks=upcoming_tasks,
+        active_projects=active_projects,
+    )
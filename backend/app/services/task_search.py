@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Sequence
+
+from sqlalchemy import (
+    Float,
+    Integer,
+    Row,
+    Select,
+    String,
+    TextClause,
+    column,
+    desc,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+)
+
+from app.db.search import SEARCH_CONFIG
+from app.models.task import Task
+from app.schemas.task import TaskSearchHit, TaskSearchPage
+
+MAX_TERMS = 8
+MIN_PREFIX_LENGTH = 2
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+TASK_COLUMNS = tuple(Task.__table__.c)
+
+
+def search_terms(query: str) -> list[str]:
+    return re.findall(r"\w+", query.lower())[:MAX_TERMS]
+
+
+def _prefixed(terms: list[str]) -> list[tuple[str, bool]]:
+    last = len(terms) - 1
+    return [(term, index == last and len(term) >= MIN_PREFIX_LENGTH) for index, term in enumerate(terms)]
+
+
+def _tsquery(terms: list[str]) -> str:
+    return " & ".join(f"{term}:*" if prefix else term for term, prefix in _prefixed(terms))
+
+
+def _fts5_query(owner_id: int, terms: list[str]) -> str:
+    phrases = " ".join(f'"{term}"*' if prefix else f'"{term}"' for term, prefix in _prefixed(terms))
+    return f"owner_id : {int(owner_id)} AND {{title description}} : ({phrases})"
+
+
+def _block(offset: int, window: int) -> tuple[int, int]:
+    start = offset // window * window
+    return start, offset - start
+
+
+def _postgres_statement(owner_id: int, terms: list[str], limit: int, offset: int, window: int) -> Select:
+    query = func.to_tsquery(SEARCH_CONFIG, _tsquery(terms))
+    vector = literal_column("tasks.search_vector")
+    block_start, block_offset = _block(offset, window)
+    matches = (
+        select(Task.id, func.ts_rank_cd(vector, query).label("rank"))
+        .where(Task.owner_id == owner_id, vector.op("@@")(query))
+        .order_by(Task.id.desc())
+        .offset(block_start)
+        .limit(window + 1)
+        .subquery()
+    )
+    candidates = (
+        select(matches.c.id, matches.c.rank, func.count().over().label("matched"))
+        .order_by(matches.c.id.desc())
+        .limit(window)
+        .subquery()
+    )
+    page = (
+        select(candidates.c.id, candidates.c.rank, candidates.c.matched)
+        .order_by(candidates.c.rank.desc(), candidates.c.id.desc())
+        .limit(limit + 1)
+        .offset(block_offset)
+        .subquery()
+    )
+    headline = func.ts_headline(
+        SEARCH_CONFIG,
+        func.concat_ws(" ", Task.title, Task.description),
+        query,
+        f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords=24, MinWords=8, MaxFragments=2",
+    )
+    return (
+        select(*TASK_COLUMNS, page.c.rank, page.c.matched, headline.label("snippet"))
+        .join_from(page, Task, Task.id == page.c.id)
+        .order_by(page.c.rank.desc(), Task.id.desc())
+    )
+
+
+def _sqlite_statement(owner_id: int, terms: list[str], limit: int, offset: int, window: int) -> TextClause:
+    score = " + ".join(
+        f"(instr(lower(tasks.title), :term_{index}) > 0) * 2"
+        f" + (instr(lower(coalesce(tasks.description, '')), :term_{index}) > 0)"
+        for index in range(len(terms))
+    )
+    block_start, block_offset = _block(offset, window)
+    statement = text(
+        f"""
+        WITH matches AS (
+            SELECT rowid AS id FROM tasks_fts WHERE tasks_fts MATCH :query
+            ORDER BY rowid DESC LIMIT :scan OFFSET :block_start
+        ), candidates AS (
+            SELECT id, count(*) OVER () AS matched FROM matches ORDER BY id DESC LIMIT :window
+        ), page AS MATERIALIZED (
+            SELECT tasks.id AS id, {score} AS score, candidates.matched AS matched
+            FROM candidates JOIN tasks ON tasks.id = candidates.id
+            ORDER BY score DESC, tasks.id DESC
+            LIMIT :limit OFFSET :offset
+        )
+        SELECT {", ".join(f"tasks.{task_column.name}" for task_column in TASK_COLUMNS)},
+            page.score AS rank,
+            page.matched AS matched,
+            snippet(tasks_fts, -1, :start, :stop, '…', 16) AS snippet
+        FROM tasks_fts CROSS JOIN page CROSS JOIN tasks
+        WHERE tasks_fts MATCH :query
+            AND tasks_fts.rowid BETWEEN (SELECT min(id) FROM page) AND (SELECT max(id) FROM page)
+            AND page.id = tasks_fts.rowid
+            AND tasks.id = page.id
+        ORDER BY page.score DESC, tasks.id DESC
+        """
+    ).bindparams(
+        query=_fts5_query(owner_id, terms),
+        scan=window + 1,
+        block_start=block_start,
+        window=window,
+        limit=limit + 1,
+        offset=block_offset,
+        start=HIGHLIGHT_START,
+        stop=HIGHLIGHT_STOP,
+        **{f"term_{index}": term for index, term in enumerate(terms)},
+    )
+    return statement.columns(
+        *TASK_COLUMNS, column("rank", Float), column("matched", Integer), column("snippet", String)
+    )
+
+
+def _fallback_statement(owner_id: int, terms: list[str], limit: int, offset: int, window: int) -> Select:
+    conditions = [or_(Task.title.ilike(f"%{term}%"), Task.description.ilike(f"%{term}%")) for term in terms]
+    block_start, block_offset = _block(offset, window)
+    matches = (
+        select(Task.id)
+        .where(Task.owner_id == owner_id, *conditions)
+        .order_by(Task.id.desc())
+        .offset(block_start)
+        .limit(window + 1)
+        .subquery()
+    )
+    candidates = (
+        select(matches.c.id, func.count().over().label("matched"))
+        .order_by(matches.c.id.desc())
+        .limit(window)
+        .subquery()
+    )
+    return (
+        select(
+            *TASK_COLUMNS,
+            literal_column("0.0", Float).label("rank"),
+            candidates.c.matched,
+            literal_column("NULL", String).label("snippet"),
+        )
+        .join_from(candidates, Task, Task.id == candidates.c.id)
+        .order_by(desc(Task.id))
+        .limit(limit + 1)
+        .offset(block_offset)
+    )
+
+
+def search_statement(
+    dialect: str,
+    owner_id: int,
+    terms: list[str],
+    limit: int,
+    offset: int,
+    window: int,
+) -> Select | TextClause:
+    if dialect == "postgresql":
+        return _postgres_statement(owner_id, terms, limit, offset, window)
+    if dialect == "sqlite":
+        return _sqlite_statement(owner_id, terms, limit, offset, window)
+    return _fallback_statement(owner_id, terms, limit, offset, window)
+
+
+def build_search_page(rows: Sequence[Row[Any]], limit: int, offset: int, window: int) -> TaskSearchPage:
+    items = [TaskSearchHit.model_validate(dict(row._mapping)) for row in rows[:limit]]
+    next_offset = None
+    if len(rows) > limit:
+        next_offset = offset + limit
+    elif rows and rows[0].matched > window:
+        next_offset = _block(offset, window)[0] + window
+    return TaskSearchPage(items=items, next_offset=next_offset)
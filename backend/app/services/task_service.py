@@ -1,101 +1,275 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
+from typing import Any, Sequence
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
-from app.models.task import Task, TaskStatus
-from app.models.user import User
-from app.schemas.task import DashboardSummary, TaskCreate, TaskRead, TaskUpdate
+from app.core.config import get_settings
+from app.db.routing import replica_reads
+from app.models.task import Task
+from app.schemas.auth import Principal
+from app.schemas.task import (
+    BulkItemError,
+    DashboardSummary,
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkResult,
+    TaskBulkUpdate,
+    TaskChangeEvent,
+    TaskCreate,
+    TaskFilters,
+    TaskPage,
+    TaskRead,
+    TaskSearchPage,
+    TaskUpdate,
+)
+from app.services import task_queries, task_search, task_stats
+from app.services.task_events import summary_cache, tasks_changed
+from app.utils.etags import parse_task_etag
+from app.utils.timestamps import utcnow
 
+settings = get_settings()
 
-def _normalize_due_date(value: datetime | None) -> datetime | None:
-    if value is None:
-        return None
-    if value.tzinfo is None:
-        return value.replace(tzinfo=timezone.utc)
-    return value
 
-
-def list_tasks(session: Session, user: User) -> list[TaskRead]:
-    tasks = session.scalars(
-        select(Task).where(Task.owner_id == user.id).order_by(Task.created_at.desc())
-    ).all()
+def list_tasks(session: Session, user: Principal, filters: TaskFilters | None = None) -> list[TaskRead]:
+    with replica_reads(session, user.id):
+        tasks = session.scalars(task_queries.list_statement(user.id, filters)).all()
     return [TaskRead.model_validate(task) for task in tasks]
 
 
-def create_task(session: Session, user: User, task_in: TaskCreate) -> TaskRead:
-    task = Task(
-        title=task_in.title,
-        description=task_in.description,
-        status=task_in.status,
-        priority=task_in.priority,
-        due_date=_normalize_due_date(task_in.due_date),
-        owner_id=user.id,
-    )
+def list_task_payloads(
+    session: Session,
+    user: Principal,
+    filters: TaskFilters | None = None,
+    fields: Sequence[str] = task_queries.TASK_FIELDS,
+) -> list[dict[str, Any]]:
+    with replica_reads(session, user.id):
+        rows = session.execute(task_queries.list_rows_statement(user.id, filters, fields)).all()
+    return task_queries.task_payloads(rows, fields)
+
+
+def list_tasks_page(
+    session: Session,
+    user: Principal,
+    limit: int,
+    cursor: str | None = None,
+    filters: TaskFilters | None = None,
+) -> TaskPage:
+    with replica_reads(session, user.id):
+        tasks = session.scalars(task_queries.page_statement(user.id, limit, cursor, filters)).all()
+    return task_queries.build_page(tasks, limit)
+
+
+def search_tasks(session: Session, user: Principal, query: str, limit: int, offset: int = 0) -> TaskSearchPage:
+    terms = task_search.search_terms(query)
+    if not terms:
+        return TaskSearchPage(items=[])
+    with replica_reads(session, user.id):
+        dialect = session.get_bind(clause=select(Task)).dialect.name
+        statement = task_search.search_statement(
+            dialect, user.id, terms, limit, offset, settings.search_candidate_limit
+        )
+        rows = session.execute(statement).all()
+    return task_search.build_search_page(rows, limit, offset, settings.search_candidate_limit)
+
+
+def create_task(session: Session, user: Principal, task_in: TaskCreate) -> TaskRead:
+    task = task_queries.new_task(user.id, task_in)
     session.add(task)
+    task_stats.record(session, user.id, added=[task])
     session.commit()
     session.refresh(task)
-    return TaskRead.model_validate(task)
+    result = TaskRead.model_validate(task)
+    tasks_changed(user.id, TaskChangeEvent(type="task.created", tasks=[result]))
+    return result
 
 
-def _get_user_task(session: Session, user: User, task_id: int) -> Task:
-    task = session.get(Task, task_id)
+def _get_user_task(session: Session, user: Principal, task_id: int, for_update: bool = False) -> Task:
+    if for_update:
+        task = session.get(Task, task_id, with_for_update=True, populate_existing=True)
+    else:
+        task = session.get(Task, task_id)
     if task is None or task.owner_id != user.id:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 
-def update_task(session: Session, user: User, task_id: int, task_in: TaskUpdate) -> TaskRead:
-    task = _get_user_task(session, user, task_id)
-    payload = task_in.model_dump(exclude_unset=True)
-    if "due_date" in payload:
-        payload["due_date"] = _normalize_due_date(payload["due_date"])
-    for field, value in payload.items():
+def get_task(session: Session, user: Principal, task_id: int) -> TaskRead:
+    return TaskRead.model_validate(_get_user_task(session, user, task_id))
+
+
+def task_collection_version(session: Session, user: Principal) -> str:
+    with replica_reads(session, user.id):
+        count, latest = session.execute(task_queries.collection_version_statement(user.id)).one()
+    return f"{count}:{latest.isoformat() if latest else ''}"
+
+
+def task_version(session: Session, user: Principal, task_id: int) -> datetime:
+    updated_at = session.scalar(task_queries.task_version_statement(user.id, task_id))
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return updated_at
+
+
+def _update_task_if_match(
+    session: Session,
+    user: Principal,
+    task_id: int,
+    task_in: TaskUpdate,
+    if_match: str,
+) -> TaskRead:
+    expected = parse_task_etag(if_match, task_id)
+    if expected is None:
+        task_version(session, user, task_id)
+        raise HTTPException(status_code=412, detail="Precondition failed")
+    values = task_queries.update_payload(task_in)
+    previous = []
+    if task_stats.touches_stats(values):
+        previous = session.execute(task_stats.previous_facts_statement(user.id, [task_id], expected)).all()
+    statement = task_queries.conditional_update_statement(user.id, task_id, expected, values)
+    task = session.scalars(statement).one_or_none()
+    if task is None:
+        session.rollback()
+        task_version(session, user, task_id)
+        raise HTTPException(status_code=412, detail="Precondition failed")
+    if previous:
+        task_stats.record(session, user.id, removed=previous, added=[task])
+    result = TaskRead.model_validate(task)
+    session.commit()
+    tasks_changed(user.id, TaskChangeEvent(type="task.updated", tasks=[result]))
+    return result
+
+
+def update_task(
+    session: Session,
+    user: Principal,
+    task_id: int,
+    task_in: TaskUpdate,
+    if_match: str | None = None,
+) -> TaskRead:
+    if if_match is not None and if_match.strip() != "*":
+        return _update_task_if_match(session, user, task_id, task_in, if_match)
+    task = _get_user_task(session, user, task_id, for_update=True)
+    previous = task_stats.facts(task)
+    for field, value in task_queries.update_payload(task_in).items():
         setattr(task, field, value)
     session.add(task)
+    task_stats.record(session, user.id, removed=[previous], added=[task])
     session.commit()
     session.refresh(task)
-    return TaskRead.model_validate(task)
+    result = TaskRead.model_validate(task)
+    tasks_changed(user.id, TaskChangeEvent(type="task.updated", tasks=[result]))
+    return result
 
 
-def delete_task(session: Session, user: User, task_id: int) -> None:
-    task = _get_user_task(session, user, task_id)
+def delete_task(session: Session, user: Principal, task_id: int) -> None:
+    task = _get_user_task(session, user, task_id, for_update=True)
     session.delete(task)
+    task_stats.record(session, user.id, removed=[task])
     session.commit()
+    tasks_changed(user.id, TaskChangeEvent(type="task.deleted", deleted_ids=[task_id]))
 
 
-def generate_dashboard_summary(session: Session, user: User) -> DashboardSummary:
-    total_tasks = session.scalar(select(func.count(Task.id)).where(Task.owner_id == user.id)) or 0
-    completed_tasks = (
-        session.scalar(
-            select(func.count(Task.id)).where(Task.owner_id == user.id, Task.status == TaskStatus.done)
-        )
-        or 0
-    )
-    completion_rate = round((completed_tasks / total_tasks) * 100, 2) if total_tasks else 0.0
-    upcoming_threshold = datetime.now(timezone.utc) + timedelta(days=3)
-    upcoming_tasks = (
-        session.scalar(
-            select(func.count(Task.id)).where(
-                Task.owner_id == user.id,
-                Task.due_date.is_not(None),
-                Task.due_date <= upcoming_threshold,
-                Task.status != TaskStatus.done,
-            )
+def bulk_create_tasks(session: Session, user: Principal, payload: TaskBulkCreate) -> TaskBulkResult:
+    rows = [task_queries.task_values(user.id, item) for item in payload.items]
+    tasks = session.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows).all()
+    items = [TaskRead.model_validate(task) for task in tasks]
+    task_stats.record(session, user.id, added=tasks)
+    session.commit()
+    tasks_changed(user.id, TaskChangeEvent(type="task.created", tasks=items))
+    return TaskBulkResult(items=items)
+
+
+def _duplicate_errors(ids: list[int]) -> tuple[list[BulkItemError], dict[int, int]]:
+    errors: list[BulkItemError] = []
+    positions: dict[int, int] = {}
+    for index, task_id in enumerate(ids):
+        if task_id in positions:
+            errors.append(BulkItemError(index=index, id=task_id, detail="Duplicate task id"))
+        else:
+            positions[task_id] = index
+    return errors, positions
+
+
+def _missing_errors(positions: dict[int, int], found: set[int]) -> list[BulkItemError]:
+    return [
+        BulkItemError(index=index, id=task_id, detail="Task not found")
+        for task_id, index in positions.items()
+        if task_id not in found
+    ]
+
+
+def bulk_update_tasks(session: Session, user: Principal, payload: TaskBulkUpdate) -> TaskBulkResult:
+    errors, positions = _duplicate_errors([item.id for item in payload.items])
+    groups: dict[tuple[tuple[str, Any], ...], list[int]] = {}
+    for index, item in enumerate(payload.items):
+        if positions[item.id] != index:
+            continue
+        values = task_queries.update_payload(item)
+        values.pop("id", None)
+        groups.setdefault(tuple(sorted(values.items())), []).append(item.id)
+
+    previous = []
+    if any(task_stats.touches_stats(dict(values)) for values in groups):
+        previous = session.execute(task_stats.previous_facts_statement(user.id, list(positions))).all()
+
+    updated: set[int] = set()
+    for values, ids in groups.items():
+        statement = (
+            update(Task)
+            .where(Task.id.in_(ids), Task.owner_id == user.id)
+            .values(**dict(values), updated_at=utcnow())
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
         )
-        or 0
+        updated.update(session.scalars(statement))
+
+    items: list[TaskRead] = []
+    if updated:
+        tasks = session.scalars(select(Task).where(Task.id.in_(updated))).all()
+        by_id = {task.id: TaskRead.model_validate(task) for task in tasks}
+        items = [by_id[task_id] for task_id in positions if task_id in by_id]
+        if previous:
+            removed = [row for row in previous if row.id in updated]
+            task_stats.record(session, user.id, removed=removed, added=tasks)
+    session.commit()
+    if updated:
+        tasks_changed(user.id, TaskChangeEvent(type="task.updated", tasks=items))
+    errors.extend(_missing_errors(positions, updated))
+    return TaskBulkResult(items=items, errors=sorted(errors, key=lambda error: error.index))
+
+
+def bulk_delete_tasks(session: Session, user: Principal, payload: TaskBulkDelete) -> TaskBulkResult:
+    errors, positions = _duplicate_errors(payload.ids)
+    statement = (
+        delete(Task)
+        .where(Task.id.in_(list(positions)), Task.owner_id == user.id)
+        .returning(Task.id, Task.status, Task.priority, Task.due_date)
+        .execution_options(synchronize_session=False)
     )
-    active_projects = session.scalar(
-        select(func.count(func.distinct(Task.priority))).where(Task.owner_id == user.id)
-    ) or 0
-
-    return DashboardSummary(
-        total_tasks=total_tasks,
-        completed_tasks=completed_tasks,
-        completion_rate=completion_rate,
-        upcoming_tasks=upcoming_tasks,
-        active_projects=active_projects,
+    rows = session.execute(statement).all()
+    deleted = {row.id for row in rows}
+    task_stats.record(session, user.id, removed=rows)
+    session.commit()
+    deleted_ids = [task_id for task_id in positions if task_id in deleted]
+    if deleted:
+        tasks_changed(user.id, TaskChangeEvent(type="task.deleted", deleted_ids=deleted_ids))
+    errors.extend(_missing_errors(positions, deleted))
+    return TaskBulkResult(
+        deleted_ids=deleted_ids,
+        errors=sorted(errors, key=lambda error: error.index),
     )
+
+
+def generate_dashboard_summary(session: Session, user: Principal) -> DashboardSummary:
+    cached = summary_cache.get(user.id)
+    if cached is not None:
+        return cached
+    with replica_reads(session, user.id):
+        row = session.execute(task_stats.summary_statement(user.id)).one()
+    summary = task_queries.build_summary(row)
+    summary_cache.set(user.id, summary)
+    return summary
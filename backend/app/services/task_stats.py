@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Iterable, Mapping, NamedTuple
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Insert,
+    Select,
+    case,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.task import Task, TaskStatus
+from app.models.task_stats import UserTaskStat
+from app.services.task_queries import normalize_due_date
+
+TOTAL = "total"
+COMPLETED = "completed"
+PRIORITY = "priority"
+DUE = "due"
+UPCOMING_WINDOW = timedelta(days=3)
+STAT_FIELDS = frozenset({"status", "priority", "due_date"})
+
+StatKey = tuple[str, str]
+StatRow = tuple[int, str, str]
+StatsDrift = dict[StatRow, tuple[int, int]]
+
+
+def due_day(value: datetime) -> str:
+    return normalize_due_date(value).astimezone(timezone.utc).date().isoformat()
+
+
+def stat_keys(status: TaskStatus | str, priority: str, due_date: datetime | None) -> list[StatKey]:
+    keys = [(TOTAL, ""), (PRIORITY, priority)]
+    if TaskStatus(status) == TaskStatus.done:
+        keys.append((COMPLETED, ""))
+    elif due_date is not None:
+        keys.append((DUE, due_day(due_date)))
+    return keys
+
+
+class TaskFacts(NamedTuple):
+    status: TaskStatus | str
+    priority: str
+    due_date: datetime | None
+
+
+def facts(task: Any) -> TaskFacts:
+    if isinstance(task, Mapping):
+        return TaskFacts(task["status"], task["priority"], task["due_date"])
+    return TaskFacts(task.status, task.priority, task.due_date)
+
+
+def touches_stats(values: Iterable[str]) -> bool:
+    return not STAT_FIELDS.isdisjoint(values)
+
+
+def stats_delta(removed: Iterable[Any] = (), added: Iterable[Any] = ()) -> Counter[StatKey]:
+    delta: Counter[StatKey] = Counter()
+    for task in removed:
+        delta.subtract(stat_keys(*facts(task)))
+    for task in added:
+        delta.update(stat_keys(*facts(task)))
+    return delta
+
+
+def upsert_statement(dialect: str, user_id: int, delta: Counter[StatKey]) -> Insert | None:
+    rows = [
+        {"user_id": user_id, "kind": kind, "key": key, "count": count}
+        for (kind, key), count in sorted(delta.items())
+        if count
+    ]
+    if not rows:
+        return None
+    statement = (postgresql.insert if dialect == "postgresql" else sqlite.insert)(UserTaskStat).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[UserTaskStat.user_id, UserTaskStat.kind, UserTaskStat.key],
+        set_={"count": UserTaskStat.count + statement.excluded.count},
+    )
+
+
+def record(session: Session, user_id: int, removed: Iterable[Any] = (), added: Iterable[Any] = ()) -> None:
+    statement = upsert_statement(session.get_bind().dialect.name, user_id, stats_delta(removed, added))
+    if statement is not None:
+        session.execute(statement)
+
+
+async def record_async(
+    session: AsyncSession,
+    user_id: int,
+    removed: Iterable[Any] = (),
+    added: Iterable[Any] = (),
+) -> None:
+    statement = upsert_statement(session.get_bind().dialect.name, user_id, stats_delta(removed, added))
+    if statement is not None:
+        await session.execute(statement)
+
+
+def previous_facts_statement(
+    owner_id: int,
+    task_ids: list[int],
+    updated_at: datetime | None = None,
+) -> Select:
+    statement = (
+        select(Task.id, Task.status, Task.priority, Task.due_date)
+        .where(Task.owner_id == owner_id, Task.id.in_(task_ids))
+        .with_for_update()
+    )
+    if updated_at is not None:
+        statement = statement.where(Task.updated_at == updated_at)
+    return statement
+
+
+def summary_statement(owner_id: int, now: datetime | None = None) -> Select:
+    threshold = (now or datetime.now(timezone.utc)) + UPCOMING_WINDOW
+    boundary = datetime.combine(threshold.date(), time.min, tzinfo=timezone.utc)
+    due_today = (
+        select(func.count(Task.id))
+        .where(
+            Task.owner_id == owner_id,
+            Task.status != TaskStatus.done,
+            Task.due_date >= boundary,
+            Task.due_date <= threshold,
+        )
+        .scalar_subquery()
+    )
+    stat = UserTaskStat
+    return select(
+        func.sum(case((stat.kind == TOTAL, stat.count), else_=0)),
+        func.sum(case((stat.kind == COMPLETED, stat.count), else_=0)),
+        func.sum(case(((stat.kind == DUE) & (stat.key < threshold.date().isoformat()), stat.count), else_=0))
+        + due_today,
+        func.count(case(((stat.kind == PRIORITY) & (stat.count > 0), stat.key))),
+    ).where(stat.user_id == owner_id)
+
+
+def due_day_expression(dialect: str) -> ColumnElement[str]:
+    if dialect == "postgresql":
+        return func.to_char(func.timezone("UTC", Task.due_date), "YYYY-MM-DD")
+    return func.date(Task.due_date)
+
+
+def expected_stats_statement(dialect: str) -> CompoundSelect:
+    count = func.count(Task.id)
+    owner = Task.owner_id
+    day = due_day_expression(dialect)
+    empty = literal_column("''")
+    return union_all(
+        select(owner, literal_column(f"'{TOTAL}'"), empty, count).group_by(owner),
+        select(owner, literal_column(f"'{COMPLETED}'"), empty, count)
+        .where(Task.status == TaskStatus.done)
+        .group_by(owner),
+        select(owner, literal_column(f"'{PRIORITY}'"), Task.priority, count).group_by(owner, Task.priority),
+        select(owner, literal_column(f"'{DUE}'"), day, count)
+        .where(Task.status != TaskStatus.done, Task.due_date.is_not(None))
+        .group_by(owner, day),
+    )
+
+
+def stats_drift(expected: dict[StatRow, int], actual: dict[StatRow, int]) -> StatsDrift:
+    return {
+        key: (actual.get(key, 0), expected.get(key, 0))
+        for key in expected.keys() | actual.keys()
+        if actual.get(key, 0) != expected.get(key, 0)
+    }
+
+
+def reconcile(session: Session, apply: bool = True, batch_size: int = 5_000) -> StatsDrift:
+    dialect = session.get_bind().dialect.name
+    if apply and dialect == "postgresql":
+        session.execute(text("LOCK TABLE user_task_stats IN EXCLUSIVE MODE"))
+    expected = {
+        (user_id, kind, key): count
+        for user_id, kind, key, count in session.execute(expected_stats_statement(dialect))
+    }
+    stat = UserTaskStat
+    stored = session.execute(select(stat.user_id, stat.kind, stat.key, stat.count))
+    actual = {(user_id, kind, key): count for user_id, kind, key, count in stored}
+    drift = stats_drift(expected, actual)
+    if apply:
+        session.execute(delete(UserTaskStat))
+        rows = [
+            {"user_id": user_id, "kind": kind, "key": key, "count": count}
+            for (user_id, kind, key), count in expected.items()
+        ]
+        for start in range(0, len(rows), batch_size):
+            session.execute(insert(UserTaskStat), rows[start : start + batch_size])
+    return drift
@@ -4,7 +4,13 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    burn_password_check,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
+from app.db.routing import mark_recent_write, replica_reads
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.utils.timestamps import utcnow
@@ -24,12 +30,20 @@ def create_user(session: Session, user_in: UserCreate) -> User:
     )
     session.add(user)
     session.flush()
+    mark_recent_write(("email", user.email))
     return user
 
 
 def authenticate_user(session: Session, email: str, password: str) -> User | None:
-    user = get_user_by_email(session, email)
-    if user and verify_password(password, user.hashed_password):
+    with replica_reads(session, ("email", email.lower())):
+        user = get_user_by_email(session, email)
+    if user is None:
+        burn_password_check(password)
+        return None
+    if verify_password(password, user.hashed_password):
+        if password_needs_rehash(user.hashed_password):
+            user.hashed_password = get_password_hash(password)
+            session.add(user)
         return user
     return None
 
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+from fastapi import Request, Response, status
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+CACHE_CONTROL = "private, no-cache"
+
+
+def _micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def make_etag(*parts: object) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def task_etag(task_id: int, updated_at: datetime) -> str:
+    return f'"task-{task_id}-{_micros(updated_at)}"'
+
+
+def parse_task_etag(value: str, task_id: int) -> datetime | None:
+    prefix = f'"task-{task_id}-'
+    value = value.strip()
+    if not (value.startswith(prefix) and value.endswith('"') and value[len(prefix) : -1].isdigit()):
+        return None
+    return EPOCH + timedelta(microseconds=int(value[len(prefix) : -1]))
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
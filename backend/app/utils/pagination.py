@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), task_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, task_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.schemas.auth import Principal
+from app.schemas.task import TaskBulkCreate, TaskBulkDelete, TaskBulkUpdate, TaskCreate, TaskUpdate
+from app.services import task_service
+from benchmarks.common import create_user, print_table, session_factory, sqlite_engine
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def run(count: int) -> list[dict[str, object]]:
+    engine = sqlite_engine(name=f"bulk-{count}.db")
+    SessionLocal = session_factory(engine)
+    items = [TaskCreate(title=f"Imported {index}", priority="medium") for index in range(count)]
+    with SessionLocal() as session:
+        principal = Principal.model_validate(create_user(session))
+
+    results = []
+    with SessionLocal() as session:
+        ids: list[int] = []
+        done = TaskUpdate(status="done")
+        create_ms = _timed(lambda: ids.extend(task_service.create_task(session, principal, item).id for item in items))
+        update_ms = _timed(lambda: [task_service.update_task(session, principal, task_id, done) for task_id in ids])
+        delete_ms = _timed(lambda: [task_service.delete_task(session, principal, task_id) for task_id in ids])
+        results.append({"path": "per-item", "create_ms": create_ms, "update_ms": update_ms, "delete_ms": delete_ms})
+
+    with SessionLocal() as session:
+        bulk_ids: list[int] = []
+        create_payload = TaskBulkCreate(items=items)
+        create_ms = _timed(
+            lambda: bulk_ids.extend(
+                task.id for task in task_service.bulk_create_tasks(session, principal, create_payload).items
+            )
+        )
+        update_payload = TaskBulkUpdate(items=[{"id": task_id, "status": "done"} for task_id in bulk_ids])
+        update_ms = _timed(lambda: task_service.bulk_update_tasks(session, principal, update_payload))
+        delete_ms = _timed(lambda: task_service.bulk_delete_tasks(session, principal, TaskBulkDelete(ids=bulk_ids)))
+        results.append({"path": "bulk", "create_ms": create_ms, "update_ms": update_ms, "delete_ms": delete_ms})
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk task endpoints versus the per-item service path")
+    parser.add_argument("--count", type=int, default=5_000)
+    args = parser.parse_args()
+    print_table(f"{args.count} tasks: per-item vs bulk", run(args.count))
+
+
+if __name__ == "__main__":
+    main()
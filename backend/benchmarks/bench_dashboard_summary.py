@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+
+from app.services import task_events, task_service
+from benchmarks.common import create_user, insert_tasks, measure, print_table, session_factory, sqlite_engine
+
+
+def run(sizes: list[int], repeat: int) -> list[dict[str, object]]:
+    results = []
+    for size in sizes:
+        engine = sqlite_engine(name=f"summary-{size}.db")
+        SessionLocal = session_factory(engine)
+        with SessionLocal() as session:
+            user = create_user(session)
+            insert_tasks(session, user.id, size)
+            assert task_service.generate_dashboard_summary(session, user).total_tasks == size
+
+            def uncached():
+                task_events.summary_cache.pop(user.id)
+                task_service.generate_dashboard_summary(session, user)
+
+            def cached():
+                task_service.generate_dashboard_summary(session, user)
+
+            cold = measure(uncached, repeat=repeat)
+            warm = measure(cached, repeat=repeat * 20)
+            results.append(
+                {
+                    "tasks": size,
+                    "query_p50_ms": cold["p50_ms"],
+                    "query_p99_ms": cold["p99_ms"],
+                    "cached_p50_ms": warm["p50_ms"],
+                    "cached_p99_ms": warm["p99_ms"],
+                }
+            )
+        engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dashboard summary latency by task volume")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    print_table("dashboard summary (single aggregate query vs per-user cache)", run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
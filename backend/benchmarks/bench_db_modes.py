@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.dependencies import get_async_db, get_db
+from app.core.security import create_access_token
+from app.db.engine import async_database_url
+from app.main import create_app
+from app.services import task_events, task_service
+from benchmarks.common import create_user, insert_tasks, percentile, print_table, session_factory, sqlite_engine
+
+ENDPOINTS = ("/tasks/page?limit=50", "/dashboard/summary", "/tasks/?status=done")
+
+
+async def drive(app, path: str, token: str, requests: int, concurrency: int) -> dict[str, object]:
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+
+        async def one() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                samples.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    samples.sort()
+    return {
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+    }
+
+
+def build_apps(database_url: str, sync_factory):
+    async_factory = async_sessionmaker(
+        bind=create_async_engine(async_database_url(database_url)), autoflush=False, expire_on_commit=False
+    )
+
+    def override_get_db():
+        with sync_factory() as db:
+            yield db
+
+    async def override_get_async_db():
+        async with async_factory() as db:
+            yield db
+
+    apps = {}
+    for mode in ("sync", "async"):
+        app = create_app(database_mode=mode)
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        apps[mode] = app
+    return apps
+
+
+async def run(tasks: int, requests: int, concurrency: int) -> list[dict[str, object]]:
+    engine = sqlite_engine(name="modes.db")
+    factory = session_factory(engine)
+    with factory() as session:
+        user = create_user(session)
+        user_id = user.id
+        insert_tasks(session, user_id, tasks)
+        assert task_service.generate_dashboard_summary(session, user).total_tasks == tasks
+        task_events.summary_cache.pop(user_id)
+    token = create_access_token(user_id)
+    apps = build_apps(engine.url.render_as_string(hide_password=False), factory)
+
+    results = []
+    for path in ENDPOINTS:
+        for mode, app in apps.items():
+            stats = await drive(app, path, token, requests, concurrency)
+            results.append({"endpoint": path, "mode": mode, **stats})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare sync (threadpool) and async database modes")
+    parser.add_argument("--tasks", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    rows = asyncio.run(run(args.tasks, args.requests, args.concurrency))
+    print_table(f"sync vs async mode ({args.concurrency} concurrent clients)", rows)
+
+
+if __name__ == "__main__":
+    main()
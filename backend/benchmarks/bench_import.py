@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import time
+
+from app.schemas.auth import Principal
+from app.schemas.task import TaskCreate
+from app.services import import_service, task_service
+from benchmarks.common import create_user, print_table, session_factory, sqlite_engine
+
+
+def ndjson_upload(rows: int) -> io.BytesIO:
+    lines = (
+        json.dumps({"title": f"Imported {index}", "description": "Backlog import", "priority": "medium"})
+        for index in range(rows)
+    )
+    return io.BytesIO("\n".join(lines).encode("utf-8"))
+
+
+def run(rows: int, per_row_sample: int, batch_size: int) -> list[dict[str, object]]:
+    engine = sqlite_engine(name=f"import-{rows}.db")
+    SessionLocal = session_factory(engine)
+    with SessionLocal() as session:
+        principal = Principal.model_validate(create_user(session))
+
+    results = []
+    with SessionLocal() as session:
+        start = time.perf_counter()
+        for index in range(per_row_sample):
+            task_service.create_task(session, principal, TaskCreate(title=f"Per row {index}", priority="medium"))
+        per_row_rate = round(per_row_sample / (time.perf_counter() - start))
+        results.append({"path": "create_task per row", "rows": per_row_sample, "rows_per_s": per_row_rate})
+
+    upload = ndjson_upload(rows)
+    with SessionLocal() as session:
+        start = time.perf_counter()
+        summary = import_service.import_tasks(session, principal, upload, "ndjson", batch_size)
+        import_rate = round(summary.imported / (time.perf_counter() - start))
+        results.append({"path": "import (ndjson)", "rows": summary.imported, "rows_per_s": import_rate})
+    engine.dispose()
+    results.append({"path": "speedup", "rows": "", "rows_per_s": f"{import_rate / per_row_rate:.1f}x"})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming import versus per-row task creation")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--per-row-sample", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    args = parser.parse_args()
+    print_table("task import throughput", run(args.rows, args.per_row_sample, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine, select
+
+from app.core.middleware import RequestContextMiddleware
+from app.core.responses import InstrumentedJSONResponse
+from app.db.instrumentation import instrument_engine
+from app.models.task import Task
+from app.schemas.task import TaskRead
+from benchmarks.common import create_user, insert_tasks, print_table, session_factory, sqlite_engine
+
+
+def build_app(url: str, instrumented: bool) -> FastAPI:
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    if instrumented:
+        instrument_engine(engine, name="bench")
+    sessions = session_factory(engine)
+    response_class = InstrumentedJSONResponse if instrumented else JSONResponse
+    application = FastAPI(default_response_class=response_class)
+    application.add_middleware(RequestContextMiddleware, collect_metrics=instrumented)
+
+    @application.get("/tasks", response_model=list[TaskRead])
+    def list_tasks():
+        with sessions() as session:
+            return session.scalars(select(Task).order_by(Task.id).limit(50)).all()
+
+    return application
+
+
+async def call(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/tasks",
+        "raw_path": b"/tasks",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def send(message):
+        return None
+
+    async def one() -> None:
+        messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+        async def receive():
+            return next(messages, {"type": "http.disconnect"})
+
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await one()
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def run(requests: int, rounds: int) -> list[dict[str, object]]:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    engine = sqlite_engine(name="metrics.db")
+    with session_factory(engine)() as session:
+        user = create_user(session)
+        insert_tasks(session, user.id, 500)
+    apps = {name: build_app(str(engine.url), name == "instrumented") for name in ("plain", "instrumented")}
+    for application in apps.values():
+        await call(application, 200)
+    timings: dict[str, list[float]] = {name: [] for name in apps}
+    for _ in range(rounds):
+        for name, application in apps.items():
+            timings[name].append(await call(application, requests))
+    baseline = min(timings["plain"])
+    results = []
+    for name, samples in timings.items():
+        best = min(samples)
+        results.append(
+            {
+                "stack": name,
+                "us_per_request": round(best, 1),
+                "overhead_pct": round((best - baseline) / baseline * 100, 2),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cost of request, SQL and serialization metrics")
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    print_table("metrics overhead", asyncio.run(run(args.requests, args.rounds)))
+
+
+if __name__ == "__main__":
+    main()
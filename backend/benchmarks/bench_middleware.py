@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+
+import structlog
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.middleware import SECURITY_HEADERS, RequestContextMiddleware
+from benchmarks.common import print_table
+
+
+class LegacySecureHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        for name, value in SECURITY_HEADERS.items():
+            response.headers[name] = value
+        return response
+
+
+def bare_app() -> FastAPI:
+    application = FastAPI()
+
+    @application.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    return application
+
+
+def legacy_app() -> FastAPI:
+    application = bare_app()
+    application.add_middleware(LegacySecureHeadersMiddleware)
+    logger = structlog.get_logger("bench")
+
+    @application.middleware("http")
+    async def log_requests(request: Request, call_next):
+        trace_id = str(uuid.uuid4())
+        start = time.perf_counter()
+        response = await call_next(request)
+        logger.info("request_completed", trace_id=trace_id, duration_ms=time.perf_counter() - start)
+        response.headers["X-Trace-Id"] = trace_id
+        return response
+
+    return application
+
+
+def asgi_app() -> FastAPI:
+    application = bare_app()
+    application.add_middleware(RequestContextMiddleware)
+    return application
+
+
+async def call(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def send(message):
+        return None
+
+    async def one() -> None:
+        messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+        async def receive():
+            return next(messages, {"type": "http.disconnect"})
+
+        await app(dict(scope), receive, send)
+
+    for _ in range(100):
+        await one()
+    start = time.perf_counter()
+    for _ in range(requests):
+        await one()
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def run(requests: int) -> list[dict[str, object]]:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    baseline = await call(bare_app(), requests)
+    results = [{"stack": "no middleware", "us_per_request": round(baseline, 1), "overhead_us": 0.0}]
+    for name, factory in (("BaseHTTPMiddleware x2", legacy_app), ("pure ASGI", asgi_app)):
+        elapsed = await call(factory(), requests)
+        overhead = round(elapsed - baseline, 1)
+        results.append({"stack": name, "us_per_request": round(elapsed, 1), "overhead_us": overhead})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-request overhead of the middleware layer")
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    print_table("middleware overhead", asyncio.run(run(args.requests)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert
+
+from app.core.responses import InstrumentedJSONResponse, json_response
+from app.models.task import Task
+from app.schemas.auth import Principal
+from app.services import task_queries, task_service
+from benchmarks.common import create_user, measure, print_table, session_factory, sqlite_engine, task_rows
+
+
+def seed(session, size: int, description_length: int) -> Principal:
+    user = create_user(session)
+    rng = random.Random(3)
+    words = [word * rng.randint(1, 3) for word in ("lorem", "ipsum", "dolor", "sit", "amet", "ponte", "tech")]
+    for start in range(0, size, 10_000):
+        rows = task_rows(user.id, min(10_000, size - start), seed=start)
+        for row in rows:
+            row["description"] = " ".join(rng.choices(words, k=description_length // 6))[:description_length]
+        session.execute(insert(Task), rows)
+    session.commit()
+    return Principal.model_validate(user)
+
+
+def peak_memory(func: Callable[[], object]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return round(peak / 1024 / 1024, 1)
+
+
+def run(size: int, description_length: int, repeat: int) -> list[dict[str, object]]:
+    engine = sqlite_engine(name="projection.db")
+    sessions = session_factory(engine)
+    with sessions() as session:
+        user = seed(session, size, description_length)
+
+    def orm_entities():
+        with sessions() as session:
+            return InstrumentedJSONResponse(jsonable_encoder(task_service.list_tasks(session, user)))
+
+    def projected(fields: tuple[str, ...]):
+        def build():
+            with sessions() as session:
+                return json_response(task_service.list_task_payloads(session, user, fields=fields))
+
+        return build
+
+    paths = {
+        "orm entities + TaskRead": orm_entities,
+        "rows, all fields": projected(task_queries.TASK_FIELDS),
+        "rows, fields=id,title,status,due_date": projected(task_queries.resolve_fields("title,status,due_date")),
+        "rows, /tasks/board": projected(task_queries.TASK_SUMMARY_FIELDS),
+    }
+    results = []
+    baseline: dict[str, float] = {}
+    for name, build in paths.items():
+        timings = measure(build, repeat=repeat, warmup=1)
+        memory = peak_memory(build)
+        baseline = baseline or {"mean_ms": timings["mean_ms"], "peak_mb": memory}
+        results.append(
+            {
+                "path": name,
+                "mean_ms": round(timings["mean_ms"], 1),
+                "p95_ms": round(timings["p95_ms"], 1),
+                "peak_mb": memory,
+                "body_kb": len(build().body) // 1024,
+                "latency_pct": round(timings["mean_ms"] / baseline["mean_ms"] * 100, 1),
+                "memory_pct": round(memory / baseline["peak_mb"] * 100, 1),
+            }
+        )
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Task listing projections for a single large user")
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--description-length", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print_table(
+        f"task list projections ({args.tasks} tasks, {args.description_length}-char descriptions)",
+        run(args.tasks, args.description_length, args.repeat),
+    )
+
+
+if __name__ == "__main__":
+    main()
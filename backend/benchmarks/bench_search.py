@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+
+from sqlalchemy import insert
+
+from app.models.task import Task
+from app.schemas.auth import Principal
+from app.services import task_service
+from benchmarks.common import create_user, measure, print_table, session_factory, sqlite_engine, task_rows
+
+SYLLABLES = ("ka", "lo", "mi", "ra", "te", "su", "no", "vi", "da", "pe", "go", "ri", "ze", "ba", "lu")
+
+
+class TextGenerator:
+    def __init__(self, vocabulary_size: int = 6_000, seed: int = 7) -> None:
+        self.rng = random.Random(seed)
+        words = {
+            "".join(self.rng.choice(SYLLABLES) for _ in range(self.rng.randint(2, 4))) for _ in range(vocabulary_size)
+        }
+        self.vocabulary = sorted(words, key=lambda word: self.rng.random())
+        self.cumulative = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(self.vocabulary))))
+
+    def words(self, low: int, high: int) -> str:
+        count = self.rng.randint(low, high)
+        return " ".join(self.rng.choices(self.vocabulary, cum_weights=self.cumulative, k=count))
+
+
+def seed(session, size: int, users: int, text: TextGenerator) -> Principal:
+    owners = [create_user(session, email=f"bench{index}@pontetech.com") for index in range(users)]
+    for owner in owners:
+        rows = task_rows(owner.id, size // users, seed=owner.id)
+        for row in rows:
+            row["title"] = text.words(3, 7)
+            row["description"] = text.words(8, 25)
+        session.execute(insert(Task), rows)
+    session.commit()
+    return Principal.model_validate(owners[0])
+
+
+def run(sizes: list[int], users: int, repeat: int) -> list[dict[str, object]]:
+    results = []
+    for size in sizes:
+        text = TextGenerator()
+        vocabulary = text.vocabulary
+        queries = {
+            "most common word": vocabulary[0],
+            "common word": vocabulary[20],
+            "rare word": vocabulary[3_000],
+            "two words": f"{vocabulary[10]} {vocabulary[200]}",
+            "2-char prefix": vocabulary[5][:2],
+            "4-char prefix": vocabulary[50][:4],
+        }
+        engine = sqlite_engine(name=f"search-{size}.db")
+        with session_factory(engine)() as session:
+            user = seed(session, size, users, text)
+            for label, query in queries.items():
+                timings = measure(lambda: task_service.search_tasks(session, user, query, 20), repeat=repeat)
+                hits = len(task_service.search_tasks(session, user, query, 20).items)
+                results.append({"tasks": size, "query": label, "hits": hits, **timings})
+        engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full-text search latency (SQLite FTS5 backend)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    print_table(f"task search ({args.users} users, first 20 hits)", run(args.sizes, args.users, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+
+from app.core.responses import InstrumentedJSONResponse, json_response
+from app.models.task import Task
+from app.schemas.task import TaskRead
+from app.services import task_queries
+from benchmarks.common import create_user, insert_tasks, print_table, session_factory, sqlite_engine
+
+
+def build_apps(sessions) -> dict[str, FastAPI]:
+    def list_statement():
+        return select(Task).order_by(Task.created_at.desc(), Task.id.desc())
+
+    orm_json = FastAPI(default_response_class=JSONResponse)
+
+    @orm_json.get("/tasks", response_model=list[TaskRead])
+    def orm_models():
+        with sessions() as session:
+            return [TaskRead.model_validate(task) for task in session.scalars(list_statement())]
+
+    orm_orjson = FastAPI(default_response_class=InstrumentedJSONResponse)
+    orm_orjson.get("/tasks", response_model=list[TaskRead])(orm_models)
+
+    rows_orjson = FastAPI(default_response_class=InstrumentedJSONResponse)
+
+    @rows_orjson.get("/tasks", response_model=list[TaskRead])
+    def row_payloads():
+        statement = task_queries.list_rows_statement(1)
+        with sessions() as session:
+            return json_response(task_queries.task_payloads(session.execute(statement).all()))
+
+    return {"orm + model + json": orm_json, "orm + model + orjson": orm_orjson, "rows + orjson": rows_orjson}
+
+
+async def call(app: FastAPI) -> tuple[float, int]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/tasks",
+        "raw_path": b"/tasks",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    body = bytearray()
+    messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+    async def receive():
+        return next(messages, {"type": "http.disconnect"})
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    return (time.perf_counter() - start) * 1000, len(body)
+
+
+async def run(sizes: list[int], repeat: int) -> list[dict[str, object]]:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    results = []
+    for size in sizes:
+        engine = sqlite_engine(name=f"serialization-{size}.db")
+        sessions = session_factory(engine)
+        with sessions() as session:
+            insert_tasks(session, create_user(session).id, size)
+        baseline = None
+        for name, application in build_apps(sessions).items():
+            await call(application)
+            samples = sorted([(await call(application))[0] for _ in range(repeat)])
+            best, size_bytes = min(samples), (await call(application))[1]
+            baseline = baseline or best
+            results.append(
+                {
+                    "tasks": size,
+                    "path": name,
+                    "best_ms": round(best, 2),
+                    "p50_ms": round(samples[len(samples) // 2], 2),
+                    "speedup": round(baseline / best, 2),
+                    "bytes": size_bytes,
+                }
+            )
+        engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="GET /tasks/ list serialization paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    print_table("task list serialization (full request, SQLite)", asyncio.run(run(args.sizes, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from app.core.config import Settings
+from app.core.tokens import KeyRing, TokenVerifier
+from benchmarks.common import print_table
+
+
+def settings_for(algorithm: str) -> tuple[Settings, Any]:
+    if algorithm == "HS256":
+        return Settings(secret_key="bench-secret-" * 4), "bench-secret-" * 4
+    key = ec.generate_private_key(ec.SECP256R1()) if algorithm == "ES256" else ed25519.Ed25519PrivateKey.generate()
+    private = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("utf-8")
+    public = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode("utf-8")
+    return Settings(jwt_algorithm=algorithm, jwt_private_key=private), public
+
+
+def throughput(func: Callable[[str], object], tokens: list[str], seconds: float) -> float:
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for token in tokens:
+            func(token)
+        calls += len(tokens)
+    return calls / (time.perf_counter() - start)
+
+
+def run(algorithms: list[str], tokens: int, seconds: float) -> list[dict[str, object]]:
+    results = []
+    for algorithm in algorithms:
+        config, raw_key = settings_for(algorithm)
+        keyring = KeyRing.from_settings(config)
+        verifier = TokenVerifier(keyring, max_entries=tokens)
+        issued = [keyring.sign({"sub": str(index), "exp": int(time.time()) + 3600}) for index in range(tokens)]
+        paths = {
+            "jwt.decode(raw key)": lambda token: jwt.decode(token, raw_key, algorithms=[algorithm]),
+            "keyring (parsed key)": keyring.verify,
+            "verifier (cache hit)": verifier.verify,
+        }
+        baseline = None
+        for name, func in paths.items():
+            rate = throughput(func, issued, seconds)
+            baseline = baseline or rate
+            results.append(
+                {
+                    "algorithm": algorithm,
+                    "path": name,
+                    "verify_per_s": round(rate),
+                    "us_per_verify": round(1_000_000 / rate, 2),
+                    "speedup": round(rate / baseline, 2),
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Access token verification throughput per algorithm")
+    parser.add_argument("--algorithms", nargs="+", default=["HS256", "ES256", "EdDSA"])
+    parser.add_argument("--tokens", type=int, default=1_000)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    print_table("token verification", run(args.algorithms, args.tokens, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import Engine, create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.base import Base
+from app.models.task import Task, TaskStatus
+from app.models.user import User
+from app.services import task_stats
+
+PRIORITIES = ("low", "medium", "high", "critical")
+STATUSES = tuple(TaskStatus)
+
+
+def sqlite_engine(directory: str | None = None, name: str = "bench.db") -> Engine:
+    path = Path(directory or tempfile.mkdtemp(prefix="ponte-bench-")) / name
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def session_factory(engine: Engine) -> sessionmaker[Session]:
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+
+def create_user(session: Session, email: str = "bench@pontetech.com") -> User:
+    user = User(email=email, full_name="Bench User", hashed_password="!")
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+def task_rows(owner_id: int, count: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    rows = []
+    for index in range(count):
+        created_at = now - timedelta(seconds=count - index)
+        rows.append(
+            {
+                "title": f"Task {index}",
+                "description": f"Generated task {index} for benchmarking",
+                "status": rng.choice(STATUSES),
+                "priority": rng.choice(PRIORITIES),
+                "due_date": now + timedelta(hours=rng.randint(-72, 24 * 30)),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "owner_id": owner_id,
+            }
+        )
+    return rows
+
+
+def insert_tasks(session: Session, owner_id: int, count: int, batch_size: int = 10_000) -> None:
+    for start in range(0, count, batch_size):
+        rows = task_rows(owner_id, min(batch_size, count - start), seed=start)
+        session.execute(insert(Task), rows)
+        task_stats.record(session, owner_id, added=rows)
+    session.commit()
+
+
+def measure(func: Callable[[], object], repeat: int = 50, warmup: int = 3) -> dict[str, float]:
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p50_ms": round(percentile(samples, 50), 4),
+        "p95_ms": round(percentile(samples, 95), 4),
+        "p99_ms": round(percentile(samples, 99), 4),
+    }
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, round(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+def print_table(title: str, rows: list[dict[str, object]]) -> None:
+    print(f"\n{title}")
+    if not rows:
+        return
+    headers = list(rows[0])
+    widths = [max(len(str(header)), *(len(str(row[header])) for row in rows)) for header in headers]
+    print("  ".join(str(header).ljust(width) for header, width in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(row[header]).ljust(width) for header, width in zip(headers, widths)))
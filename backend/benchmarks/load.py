@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.dependencies import get_async_db, get_db
+from app.core.principals import principal_claims
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.engine import async_database_url
+from app.main import create_app
+from app.models.user import User
+from app.seeds.bulk import bulk_seed
+from benchmarks.common import percentile, print_table, sqlite_engine
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    method: str
+    path: str
+    body: dict[str, Any] | None = None
+
+
+ENDPOINTS = (
+    Endpoint("list page", "GET", "/tasks/page?limit=50"),
+    Endpoint("list fields", "GET", "/tasks/?fields=id,title,status,due_date"),
+    Endpoint("board", "GET", "/tasks/board"),
+    Endpoint("search", "GET", "/tasks/search?q=project"),
+    Endpoint("dashboard", "GET", "/dashboard/summary"),
+    Endpoint("create", "POST", "/tasks/", {"title": "Load test task", "priority": "high"}),
+)
+
+
+def prepare_database(database_url: str | None, users: int, tasks_per_user: int, seed: bool) -> str:
+    if database_url is None:
+        engine = sqlite_engine(name="load.db")
+    else:
+        engine = create_engine(database_url)
+        Base.metadata.create_all(bind=engine)
+    if seed:
+        with Session(engine) as session:
+            bulk_seed(session, users, tasks_per_user)
+    url = engine.url.render_as_string(hide_password=False)
+    engine.dispose()
+    return url
+
+
+def issue_tokens(sessions: sessionmaker[Session], limit: int) -> list[str]:
+    with sessions() as session:
+        users = session.scalars(select(User).order_by(User.id).limit(limit)).all()
+        return [create_access_token(user.id, extra_claims=principal_claims(user)) for user in users]
+
+
+def build_app(database_url: str, mode: str):
+    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    sync_engine = create_engine(database_url, connect_args=connect_args)
+    sync_factory = sessionmaker(bind=sync_engine, autoflush=False, autocommit=False)
+    async_factory = async_sessionmaker(
+        bind=create_async_engine(async_database_url(database_url)),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    def override_get_db():
+        with sync_factory() as db:
+            yield db
+
+    async def override_get_async_db():
+        async with async_factory() as db:
+            yield db
+
+    application = create_app(database_mode=mode)
+    application.dependency_overrides[get_db] = override_get_db
+    application.dependency_overrides[get_async_db] = override_get_async_db
+    return application, sync_factory
+
+
+async def drive(
+    app,
+    endpoint: Endpoint,
+    tokens: list[str],
+    requests: int,
+    concurrency: int,
+) -> dict[str, object]:
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+    errors = 0
+    headers = itertools.cycle([{"Authorization": f"Bearer {token}"} for token in tokens])
+
+    async with httpx.AsyncClient(app=app, base_url="http://load") as client:
+
+        async def one(request_headers: dict[str, str]) -> None:
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.request(
+                    endpoint.method,
+                    endpoint.path,
+                    headers=request_headers,
+                    json=endpoint.body,
+                )
+                samples.append((time.perf_counter() - start) * 1000)
+                if response.status_code >= 400:
+                    errors += 1
+
+        for _ in range(min(concurrency, requests)):
+            await one(next(headers))
+        samples.clear()
+        errors = 0
+        started = time.perf_counter()
+        await asyncio.gather(*(one(next(headers)) for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    samples.sort()
+    return {
+        "endpoint": endpoint.name,
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+    }
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, object]]:
+    database_url = prepare_database(args.database_url, args.users, args.tasks_per_user, not args.skip_seed)
+    app, sessions = build_app(database_url, args.mode)
+    tokens = issue_tokens(sessions, args.users)
+    selected = [endpoint for endpoint in ENDPOINTS if not args.endpoints or endpoint.name in args.endpoints]
+    return [await drive(app, endpoint, tokens, args.requests, args.concurrency) for endpoint in selected]
+
+
+def compare(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    tolerance: float,
+) -> list[dict[str, object]]:
+    previous = {row["endpoint"]: row for row in baseline}
+    rows = []
+    for row in results:
+        base = previous.get(row["endpoint"])
+        if base is None:
+            continue
+        rps_change = row["rps"] / base["rps"] - 1 if base["rps"] else 0.0
+        p95_change = row["p95_ms"] / base["p95_ms"] - 1 if base["p95_ms"] else 0.0
+        rows.append(
+            {
+                "endpoint": row["endpoint"],
+                "rps": f"{base['rps']} -> {row['rps']}",
+                "rps_change": f"{rps_change:+.1%}",
+                "p95_ms": f"{base['p95_ms']} -> {row['p95_ms']}",
+                "p95_change": f"{p95_change:+.1%}",
+                "regressed": rps_change < -tolerance or p95_change > tolerance or row["errors"] > base["errors"],
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Drive the ASGI app with concurrent clients and record latencies")
+    parser.add_argument("--database-url", help="seed and load this database instead of a temporary SQLite file")
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the data already in --database-url")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--tasks-per-user", type=int, default=500)
+    parser.add_argument("--mode", choices=("sync", "async"), default="sync")
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--endpoints", nargs="+", choices=[endpoint.name for endpoint in ENDPOINTS])
+    parser.add_argument("--output", type=Path, help="write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="compare against a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed fractional rps drop or p95 increase")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args))
+    print_table(f"load test ({args.mode} mode, {args.concurrency} concurrent clients)", results)
+    if args.output:
+        report = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "parameters": {
+                key: value
+                for key, value in vars(args).items()
+                if key not in {"output", "baseline", "database_url"}
+            },
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.baseline:
+        comparison = compare(results, json.loads(args.baseline.read_text())["results"], args.tolerance)
+        print_table(f"compared with {args.baseline} (tolerance {args.tolerance:.0%})", comparison)
+        if any(row["regressed"] for row in comparison):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,39 @@
 from __future__ import annotations
 
 import os
+from contextlib import contextmanager
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+os.environ["BCRYPT_ROUNDS"] = "4"
 
 from app.core.config import get_settings
 
 get_settings.cache_clear()
 
-from app.core.dependencies import get_db
+from app.core.dependencies import get_async_db, get_db
+from app.core.principals import principal_cache
+from app.core.rate_limit import rate_limiter
+from app.core.revocation import MemoryRevocationBackend, token_revocations
 from app.db.base import Base
-from app.main import app
+from app.db.instrumentation import capture_queries, instrument_engine
+from app.db.routing import recent_writes
+from app.db.engine import async_database_url
+from app.main import app, create_app
+from app.services import task_events
 
 engine = create_engine(get_settings().database_url, connect_args={"check_same_thread": False})
+instrument_engine(engine, name="test")
 TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+async_engine = create_async_engine(async_database_url(get_settings().database_url), poolclass=NullPool)
+instrument_engine(async_engine.sync_engine, name="test_async")
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -37,10 +52,21 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 def _clean_tables():
     with engine.begin() as conn:
         for table in reversed(Base.metadata.sorted_tables):
             conn.execute(table.delete())
+    task_events.summary_cache.clear()
+    principal_cache.clear()
+    recent_writes.clear()
+    token_revocations.backend = MemoryRevocationBackend()
+    token_revocations.clear()
+    rate_limiter.backend.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -52,7 +78,29 @@ def clean_db():
 
 app.dependency_overrides[get_db] = override_get_db
 
+async_app = create_app(database_mode="async")
+async_app.dependency_overrides[get_db] = override_get_db
+async_app.dependency_overrides[get_async_db] = override_get_async_db
+
 
 @pytest.fixture
 def client() -> TestClient:
     return TestClient(app)
+
+
+@pytest.fixture
+def async_client() -> TestClient:
+    return TestClient(async_app)
+
+
+@pytest.fixture
+def assert_max_queries():
+    @contextmanager
+    def check(limit: int):
+        with capture_queries() as captured:
+            yield captured
+        assert len(captured) <= limit, f"{len(captured)} queries executed, expected at most {limit}:\n" + "\n".join(
+            captured
+        )
+
+    return check
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from tests.test_tasks import authenticate
+
+
+def test_async_mode_serves_task_lifecycle(async_client: TestClient):
+    headers = authenticate(async_client)
+    create_resp = async_client.post(
+        "/tasks/",
+        json={"title": "Async rollout", "priority": "high", "status": "backlog"},
+        headers=headers,
+    )
+    assert create_resp.status_code == 201
+    task_id = create_resp.json()["id"]
+    update_resp = async_client.put(f"/tasks/{task_id}", json={"status": "done"}, headers=headers)
+    assert update_resp.json()["status"] == "done"
+    page = async_client.get("/tasks/page", params={"limit": 10}, headers=headers).json()
+    assert [task["id"] for task in page["items"]] == [task_id]
+    hits = async_client.get("/tasks/search", params={"q": "rollout"}, headers=headers).json()["items"]
+    assert [hit["id"] for hit in hits] == [task_id]
+    board = async_client.get("/tasks/board", headers=headers).json()
+    assert [(task["id"], "description" in task) for task in board] == [(task_id, False)]
+    summary = async_client.get("/dashboard/summary", headers=headers).json()
+    assert summary["completed_tasks"] == 1
+    assert async_client.delete(f"/tasks/{task_id}", headers=headers).status_code == 204
+    assert async_client.get("/tasks/", headers=headers).json() == []
+
+
+def test_async_routes_are_coroutines(async_client: TestClient):
+    endpoints = {
+        (route.path, method): route.endpoint
+        for route in async_client.app.routes
+        if hasattr(route, "methods")
+        for method in route.methods
+    }
+    assert endpoints[("/tasks/", "GET")].__module__ == "app.api.routes.async_tasks"
+    assert endpoints[("/tasks/board", "GET")].__module__ == "app.api.routes.async_tasks"
+    assert endpoints[("/auth/login", "POST")].__module__ == "app.api.routes.async_auth"
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+
+import bcrypt
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+from app.core.hashing import PasswordHasher, hash_rounds, password_hasher
+from app.core.principals import PENDING_INVALIDATIONS, principal_cache, principal_from_claims
+from app.schemas.auth import Principal
+from app.services import user_service
+from tests.conftest import TestingSessionLocal
+
 
 def _register_payload(email: str = "crew@pontetech.com") -> dict[str, str]:
     return {
@@ -27,3 +38,103 @@ def test_login_returns_token(client: TestClient):
     assert response.status_code == 200
     body = response.json()
     assert "access_token" in body and body["token_type"] == "bearer"
+
+
+def test_login_rehashes_outdated_cost(client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    client.post("/auth/register", json=_register_payload())
+    session = TestingSessionLocal()
+    try:
+        user = user_service.get_user_by_email(session, "crew@pontetech.com")
+        user.hashed_password = bcrypt.hashpw(b"Secure123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+        session.commit()
+    finally:
+        session.close()
+    monkeypatch.setattr(password_hasher, "rounds", 5)
+    response = client.post("/auth/login", json={"email": "crew@pontetech.com", "password": "Secure123"})
+    assert response.status_code == 200
+    session = TestingSessionLocal()
+    try:
+        user = user_service.get_user_by_email(session, "crew@pontetech.com")
+        assert hash_rounds(user.hashed_password) == password_hasher.rounds
+    finally:
+        session.close()
+
+
+def test_hasher_rejects_when_saturated():
+    hasher = PasswordHasher(rounds=4, workers=0, max_pending=0, retry_after_seconds=2)
+    with pytest.raises(HTTPException) as exc_info:
+        hasher.hash("Secure123")
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "2"}
+
+
+def test_hasher_caps_blocking_callers_separately():
+    hasher = PasswordHasher(rounds=4, workers=0, max_pending=4, retry_after_seconds=1, max_blocking=0)
+    with pytest.raises(HTTPException) as exc_info:
+        hasher.hash("Secure123")
+    assert exc_info.value.status_code == 503
+    assert asyncio.run(hasher.hash_async("Secure123")).startswith("$2b$04$")
+
+
+def test_needs_rehash_never_downgrades_cost():
+    hasher = PasswordHasher(rounds=5, workers=0, max_pending=1, retry_after_seconds=1)
+    assert hasher.needs_rehash(PasswordHasher(4, 0, 1, 1).hash("Secure123"))
+    assert not hasher.needs_rehash(PasswordHasher(6, 0, 1, 1).hash("Secure123"))
+    assert hasher.needs_rehash("not-a-bcrypt-hash")
+
+
+def _login_headers(client: TestClient) -> dict[str, str]:
+    client.post("/auth/register", json=_register_payload())
+    response = client.post("/auth/login", json={"email": "crew@pontetech.com", "password": "Secure123"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_principal_cache_invalidated_on_deactivation(client: TestClient):
+    headers = _login_headers(client)
+    assert client.get("/tasks/", headers=headers).status_code == 200
+    session = TestingSessionLocal()
+    try:
+        user = user_service.get_user_by_email(session, "crew@pontetech.com")
+        assert principal_cache.get(user.id) is not None
+        user.is_active = False
+        session.commit()
+        assert principal_cache.get(user.id) is None
+    finally:
+        session.close()
+    assert client.get("/tasks/", headers=headers).status_code == 403
+
+
+def test_rollback_discards_pending_invalidations(client: TestClient):
+    headers = _login_headers(client)
+    assert client.get("/tasks/", headers=headers).status_code == 200
+    session = TestingSessionLocal()
+    try:
+        user = user_service.get_user_by_email(session, "crew@pontetech.com")
+        user.is_active = False
+        session.flush()
+        assert session.info[PENDING_INVALIDATIONS] == {user.id}
+        session.rollback()
+        assert PENDING_INVALIDATIONS not in session.info
+        session.commit()
+        assert principal_cache.get(user.id) is not None
+    finally:
+        session.close()
+
+
+def test_token_version_mismatch_is_rejected(client: TestClient):
+    headers = _login_headers(client)
+    session = TestingSessionLocal()
+    try:
+        user = user_service.get_user_by_email(session, "crew@pontetech.com")
+        user.token_version += 1
+        session.commit()
+    finally:
+        session.close()
+    assert client.get("/tasks/", headers=headers).status_code == 401
+
+
+def test_principal_from_signed_claims():
+    claims = {"sub": "7", "email": "crew@pontetech.com", "act": True, "ver": 2}
+    principal = principal_from_claims(7, claims)
+    assert principal == Principal(id=7, email="crew@pontetech.com", is_active=True, token_version=2)
+    assert principal_from_claims(7, {"sub": "7"}) is None
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import require_stream_user
+from app.core.events import EventBroker, event_broker
+from app.core.security import decode_access_token
+from app.main import RedactAccessTokens
+from app.models.task import Task
+from app.schemas.auth import Principal
+from app.services import task_stats
+from app.services.event_stream import event_stream, summary_loader
+from tests.conftest import TestingSessionLocal
+from tests.test_tasks import authenticate
+
+
+def _parse(chunk: str) -> tuple[str, dict]:
+    lines = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+    return lines["event"], json.loads(lines["data"])
+
+
+def test_broker_fans_out_across_threads_and_flags_overflow():
+    broker = EventBroker(max_pending=2)
+
+    async def scenario():
+        async with broker.subscribe(1) as first, broker.subscribe(1) as second, broker.subscribe(2) as other:
+            assert broker.subscriber_count(1) == 2
+            thread = threading.Thread(target=broker.publish, args=(1, {"type": "task.created"}))
+            thread.start()
+            thread.join()
+            assert await asyncio.wait_for(first.get(), 1) == {"type": "task.created"}
+            assert await asyncio.wait_for(second.get(), 1) == {"type": "task.created"}
+            assert other.drain() == []
+
+            for index in range(3):
+                broker.publish(1, {"type": "task.updated", "index": index})
+            await asyncio.sleep(0)
+            assert first.overflowed and len(first.drain()) == 2
+        assert broker.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+
+def test_event_stream_delivers_mutations_and_summaries(client: TestClient):
+    headers = authenticate(client)
+    login = client.post("/auth/login", json={"email": "pilot@pontetech.com", "password": "Secure123"}).json()
+    user = Principal.model_validate(login["user"])
+
+    async def scenario():
+        stream = event_stream(
+            event_broker,
+            user,
+            summary_loader(TestingSessionLocal(), user),
+            keepalive_seconds=0.05,
+        )
+        assert (await anext(stream)).startswith("retry:")
+        event, summary = _parse(await anext(stream))
+        assert event == "summary" and summary["total_tasks"] == 0
+
+        response = await asyncio.to_thread(
+            client.post, "/tasks/", json={"title": "Stream me", "priority": "high"}, headers=headers
+        )
+        event, payload = _parse(await anext(stream))
+        assert event == "task.created"
+        assert payload["tasks"][0]["id"] == response.json()["id"]
+        event, summary = _parse(await anext(stream))
+        assert event == "summary" and summary["total_tasks"] == 1
+
+        assert await anext(stream) == ": keepalive\n\n"
+        await stream.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_dispatch_from_another_worker_drops_the_cached_summary(client: TestClient):
+    headers = authenticate(client)
+    login = client.post("/auth/login", json={"email": "pilot@pontetech.com", "password": "Secure123"}).json()
+    user_id = login["user"]["id"]
+    assert client.get("/dashboard/summary", headers=headers).json()["total_tasks"] == 0
+
+    with TestingSessionLocal() as session:
+        task = Task(title="Written elsewhere", owner_id=user_id)
+        session.add(task)
+        session.flush()
+        task_stats.record(session, user_id, added=[task])
+        session.commit()
+    assert client.get("/dashboard/summary", headers=headers).json()["total_tasks"] == 0
+
+    event_broker.dispatch(user_id, {"type": "task.created"})
+    assert client.get("/dashboard/summary", headers=headers).json()["total_tasks"] == 1
+
+
+def test_events_endpoint_requires_a_token(client: TestClient):
+    assert client.get("/events").status_code == 401
+    assert client.get("/events", params={"access_token": "invalid"}).status_code == 401
+
+
+def test_stream_tokens_are_short_lived_and_query_only(client: TestClient):
+    headers = authenticate(client)
+    access_token = headers["Authorization"].removeprefix("Bearer ")
+    issued = client.post("/events/token", headers=headers).json()
+    assert issued["expires_in"] == 60
+    payload = decode_access_token(issued["stream_token"])
+    assert payload["scope"] == "stream" and payload["exp"] - payload["iat"] == 60
+
+    session = TestingSessionLocal()
+    try:
+        principal = require_stream_user(None, issued["stream_token"], session)
+        assert principal.email == "pilot@pontetech.com"
+        with pytest.raises(HTTPException) as exc_info:
+            require_stream_user(None, access_token, session)
+        assert exc_info.value.detail == "Invalid token scope"
+    finally:
+        session.close()
+    stream_bearer = {"Authorization": f"Bearer {issued['stream_token']}"}
+    assert client.get("/tasks/", headers=stream_bearer).status_code == 401
+    assert client.post("/events/token").status_code == 401
+
+
+def test_access_log_redacts_query_tokens():
+    args = ("127.0.0.1", "GET", "/events?access_token=abc.def&x=1")
+    record = logging.LogRecord("uvicorn.access", logging.INFO, __file__, 1, '%s - "%s %s"', args, None)
+    assert RedactAccessTokens().filter(record)
+    assert record.getMessage() == '127.0.0.1 - "GET /events?access_token=[redacted]&x=1"'
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import tracemalloc
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.models.user import User
+from app.schemas.auth import Principal
+from app.services import export_service
+from tests.conftest import TestingSessionLocal
+from tests.test_tasks import authenticate
+
+
+def test_export_streams_ndjson_and_csv(client: TestClient):
+    headers = authenticate(client)
+    for title in ("First", "Second"):
+        client.post("/tasks/", json={"title": title, "priority": "high"}, headers=headers)
+
+    ndjson_resp = client.get("/tasks/export", params={"format": "ndjson"}, headers=headers)
+    assert ndjson_resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in ndjson_resp.text.splitlines()]
+    assert [row["title"] for row in rows] == ["Second", "First"]
+    assert rows[0]["status"] == "backlog"
+
+    csv_resp = client.get("/tasks/export", params={"format": "csv"}, headers=headers)
+    records = list(csv.DictReader(io.StringIO(csv_resp.text)))
+    assert [record["title"] for record in records] == ["Second", "First"]
+    assert records[0]["priority"] == "high" and records[0]["description"] == ""
+
+
+def test_export_memory_is_bounded():
+    total_rows = 200_000
+    session = TestingSessionLocal()
+    try:
+        user = User(email="bulk@pontetech.com", full_name="Bulk", hashed_password="!")
+        session.add(user)
+        session.commit()
+        session.execute(
+            text(
+                "WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :total) "
+                "INSERT INTO tasks (title, description, status, priority, created_at, updated_at, owner_id) "
+                "SELECT 'Task ' || n, :description, 'backlog', 'medium', :now, :now, :owner_id FROM seq"
+            ),
+            {
+                "total": total_rows,
+                "description": "x" * 64,
+                "now": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f"),
+                "owner_id": user.id,
+            },
+        )
+        session.commit()
+        principal = Principal.model_validate(user)
+    finally:
+        session.close()
+
+    session = TestingSessionLocal()
+    try:
+        exported_lines = 0
+        exported_bytes = 0
+        tracemalloc.start()
+        for chunk in export_service.iter_export(session, principal, "ndjson"):
+            exported_lines += chunk.count(b"\n")
+            exported_bytes += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        session.close()
+
+    assert exported_lines == total_rows
+    assert peak < 8 * 1024 * 1024
+    assert peak < exported_bytes / 5
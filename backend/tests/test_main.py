@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.core.middleware import SECURITY_HEADERS
+from tests.test_tasks import authenticate
+
+
+def test_security_headers_and_trace_id(client: TestClient):
+    response = client.get("/health")
+    assert response.status_code == 200
+    for name, value in SECURITY_HEADERS.items():
+        assert response.headers[name] == value
+    assert len(response.headers["X-Trace-Id"]) == 36
+    assert client.get("/health").headers["X-Trace-Id"] != response.headers["X-Trace-Id"]
+
+
+def test_streaming_response_passes_through_middleware(client: TestClient):
+    headers = authenticate(client)
+    client.post("/tasks/", json={"title": "Streamed", "priority": "low"}, headers=headers)
+    with client.stream("GET", "/tasks/export", headers=headers) as response:
+        assert response.headers["X-Frame-Options"] == "DENY"
+        body = b"".join(response.iter_bytes())
+    assert b"Streamed" in body
+
+
+def test_metrics_expose_route_templates_and_hot_paths(client: TestClient):
+    headers = authenticate(client)
+    created = client.post("/tasks/", json={"title": "Measured", "priority": "low"}, headers=headers).json()
+    client.get(f"/tasks/{created['id']}", headers=headers)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/tasks/{task_id}",status="200"}' in body
+    assert f"/tasks/{created['id']}\"" not in body
+    assert 'http_request_db_queries_bucket{route="/tasks/{task_id}",le="+Inf"}' in body
+    assert 'password_hash_duration_seconds_count{operation="hash"}' in body
+    assert 'password_hash_duration_seconds_count{operation="verify"}' in body
+    assert 'response_serialization_duration_seconds_count{route="/tasks/"}' in body
+    assert "db_query_duration_seconds_sum" in body
+    assert 'db_pool_checkouts_total{pool="test"}' in body
+    assert 'db_pool_connect_seconds_count{pool="test"}' in body
+    assert 'db_pool_checkout_wait_seconds_count{pool="test"}' in body
+    assert 'db_pool_connections{pool="test",state="checkedout"}' in body
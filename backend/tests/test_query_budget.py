@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from structlog.testing import capture_logs
+
+from app import main
+from app.core.dependencies import get_db
+from app.models.task import Task
+from tests.conftest import override_get_db
+from tests.test_tasks import authenticate
+
+TASK = {"title": "Budget", "description": "", "priority": "low", "status": "backlog"}
+
+ENDPOINTS = [
+    ("GET", "/tasks/", None, 2),
+    ("GET", "/tasks/?status=backlog&priority=low", None, 2),
+    ("GET", "/tasks/page?limit=2", None, 2),
+    ("GET", "/tasks/{task_id}", None, 2),
+    ("POST", "/tasks/", TASK, 3),
+    ("PUT", "/tasks/{task_id}", {"status": "done"}, 4),
+    ("DELETE", "/tasks/{task_id}", None, 3),
+    ("POST", "/tasks/bulk", {"items": [TASK, TASK, TASK]}, 4),
+    ("PATCH", "/tasks/bulk", {"items": [{"id": "{task_id}", "status": "done"}]}, 4),
+    ("DELETE", "/tasks/bulk", {"ids": ["{task_id}"]}, 2),
+    ("GET", "/dashboard/summary", None, 1),
+]
+
+
+@pytest.mark.parametrize(("method", "path", "payload", "limit"), ENDPOINTS)
+def test_endpoint_query_budget(client: TestClient, assert_max_queries, method, path, payload, limit):
+    headers = authenticate(client)
+    task_id = client.post("/tasks/", json=TASK, headers=headers).json()["id"]
+    client.get("/tasks/", headers=headers)
+    if payload is not None:
+        payload = json.loads(json.dumps(payload).replace('"{task_id}"', str(task_id)))
+    with assert_max_queries(limit):
+        response = client.request(method, path.format(task_id=task_id), json=payload, headers=headers)
+    assert response.status_code < 400
+
+
+def test_auth_query_budget(client: TestClient, assert_max_queries):
+    payload = {"email": "budget@pontetech.com", "full_name": "Budget", "password": "Secure123"}
+    with assert_max_queries(3):
+        assert client.post("/auth/register", json=payload).status_code == 201
+    with assert_max_queries(3):
+        assert client.post("/auth/login", json=payload).status_code == 200
+
+
+def test_query_debug_reports_count_and_repeated_statements(monkeypatch):
+    monkeypatch.setattr(main.settings, "query_debug", True)
+    debug_app = main.create_app()
+    debug_app.dependency_overrides[get_db] = override_get_db
+
+    @debug_app.get("/debug/n-plus-one")
+    def n_plus_one(session: Session = Depends(get_db)):
+        return [session.scalar(select(Task.id).where(Task.id == index)) for index in range(4)]
+
+    with capture_logs() as logs:
+        response = TestClient(debug_app).get("/debug/n-plus-one")
+    assert response.headers["X-DB-Queries"] == "4"
+    warnings = [entry for entry in logs if entry["event"] == "possible_n_plus_one"]
+    assert len(warnings) == 1
+    assert warnings[0]["count"] == 4
+    assert warnings[0]["route"] == "/debug/n-plus-one"
+
+
+def test_query_capture_is_scoped_to_its_context(client: TestClient, assert_max_queries):
+    headers = authenticate(client)
+    with assert_max_queries(3) as captured:
+        client.get("/tasks/", headers=headers)
+    statements = list(captured)
+    client.get("/tasks/", headers=headers)
+    assert statements and captured == statements
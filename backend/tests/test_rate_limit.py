@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core import rate_limit
+from app.core.hashing import password_hasher
+from app.core.rate_limit import DatabaseRateLimitBackend, MemoryRateLimitBackend, RateLimit, RateLimiter
+from app.schemas.auth import AuthRequest
+from app.services import auth_service
+from tests.conftest import TestingSessionLocal
+
+CREDENTIALS = {"email": "crew@pontetech.com", "password": "Secure123"}
+
+
+def _count_verifies(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    verify = password_hasher.verify
+
+    def counting(password: str, hashed_password: str) -> bool:
+        calls.append(hashed_password)
+        return verify(password, hashed_password)
+
+    monkeypatch.setattr(password_hasher, "verify", counting)
+    return calls
+
+
+def test_failed_logins_lock_the_email_before_bcrypt(client: TestClient, monkeypatch):
+    client.post("/auth/register", json={**CREDENTIALS, "full_name": "Crew Mate"})
+    calls = _count_verifies(monkeypatch)
+    wrong = {**CREDENTIALS, "password": "Wrong1234"}
+
+    for _ in range(rate_limit.LOGIN_PER_EMAIL.limit):
+        assert client.post("/auth/login", json=wrong).status_code == 401
+    response = client.post("/auth/login", json=CREDENTIALS)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert len(calls) == rate_limit.LOGIN_PER_EMAIL.limit
+
+
+def test_concurrent_logins_cannot_overshoot_the_email_limit(client: TestClient, monkeypatch):
+    client.post("/auth/register", json={**CREDENTIALS, "full_name": "Crew Mate"})
+    calls = _count_verifies(monkeypatch)
+    verify = password_hasher.verify
+
+    def slow(password: str, hashed_password: str) -> bool:
+        time.sleep(0.05)
+        return verify(password, hashed_password)
+
+    monkeypatch.setattr(password_hasher, "verify", slow)
+    wrong = AuthRequest(**{**CREDENTIALS, "password": "Wrong1234"})
+
+    def attempt(_: int) -> int:
+        with TestingSessionLocal() as session:
+            try:
+                auth_service.login(session, wrong)
+            except HTTPException as exc:
+                return exc.status_code
+        return 200
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        codes = list(pool.map(attempt, range(rate_limit.LOGIN_PER_EMAIL.limit + 4)))
+
+    assert len(calls) == rate_limit.LOGIN_PER_EMAIL.limit
+    assert sorted(codes) == [401] * rate_limit.LOGIN_PER_EMAIL.limit + [429] * 4
+
+
+def test_successful_login_resets_the_email_counter(async_client: TestClient):
+    async_client.post("/auth/register", json={**CREDENTIALS, "full_name": "Crew Mate"})
+    wrong = {**CREDENTIALS, "password": "Wrong1234"}
+
+    for _ in range(rate_limit.LOGIN_PER_EMAIL.limit - 1):
+        async_client.post("/auth/login", json=wrong)
+    assert async_client.post("/auth/login", json=CREDENTIALS).status_code == 200
+    assert async_client.post("/auth/login", json=wrong).status_code == 401
+
+
+def test_unknown_email_spends_a_dummy_hash(client: TestClient, monkeypatch):
+    calls = _count_verifies(monkeypatch)
+
+    response = client.post("/auth/login", json={"email": "ghost@pontetech.com", "password": "Secure123"})
+
+    assert response.status_code == 401
+    assert calls == [password_hasher.dummy_hash()]
+
+
+def test_register_is_limited_per_client_address(client: TestClient):
+    for index in range(rate_limit.REGISTER_PER_IP.limit):
+        payload = {"email": f"crew{index}@pontetech.com", "full_name": "Crew Mate", "password": "Secure123"}
+        assert client.post("/auth/register", json=payload).status_code == 201
+
+    payload = {"email": "late@pontetech.com", "full_name": "Crew Mate", "password": "Secure123"}
+    assert client.post("/auth/register", json=payload).status_code == 429
+
+
+def test_client_header_keys_the_address_limit(client: TestClient, monkeypatch):
+    monkeypatch.setattr(rate_limit.settings, "rate_limit_client_header", "X-Forwarded-For")
+    for index in range(rate_limit.REGISTER_PER_IP.limit):
+        payload = {"email": f"crew{index}@pontetech.com", "full_name": "Crew Mate", "password": "Secure123"}
+        headers = {"X-Forwarded-For": f"198.51.100.{index}, 203.0.113.1"}
+        assert client.post("/auth/register", json=payload, headers=headers).status_code == 201
+
+    payload = {"email": "late@pontetech.com", "full_name": "Crew Mate", "password": "Secure123"}
+    for address, expected in (("203.0.113.1", 429), ("203.0.113.2", 201)):
+        response = client.post("/auth/register", json=payload, headers={"X-Forwarded-For": address})
+        assert response.status_code == expected
+
+
+@pytest.mark.parametrize(
+    "backend_factory",
+    [lambda: MemoryRateLimitBackend(100), lambda: DatabaseRateLimitBackend(TestingSessionLocal)],
+)
+def test_sliding_window_weights_the_previous_window(backend_factory, monkeypatch):
+    rule = RateLimit("probe", limit=4, window_seconds=60)
+    limiter = RateLimiter(backend_factory())
+    clock = [600.0]
+    monkeypatch.setattr(rate_limit.time, "time", lambda: clock[0])
+
+    for _ in range(4):
+        limiter.consume(rule, "10.0.0.1")
+    with pytest.raises(HTTPException) as excinfo:
+        limiter.consume(rule, "10.0.0.1")
+    assert excinfo.value.status_code == 429
+
+    clock[0] = 665.0
+    with pytest.raises(HTTPException) as excinfo:
+        limiter.consume(rule, "10.0.0.1")
+    assert excinfo.value.status_code == 429
+    clock[0] = 705.0
+    limiter.consume(rule, "10.0.0.1")
+    limiter.consume(rule, "10.0.0.2")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.dependencies import get_db
+from app.db.base import Base
+from app.db.routing import READ_YOUR_WRITES_HEADER, RoutingSession, recent_writes, replica_reads
+from app.main import create_app
+from app.models.task import Task
+from tests.conftest import engine as primary_engine
+from tests.test_tasks import authenticate
+
+
+@pytest.fixture
+def replica_client(tmp_path: Path):
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=replica)
+    factory = sessionmaker(class_=RoutingSession, bind=primary_engine, replicas=[replica], autoflush=False)
+
+    def routed_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    application = create_app()
+    application.dependency_overrides[get_db] = routed_db
+    yield TestClient(application), factory
+    replica.dispose()
+
+
+def test_reads_go_to_replica_outside_read_your_writes_window(replica_client):
+    client, _ = replica_client
+    headers = authenticate(client)
+    client.post("/tasks/", json={"title": "Primary only", "priority": "low"}, headers=headers)
+
+    assert [task["title"] for task in client.get("/tasks/", headers=headers).json()] == ["Primary only"]
+    assert client.get("/dashboard/summary", headers=headers).json()["total_tasks"] == 1
+
+    recent_writes.clear()
+    assert client.get("/tasks/", headers=headers).json() == []
+    assert client.get("/tasks/page", headers=headers).json()["items"] == []
+
+
+def test_writes_and_lookups_by_id_stay_on_primary(replica_client):
+    client, factory = replica_client
+    headers = authenticate(client)
+    task_id = client.post("/tasks/", json={"title": "Pinned", "priority": "low"}, headers=headers).json()["id"]
+    recent_writes.clear()
+
+    assert client.get(f"/tasks/{task_id}", headers=headers).status_code == 200
+    assert client.put(f"/tasks/{task_id}", json={"status": "done"}, headers=headers).status_code == 200
+    with factory() as session:
+        with replica_reads(session):
+            assert session.get(Task, task_id) is None
+        assert session.get(Task, task_id).status == "done"
+
+
+def test_login_reads_replica_once_registration_window_expires(replica_client):
+    client, _ = replica_client
+    assert "Authorization" in authenticate(client)
+    recent_writes.clear()
+    response = client.post("/auth/login", json={"email": "pilot@pontetech.com", "password": "Secure123"})
+    assert response.status_code == 401
+
+
+def test_read_your_writes_window_travels_with_the_client(replica_client, monkeypatch):
+    client, _ = replica_client
+    headers = authenticate(client)
+    created = client.post("/tasks/", json={"title": "Other worker", "priority": "low"}, headers=headers)
+    window = created.headers[READ_YOUR_WRITES_HEADER]
+    assert float(window) > time.time()
+    recent_writes.clear()
+
+    pinned = client.get("/tasks/", headers={**headers, READ_YOUR_WRITES_HEADER: window})
+    assert [task["title"] for task in pinned.json()] == ["Other worker"]
+    assert READ_YOUR_WRITES_HEADER not in pinned.headers
+    assert client.get("/tasks/", headers={**headers, READ_YOUR_WRITES_HEADER: "garbage"}).json() == []
+
+    far_future = str(time.time() + 3_600)
+    assert client.get("/tasks/", headers={**headers, READ_YOUR_WRITES_HEADER: far_future}).json() == []
+    expired = float(window) + 1
+    monkeypatch.setattr(time, "time", lambda: expired)
+    assert client.get("/tasks/", headers={**headers, READ_YOUR_WRITES_HEADER: window}).json() == []
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.core import principals
+from app.core.revocation import DatabaseRevocationBackend, RevocationStore
+from app.models.user import User
+from app.utils.timestamps import utcnow
+from tests.conftest import TestingSessionLocal
+
+
+def _login(client: TestClient, email: str = "crew@pontetech.com") -> dict[str, str]:
+    credentials = {"email": email, "password": "Secure123"}
+    client.post("/auth/register", json={**credentials, "full_name": "Crew Mate"})
+    token = client.post("/auth/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_logout_revokes_only_the_presented_token(client: TestClient):
+    first = _login(client)
+    second = _login(client)
+
+    assert client.post("/auth/logout", headers=first).status_code == 204
+
+    response = client.get("/tasks/", headers=first)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token revoked"
+    assert client.get("/tasks/", headers=second).status_code == 200
+
+
+def test_logout_all_rejects_older_tokens_even_with_trusted_claims(client: TestClient, monkeypatch):
+    monkeypatch.setattr(principals.settings, "auth_trust_token_claims", True)
+    first = _login(client)
+    second = _login(client)
+
+    assert client.post("/auth/logout/all", headers=first).status_code == 204
+
+    assert client.get("/tasks/", headers=first).status_code == 401
+    assert client.get("/tasks/", headers=second).status_code == 401
+    assert client.get("/tasks/", headers=_login(client)).status_code == 200
+
+
+def test_async_logout_revokes_token(async_client: TestClient):
+    headers = _login(async_client)
+
+    assert async_client.post("/auth/logout", headers=headers).status_code == 204
+    assert async_client.get("/tasks/", headers=headers).status_code == 401
+
+
+@pytest.mark.parametrize("client_fixture", ["client", "async_client"])
+def test_logout_all_locks_the_user_row(request: pytest.FixtureRequest, client_fixture: str):
+    client: TestClient = request.getfixturevalue(client_fixture)
+    headers = _login(client)
+    statements: list[str] = []
+
+    def capture(state) -> None:
+        statements.append(str(state.statement.compile(dialect=postgresql.dialect())))
+
+    event.listen(Session, "do_orm_execute", capture)
+    try:
+        assert client.post("/auth/logout/all", headers=headers).status_code == 204
+    finally:
+        event.remove(Session, "do_orm_execute", capture)
+    assert any("FROM users" in statement and statement.endswith("FOR UPDATE") for statement in statements)
+
+
+def test_database_backend_replicates_revocations_between_stores():
+    with TestingSessionLocal() as session:
+        user = User(email="crew@pontetech.com", full_name="Crew Mate", hashed_password="x")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+
+    backend = DatabaseRevocationBackend(TestingSessionLocal)
+    issuer = RevocationStore(backend, refresh_seconds=1)
+    replica = RevocationStore(backend, refresh_seconds=1)
+    issuer.revoke_token("live", user_id, utcnow() + timedelta(minutes=5))
+    issuer.revoke_token("stale", user_id, utcnow() - timedelta(minutes=5))
+    issuer.revoke_user(user_id, 3, utcnow() + timedelta(minutes=5))
+
+    assert replica.refresh() == 2
+    assert replica.refresh() == 2
+    assert replica.is_revoked({"sub": str(user_id), "jti": "live", "ver": 3})
+    assert not replica.is_revoked({"sub": str(user_id), "jti": "stale", "ver": 3})
+    assert replica.is_revoked({"sub": str(user_id), "jti": "other", "ver": 2})
+    assert backend.prune(utcnow()) == 1
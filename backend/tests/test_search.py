@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.services import task_search, task_service
+from tests.test_tasks import authenticate
+
+
+def test_search_ranks_highlights_and_pages(client: TestClient):
+    headers = authenticate(client)
+    tasks = [
+        {"title": "Deploy billing service", "description": "Roll out the new invoice flow"},
+        {"title": "Write runbook", "description": "Document how to deploy the billing stack"},
+        {"title": "Plan offsite", "description": "Book venue"},
+        {"title": "Revisão de segurança", "description": "Auditar permissões"},
+    ]
+    for task in tasks:
+        client.post("/tasks/", json={**task, "priority": "low"}, headers=headers)
+
+    response = client.get("/tasks/search", params={"q": "deploy billing"}, headers=headers)
+    assert response.status_code == 200
+    page = response.json()
+    assert [item["title"] for item in page["items"]] == ["Deploy billing service", "Write runbook"]
+    assert page["items"][0]["rank"] > page["items"][1]["rank"]
+    assert "<mark>" in page["items"][0]["snippet"]
+    assert "<mark>billing</mark>" in page["items"][1]["snippet"]
+    assert page["next_offset"] is None
+
+    first = client.get("/tasks/search", params={"q": "bill", "limit": 1}, headers=headers).json()
+    assert len(first["items"]) == 1 and first["next_offset"] == 1
+    second = client.get("/tasks/search", params={"q": "bill", "limit": 1, "offset": 1}, headers=headers).json()
+    assert second["items"][0]["id"] != first["items"][0]["id"]
+
+    accented = client.get("/tasks/search", params={"q": "revisao"}, headers=headers).json()
+    assert [item["title"] for item in accented["items"]] == ["Revisão de segurança"]
+
+
+def test_search_is_scoped_and_tracks_updates(client: TestClient):
+    headers = authenticate(client)
+    task_id = client.post("/tasks/", json={"title": "Quarterly report"}, headers=headers).json()["id"]
+    client.put(f"/tasks/{task_id}", json={"title": "Annual report"}, headers=headers)
+    assert client.get("/tasks/search", params={"q": "quarterly"}, headers=headers).json()["items"] == []
+    assert len(client.get("/tasks/search", params={"q": "annual"}, headers=headers).json()["items"]) == 1
+
+    client.post("/auth/register", json={"email": "other@pontetech.com", "full_name": "Other", "password": "Secure123"})
+    token = client.post("/auth/login", json={"email": "other@pontetech.com", "password": "Secure123"}).json()
+    other = {"Authorization": f"Bearer {token['access_token']}"}
+    assert client.get("/tasks/search", params={"q": "annual"}, headers=other).json()["items"] == []
+    assert client.get("/tasks/search", params={"q": "\"*:()"}, headers=headers).json()["items"] == []
+
+    client.delete(f"/tasks/{task_id}", headers=headers)
+    assert client.get("/tasks/search", params={"q": "annual"}, headers=headers).json()["items"] == []
+
+
+def test_search_pages_past_the_candidate_window(client: TestClient, monkeypatch):
+    monkeypatch.setattr(task_service.settings, "search_candidate_limit", 3)
+    headers = authenticate(client)
+    created = [
+        client.post("/tasks/", json={"title": f"Sprint item {index}"}, headers=headers).json()["id"]
+        for index in range(7)
+    ]
+    seen: list[int] = []
+    offset = 0
+    while offset is not None:
+        params = {"q": "sprint", "limit": 2, "offset": offset}
+        page = client.get("/tasks/search", params=params, headers=headers).json()
+        seen.extend(item["id"] for item in page["items"])
+        offset = page["next_offset"]
+    assert sorted(seen) == sorted(created) and len(seen) == len(set(seen))
+
+
+def test_postgres_search_uses_tsvector_index_and_headline():
+    statement = task_search.search_statement("postgresql", 1, ["deploy", "bill"], 20, 0, 1000)
+    compiled = statement.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "tasks.search_vector @@ to_tsquery" in sql
+    assert "deploy & bill:*" in compiled.params.values()
+    assert "ts_rank_cd" in sql and "ts_headline" in sql
+    assert "ponte_search" in compiled.params.values()
+    assert "count(*) OVER ()" in sql
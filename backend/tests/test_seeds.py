@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+
+from app.models.task import Task
+from app.models.task_stats import UserTaskStat
+from app.models.user import User
+from app.seeds import bulk
+from app.seeds.seed_data import seed_email, task_rows
+from app.services import task_stats
+from tests.conftest import TestingSessionLocal
+
+
+def test_bulk_seed_appends_users_and_keeps_stats_consistent(monkeypatch):
+    monkeypatch.setattr(bulk, "SessionLocal", TestingSessionLocal)
+
+    bulk.seed(users=3, tasks_per_user=7, workers=1, seed_value=7, batch_size=10, password_hash="!")
+    bulk.seed(users=2, tasks_per_user=7, workers=1, seed_value=7, batch_size=10, password_hash="!")
+
+    with TestingSessionLocal() as session:
+        emails = session.scalars(select(User.email).order_by(User.id)).all()
+        assert emails == [seed_email(index) for index in range(5)]
+        assert session.scalar(select(func.count(Task.id))) == 35
+        assert task_stats.reconcile(session, apply=False) == {}
+
+
+def test_bulk_seed_only_writes_stats_for_seeded_users(monkeypatch):
+    monkeypatch.setattr(bulk, "SessionLocal", TestingSessionLocal)
+    with TestingSessionLocal() as session:
+        other = User(email="other@pontetech.com", full_name="Other", hashed_password="!")
+        session.add(other)
+        session.flush()
+        session.add(UserTaskStat(user_id=other.id, kind=task_stats.TOTAL, key="", count=9))
+        session.commit()
+        other_id = other.id
+
+    bulk.seed(users=2, tasks_per_user=5, workers=1, seed_value=7, batch_size=10, password_hash="!")
+
+    with TestingSessionLocal() as session:
+        drift = task_stats.reconcile(session, apply=False)
+        assert drift == {(other_id, task_stats.TOTAL, ""): (9, 0)}
+
+
+def test_task_rows_are_deterministic_per_seed():
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert task_rows(1, 20, seed=3, now=now) == task_rows(1, 20, seed=3, now=now)
+    assert task_rows(1, 20, seed=3, now=now) != task_rows(1, 20, seed=4, now=now)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import random
+
+from app import server
+from app.core import warmup
+from app.core.config import Settings
+from app.core.hashing import PasswordHasher
+from app.main import app
+
+
+def test_worker_count_prefers_settings_then_cgroup_quota(tmp_path, monkeypatch):
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("150000 100000\n")
+    monkeypatch.setattr(server, "CGROUP_CPU_MAX", cpu_max)
+    monkeypatch.setattr(server.os, "sched_getaffinity", lambda _: set(range(8)))
+
+    assert server.worker_count(Settings(server_workers=3)) == 3
+    assert server.worker_count(Settings()) == 2
+    cpu_max.write_text("max 100000\n")
+    assert server.worker_count(Settings()) == 8
+
+
+def test_build_config_applies_server_settings():
+    settings = Settings(
+        server_port=9000,
+        server_loop="asyncio",
+        server_http="h11",
+        server_backlog=512,
+        server_keepalive_seconds=75,
+        server_limit_concurrency=200,
+        server_max_requests=1_000,
+        server_max_requests_jitter=50,
+    )
+
+    config = server.build_config(settings, limit_max_requests=server.max_requests_for_worker(settings))
+
+    assert (config.port, config.loop, config.http, config.backlog) == (9000, "asyncio", "h11", 512)
+    assert (config.timeout_keep_alive, config.limit_concurrency) == (75, 200)
+    assert 1_000 <= config.limit_max_requests <= 1_050
+    limits = {server.max_requests_for_worker(settings, random.Random(seed)) for seed in range(20)}
+    assert len(limits) > 1
+    assert server.max_requests_for_worker(Settings()) is None
+
+
+def test_supervisor_warns_when_workers_keep_memory_backends(monkeypatch):
+    warnings: list[dict] = []
+
+    def warning(event: str, **fields) -> None:
+        warnings.append({"event": event, **fields})
+
+    monkeypatch.setattr(server.logger, "warning", warning)
+    monkeypatch.setattr(server.Supervisor, "spawn", lambda self: None)
+    monkeypatch.setattr(server.uvicorn.Config, "bind_socket", lambda self: None)
+    monkeypatch.setattr(server.signal, "signal", lambda signum, handler: None)
+    environ: dict[str, str] = {}
+    monkeypatch.setattr(server.os, "environ", environ)
+
+    def run(settings: Settings, workers: int) -> None:
+        supervisor = server.Supervisor(settings, workers)
+        supervisor.should_exit = True
+        supervisor.shutdown = lambda: None
+        supervisor.run()
+
+    run(Settings(events_backend="postgres", rate_limit_backend="database"), 4)
+    run(Settings(events_backend="memory", rate_limit_backend="memory"), 1)
+    assert warnings == [] and environ == {}
+
+    run(Settings(events_backend="memory", rate_limit_backend="database"), 4)
+    assert [warning["event"] for warning in warnings] == ["per_worker_state", "summary_cache_disabled"]
+    assert warnings[0]["settings"] == ["EVENTS_BACKEND"]
+    assert environ == {"SUMMARY_CACHE_TTL_SECONDS": "0"}
+
+
+def test_warm_up_runs_every_step_before_traffic(monkeypatch):
+    hasher = PasswordHasher(4, workers=0, max_pending=4, retry_after_seconds=1)
+    monkeypatch.setattr(warmup, "password_hasher", hasher)
+
+    timings = asyncio.run(warmup.warm_up(app))
+
+    assert set(timings) == {"database", "tokens", "password_hasher", "routes"}
+    assert asyncio.run(warmup.request(app, "/health")) == 200
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.maintenance import reconcile_stats
+from app.models.task_stats import UserTaskStat
+from app.services import task_queries, task_stats
+from tests.conftest import TestingSessionLocal
+from tests.test_tasks import authenticate
+
+
+def _drift() -> dict:
+    with TestingSessionLocal() as session:
+        return task_stats.reconcile(session, apply=False)
+
+
+def test_mutations_keep_stats_in_sync(client: TestClient):
+    headers = authenticate(client)
+    soon = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    later = (datetime.now(timezone.utc) + timedelta(days=10)).isoformat()
+    first = client.post(
+        "/tasks/", json={"title": "First", "priority": "high", "due_date": soon}, headers=headers
+    )
+    second = client.post("/tasks/", json={"title": "Second", "priority": "low"}, headers=headers)
+    bulk = client.post(
+        "/tasks/bulk",
+        json={"items": [{"title": "Bulk one", "priority": "urgent", "due_date": later}, {"title": "Bulk 2"}]},
+        headers=headers,
+    ).json()["items"]
+    assert _drift() == {}
+
+    client.put(f"/tasks/{first.json()['id']}", json={"status": "done"}, headers=headers)
+    client.put(
+        f"/tasks/{second.json()['id']}",
+        json={"priority": "urgent", "due_date": soon},
+        headers={**headers, "If-Match": second.headers["etag"]},
+    )
+    client.patch("/tasks/bulk", json={"items": [{"id": bulk[0]["id"], "due_date": soon}]}, headers=headers)
+    client.request("DELETE", "/tasks/bulk", json={"ids": [bulk[1]["id"]]}, headers=headers)
+    imported = json.dumps({"title": "Imported", "status": "done"}).encode()
+    client.post("/tasks/import", files={"file": ("tasks.ndjson", imported, "text/plain")}, headers=headers)
+    assert _drift() == {}
+
+    summary = client.get("/dashboard/summary", headers=headers).json()
+    assert summary == {
+        "total_tasks": 4,
+        "completed_tasks": 2,
+        "completion_rate": 50.0,
+        "upcoming_tasks": 2,
+        "active_projects": 3,
+    }
+
+    client.delete(f"/tasks/{first.json()['id']}", headers=headers)
+    assert _drift() == {}
+
+
+def test_upcoming_uses_day_buckets_and_the_boundary_day(client: TestClient):
+    headers = authenticate(client)
+    now = datetime(2025, 11, 24, 12, 0, tzinfo=timezone.utc)
+    offsets = (timedelta(days=-5), timedelta(days=2), timedelta(days=3, hours=-1), timedelta(days=3, hours=1))
+    for offset in offsets:
+        client.post("/tasks/", json={"title": "Due", "due_date": (now + offset).isoformat()}, headers=headers)
+    login = client.post("/auth/login", json={"email": "pilot@pontetech.com", "password": "Secure123"})
+
+    with TestingSessionLocal() as session:
+        row = session.execute(task_stats.summary_statement(login.json()["user"]["id"], now)).one()
+    summary = task_queries.build_summary(row)
+    assert summary.total_tasks == 4
+    assert summary.upcoming_tasks == 3
+
+
+def test_reconcile_reports_and_repairs_drift(client: TestClient, capsys):
+    headers = authenticate(client)
+    client.post("/tasks/", json={"title": "Counted", "priority": "high"}, headers=headers)
+    with TestingSessionLocal() as session:
+        session.execute(update(UserTaskStat).where(UserTaskStat.kind == task_stats.TOTAL).values(count=7))
+        session.commit()
+
+    assert reconcile_stats.main(["--check"]) == 1
+    assert "found 1 drifted stat rows across 1 users" in capsys.readouterr().out
+    assert reconcile_stats.main([]) == 0
+    assert _drift() == {}
+    assert client.get("/dashboard/summary", headers=headers).json()["total_tasks"] == 1
+
+
+@pytest.mark.parametrize("client_fixture", ["client", "async_client"])
+def test_update_and_delete_lock_the_task_row(request: pytest.FixtureRequest, client_fixture: str):
+    client: TestClient = request.getfixturevalue(client_fixture)
+    headers = authenticate(client)
+    task_id = client.post("/tasks/", json={"title": "Locked"}, headers=headers).json()["id"]
+    statements: list[str] = []
+
+    def capture(state) -> None:
+        statements.append(str(state.statement.compile(dialect=postgresql.dialect())))
+
+    event.listen(Session, "do_orm_execute", capture)
+    try:
+        assert client.put(f"/tasks/{task_id}", json={"status": "done"}, headers=headers).status_code == 200
+        assert client.delete(f"/tasks/{task_id}", headers=headers).status_code == 204
+    finally:
+        event.remove(Session, "do_orm_execute", capture)
+    assert sum(statement.endswith("FOR UPDATE") for statement in statements) == 2
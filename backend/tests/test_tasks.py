@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta, timezone
 
 from fastapi.testclient import TestClient
 
+from app.schemas.task import TaskProjection, TaskRead
+
 
 def authenticate(client: TestClient) -> dict[str, str]:
     payload = {
@@ -58,3 +61,226 @@ def test_update_and_delete_task(client: TestClient):
     assert delete_resp.status_code == 204
     list_resp = client.get("/tasks/", headers=headers)
     assert list_resp.json() == []
+
+
+def test_paginate_tasks_with_cursor(client: TestClient):
+    headers = authenticate(client)
+    for index in range(5):
+        client.post(
+            "/tasks/",
+            json={"title": f"Task {index}", "priority": "high" if index % 2 else "low", "status": "backlog"},
+            headers=headers,
+        )
+    first_page = client.get("/tasks/page", params={"limit": 2}, headers=headers).json()
+    assert [task["title"] for task in first_page["items"]] == ["Task 4", "Task 3"]
+    second_page = client.get(
+        "/tasks/page", params={"limit": 2, "cursor": first_page["next_cursor"]}, headers=headers
+    ).json()
+    assert [task["title"] for task in second_page["items"]] == ["Task 2", "Task 1"]
+    last_page = client.get(
+        "/tasks/page", params={"limit": 2, "cursor": second_page["next_cursor"]}, headers=headers
+    ).json()
+    assert [task["title"] for task in last_page["items"]] == ["Task 0"]
+    assert last_page["next_cursor"] is None
+
+    filtered = client.get("/tasks/", params={"priority": "high"}, headers=headers).json()
+    assert [task["title"] for task in filtered] == ["Task 3", "Task 1"]
+    invalid = client.get("/tasks/page", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert invalid.status_code == 400
+
+
+def test_dashboard_summary_tracks_mutations(client: TestClient):
+    headers = authenticate(client)
+    due_date = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    first = client.post(
+        "/tasks/",
+        json={"title": "Plan", "priority": "high", "status": "backlog", "due_date": due_date},
+        headers=headers,
+    ).json()
+    client.post("/tasks/", json={"title": "Ship", "priority": "low", "status": "backlog"}, headers=headers)
+    summary = client.get("/dashboard/summary", headers=headers).json()
+    assert summary == {
+        "total_tasks": 2,
+        "completed_tasks": 0,
+        "completion_rate": 0.0,
+        "upcoming_tasks": 1,
+        "active_projects": 2,
+    }
+    client.put(f"/tasks/{first['id']}", json={"status": "done"}, headers=headers)
+    summary = client.get("/dashboard/summary", headers=headers).json()
+    assert summary["completed_tasks"] == 1 and summary["upcoming_tasks"] == 0
+    client.delete(f"/tasks/{first['id']}", headers=headers)
+    summary = client.get("/dashboard/summary", headers=headers).json()
+    assert summary["total_tasks"] == 1 and summary["active_projects"] == 1
+
+
+def test_bulk_create_update_and_delete(client: TestClient):
+    headers = authenticate(client)
+    create_resp = client.post(
+        "/tasks/bulk",
+        json={"items": [{"title": f"Bulk {index}", "priority": "low"} for index in range(3)]},
+        headers=headers,
+    )
+    assert create_resp.status_code == 201
+    created = create_resp.json()["items"]
+    assert [task["title"] for task in created] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    ids = [task["id"] for task in created]
+
+    update_resp = client.patch(
+        "/tasks/bulk",
+        json={
+            "items": [
+                {"id": ids[0], "status": "done"},
+                {"id": ids[1], "status": "done"},
+                {"id": ids[2], "priority": "high"},
+                {"id": ids[2], "priority": "low"},
+                {"id": 999_999, "status": "done"},
+            ]
+        },
+        headers=headers,
+    )
+    body = update_resp.json()
+    assert [(task["id"], task["status"], task["priority"]) for task in body["items"]] == [
+        (ids[0], "done", "low"),
+        (ids[1], "done", "low"),
+        (ids[2], "backlog", "high"),
+    ]
+    assert [(error["index"], error["detail"]) for error in body["errors"]] == [
+        (3, "Duplicate task id"),
+        (4, "Task not found"),
+    ]
+
+    delete_resp = client.request("DELETE", "/tasks/bulk", json={"ids": [ids[0], 999_999]}, headers=headers)
+    assert delete_resp.json()["deleted_ids"] == [ids[0]]
+    assert delete_resp.json()["errors"] == [{"index": 1, "id": 999_999, "detail": "Task not found"}]
+    assert len(client.get("/tasks/", headers=headers).json()) == 2
+
+
+def test_import_tasks_reports_rejected_rows(client: TestClient):
+    headers = authenticate(client)
+    ndjson = "\n".join(
+        [
+            json.dumps({"title": "Imported one", "priority": "high"}),
+            json.dumps({"title": "no"}),
+            "not json",
+            json.dumps({"title": "Imported two", "status": "done"}),
+        ]
+    )
+    response = client.post(
+        "/tasks/import",
+        params={"batch_size": 1},
+        files={"file": ("tasks.ndjson", ndjson.encode(), "application/x-ndjson")},
+        headers=headers,
+    )
+    body = response.json()
+    assert body["imported"] == 2 and body["rejected"] == 2
+    assert [error["line"] for error in body["errors"]] == [2, 3]
+
+    csv_body = "title,description,status,priority,due_date\nFrom CSV,,in_progress,low,\nx,,,,\nShort row\n"
+    response = client.post(
+        "/tasks/import",
+        files={"file": ("tasks.csv", csv_body.encode(), "text/csv")},
+        headers=headers,
+    )
+    assert response.json()["imported"] == 2 and response.json()["errors"][0]["line"] == 3
+    titles = {task["title"]: task["status"] for task in client.get("/tasks/", headers=headers).json()}
+    assert titles == {
+        "Imported one": "backlog",
+        "Imported two": "done",
+        "From CSV": "in_progress",
+        "Short row": "backlog",
+    }
+
+
+def test_import_keeps_committed_batches_on_unreadable_upload(client: TestClient):
+    headers = authenticate(client)
+    ndjson = (json.dumps({"title": "Committed first"}) + "\n").encode() * 1_000 + b"\xff\xfe broken\n"
+    response = client.post(
+        "/tasks/import",
+        params={"batch_size": 100},
+        files={"file": ("tasks.ndjson", ndjson, "application/x-ndjson")},
+        headers=headers,
+    )
+    assert response.status_code == 400
+    imported = int(response.json()["detail"].split()[3])
+    assert imported > 0 and imported % 100 == 0
+    assert client.get("/dashboard/summary", headers=headers).json()["total_tasks"] == imported
+
+
+def test_conditional_requests_with_etags(client: TestClient):
+    headers = authenticate(client)
+    task = client.post("/tasks/", json={"title": "Cache me", "priority": "high"}, headers=headers)
+    task_etag = task.headers["etag"]
+
+    listing = client.get("/tasks/", headers=headers)
+    not_modified = client.get("/tasks/", headers={**headers, "If-None-Match": listing.headers["etag"]})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+
+    single = client.get(f"/tasks/{task.json()['id']}", headers={**headers, "If-None-Match": task_etag})
+    assert single.status_code == 304
+
+    summary = client.get("/dashboard/summary", headers=headers)
+    cached_summary = client.get("/dashboard/summary", headers={**headers, "If-None-Match": summary.headers["etag"]})
+    assert cached_summary.status_code == 304
+
+    task_url = f"/tasks/{task.json()['id']}"
+    updated = client.put(task_url, json={"status": "done"}, headers={**headers, "If-Match": task_etag})
+    assert updated.status_code == 200 and updated.headers["etag"] != task_etag
+    stale = client.put(task_url, json={"status": "backlog"}, headers={**headers, "If-Match": task_etag})
+    assert stale.status_code == 412
+    missing = client.put("/tasks/999999", json={"status": "done"}, headers={**headers, "If-Match": task_etag})
+    assert missing.status_code == 404
+    mismatched = client.put(task_url, json={"status": "done"}, headers={**headers, "If-Match": '"other"'})
+    assert mismatched.status_code == 412
+
+    refreshed = client.get("/tasks/", headers={**headers, "If-None-Match": listing.headers["etag"]})
+    assert refreshed.status_code == 200 and refreshed.json()[0]["status"] == "done"
+    fresh_summary = client.get("/dashboard/summary", headers={**headers, "If-None-Match": summary.headers["etag"]})
+    assert fresh_summary.status_code == 200
+
+
+def test_list_serializes_rows_like_task_read(client: TestClient):
+    headers = authenticate(client)
+    due_date = datetime(2030, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc).isoformat()
+    client.post("/tasks/", json={"title": "Raw rows", "priority": "high", "due_date": due_date}, headers=headers)
+    client.post("/tasks/", json={"title": "No due date", "description": "ção"}, headers=headers)
+
+    response = client.get("/tasks/", headers=headers)
+    assert response.headers["content-type"] == "application/json"
+    assert "etag" in response.headers and response.headers["cache-control"] == "private, no-cache"
+    listed = response.json()
+    expected = [TaskRead.model_validate(item).model_dump(mode="json") for item in listed]
+    assert listed == expected
+    assert [client.get(f"/tasks/{item['id']}", headers=headers).json() for item in listed] == listed
+
+    openapi = client.get("/openapi.json").json()
+    schema = openapi["paths"]["/tasks/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert [variant["items"] for variant in schema["anyOf"]] == [
+        {"$ref": "#/components/schemas/TaskRead"},
+        {"$ref": "#/components/schemas/TaskProjection"},
+    ]
+    assert openapi["components"]["schemas"]["TaskProjection"]["required"] == ["id"]
+
+
+def test_list_projects_requested_fields_and_board(client: TestClient):
+    headers = authenticate(client)
+    task = {"title": "Projected", "description": "x" * 2000, "priority": "high"}
+    client.post("/tasks/", json=task, headers=headers)
+
+    projected = client.get("/tasks/", params={"fields": "title, status,due_date"}, headers=headers)
+    assert projected.status_code == 200
+    assert list(projected.json()[0]) == ["id", "title", "status", "due_date"]
+    TaskProjection.model_validate(projected.json()[0])
+    full = client.get("/tasks/", headers=headers)
+    assert projected.headers["etag"] != full.headers["etag"]
+
+    unknown = client.get("/tasks/", params={"fields": "title,hashed_password"}, headers=headers)
+    assert unknown.status_code == 422 and unknown.json()["detail"] == "Unknown fields: hashed_password"
+
+    board = client.get("/tasks/board", params={"priority": "high"}, headers=headers)
+    assert board.json() == [
+        {key: full.json()[0][key] for key in ("id", "title", "status", "priority", "due_date", "updated_at")}
+    ]
+    conditional = {**headers, "If-None-Match": board.headers["etag"]}
+    cached = client.get("/tasks/board", params={"priority": "high"}, headers=conditional)
+    assert cached.status_code == 304
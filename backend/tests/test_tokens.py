@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from app.core.config import Settings
+from app.core.tokens import KeyRing, TokenVerifier
+
+
+def _pem_pair(algorithm: str) -> tuple[str, str]:
+    key = ec.generate_private_key(ec.SECP256R1()) if algorithm == "ES256" else ed25519.Ed25519PrivateKey.generate()
+    private = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private.decode("utf-8"), public.decode("utf-8")
+
+
+def _claims(**extra) -> dict:
+    return {"sub": "1", "exp": int(time.time()) + 60, **extra}
+
+
+@pytest.mark.parametrize("algorithm", ["ES256", "EdDSA"])
+def test_asymmetric_keys_rotate_by_kid(algorithm: str):
+    old_private, old_public = _pem_pair(algorithm)
+    new_private, _ = _pem_pair(algorithm)
+    old = KeyRing.from_settings(Settings(jwt_algorithm=algorithm, jwt_key_id="2024", jwt_private_key=old_private))
+    current = KeyRing.from_settings(
+        Settings(
+            jwt_algorithm=algorithm,
+            jwt_key_id="2025",
+            jwt_private_key=new_private,
+            jwt_verification_keys={"2024": old_public},
+        )
+    )
+
+    token = current.sign(_claims())
+    assert jwt.get_unverified_header(token)["kid"] == "2025"
+    assert current.verify(token)["sub"] == "1"
+    assert current.verify(old.sign(_claims()))["sub"] == "1"
+    with pytest.raises(jwt.InvalidTokenError):
+        old.verify(token)
+
+
+def test_hs256_accepts_tokens_issued_without_kid():
+    keyring = KeyRing.from_settings(Settings(secret_key="rotating-secret"))
+    legacy = jwt.encode(_claims(), "rotating-secret", algorithm="HS256")
+
+    assert keyring.verify(legacy)["sub"] == "1"
+    with pytest.raises(jwt.InvalidTokenError):
+        keyring.verify(jwt.encode({"sub": "1"}, "rotating-secret", algorithm="HS256"))
+
+
+def test_verifier_caches_verified_tokens_until_exp(monkeypatch):
+    keyring = KeyRing.from_settings(Settings(secret_key="cache-secret"))
+    verifier = TokenVerifier(keyring, max_entries=10)
+    calls: list[str] = []
+    verify = keyring.verify
+    monkeypatch.setattr(keyring, "verify", lambda token: calls.append(token) or verify(token))
+    token = verifier.sign(_claims())
+
+    first = verifier.verify(token)
+    first["sub"] = "tampered"
+    assert verifier.verify(token)["sub"] == "1"
+    assert len(calls) == 1
+
+    forged = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+    for _ in range(2):
+        with pytest.raises(jwt.InvalidTokenError):
+            verifier.verify(forged)
+    assert len(calls) == 3
@@ -39,6 +39,29 @@ const App = () => {
       .finally(() => setLoading(false));
   }, [token]);
 
+  useEffect(() => {
+    if (!token) return;
+    const upsert = (incoming: Task[]) =>
+      setTasks((prev) => {
+        const byId = new Map(incoming.map((task) => [task.id, task]));
+        const kept = prev.map((task) => byId.get(task.id) ?? task);
+        const known = new Set(prev.map((task) => task.id));
+        return [...incoming.filter((task) => !known.has(task.id)), ...kept];
+      });
+    const reload = () => api.fetchTasks().then(setTasks);
+    return api.subscribeEvents((source) => {
+      source.addEventListener("summary", (event) => setSummary(JSON.parse((event as MessageEvent).data)));
+      source.addEventListener("task.created", (event) => upsert(JSON.parse((event as MessageEvent).data).tasks));
+      source.addEventListener("task.updated", (event) => upsert(JSON.parse((event as MessageEvent).data).tasks));
+      source.addEventListener("task.deleted", (event) => {
+        const deleted = new Set<number>(JSON.parse((event as MessageEvent).data).deleted_ids);
+        setTasks((prev) => prev.filter((task) => !deleted.has(task.id)));
+      });
+      source.addEventListener("task.imported", reload);
+      source.addEventListener("resync", reload);
+    });
+  }, [token]);
+
   const handleLogin = async (payload: AuthPayload) => {
     const session = await api.login(payload);
     setToken(session.access_token);
@@ -86,24 +109,18 @@ const App = () => {
       due_date: payload.due_date ? new Date(payload.due_date).toISOString() : undefined
     };
     const task = await api.createTask(formatted);
-    setTasks((prev) => [task, ...prev]);
-    const refreshed = await api.fetchSummary();
-    setSummary(refreshed);
+    setTasks((prev) => (prev.some((item) => item.id === task.id) ? prev : [task, ...prev]));
   };
 
   const handleToggleTask = async (task: Task) => {
     const nextStatus = task.status === "done" ? "in_progress" : "done";
     const updated = await api.updateTask(task.id, { status: nextStatus });
     setTasks((prev) => prev.map((item) => (item.id === task.id ? updated : item)));
-    const refreshed = await api.fetchSummary();
-    setSummary(refreshed);
   };
 
   const handleDeleteTask = async (task: Task) => {
     await api.deleteTask(task.id);
     setTasks((prev) => prev.filter((item) => item.id !== task.id));
-    const refreshed = await api.fetchSummary();
-    setSummary(refreshed);
   };
 
   const toggleFavorite = (taskId: number) => {
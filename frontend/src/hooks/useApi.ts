@@ -1,6 +1,6 @@
 import axios, { AxiosInstance } from "axios";
 import { useMemo } from "react";
-import type { AuthPayload, AuthResponse, Task, TaskForm, DashboardSummary } from "../types";
+import type { AuthPayload, AuthResponse, Task, TaskForm, DashboardSummary, StreamToken } from "../types";
 
 const resolveBaseURL = (): string => {
   const fallbackProtocol = typeof window !== "undefined" && window.location.protocol.includes("https") ? "https" : "http";
@@ -25,25 +25,50 @@ const resolveBaseURL = (): string => {
 };
 
 const baseURL = resolveBaseURL();
+const EVENTS_RETRY_MS = 3000;
+
+const READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes";
+let readYourWritesUntil: string | null = null;
+
+const trackWrites = (client: AxiosInstance): AxiosInstance => {
+  client.interceptors.request.use((config) => {
+    if (readYourWritesUntil && Number(readYourWritesUntil) * 1000 > Date.now()) {
+      config.headers.set(READ_YOUR_WRITES_HEADER, readYourWritesUntil);
+    }
+    return config;
+  });
+  client.interceptors.response.use((response) => {
+    const until = response.headers[READ_YOUR_WRITES_HEADER.toLowerCase()];
+    if (typeof until === "string") {
+      readYourWritesUntil = until;
+    }
+    return response;
+  });
+  return client;
+};
 
 export const useApi = (token: string | null) => {
   const authenticatedClient = useMemo<AxiosInstance>(() => {
-    return axios.create({
-      baseURL,
-      timeout: 8000,
-      headers: token
-        ? {
-            Authorization: `Bearer ${token}`
-          }
-        : undefined
-    });
+    return trackWrites(
+      axios.create({
+        baseURL,
+        timeout: 8000,
+        headers: token
+          ? {
+              Authorization: `Bearer ${token}`
+            }
+          : undefined
+      })
+    );
   }, [token]);
 
   const publicClient = useMemo<AxiosInstance>(() => {
-    return axios.create({
-      baseURL,
-      timeout: 8000
-    });
+    return trackWrites(
+      axios.create({
+        baseURL,
+        timeout: 8000
+      })
+    );
   }, []);
 
   const login = async (payload: AuthPayload): Promise<AuthResponse> => {
@@ -80,6 +105,38 @@ export const useApi = (token: string | null) => {
     return data;
   };
 
+  const subscribeEvents = (listen: (source: EventSource) => void): (() => void) => {
+    let source: EventSource | null = null;
+    let retry: number | undefined;
+    let closed = false;
+
+    const reconnect = () => {
+      if (!closed) retry = window.setTimeout(connect, EVENTS_RETRY_MS);
+    };
+
+    const connect = async () => {
+      try {
+        const { data } = await authenticatedClient.post<StreamToken>("/events/token");
+        if (closed) return;
+        const url = `${baseURL.replace(/\/$/, "")}/events?access_token=${encodeURIComponent(data.stream_token)}`;
+        source = new EventSource(url);
+        source.onerror = () => {
+          if (source?.readyState === EventSource.CLOSED) reconnect();
+        };
+        listen(source);
+      } catch {
+        reconnect();
+      }
+    };
+
+    if (token) void connect();
+    return () => {
+      closed = true;
+      window.clearTimeout(retry);
+      source?.close();
+    };
+  };
+
   return {
     login,
     register,
@@ -87,6 +144,7 @@ export const useApi = (token: string | null) => {
     createTask,
     updateTask,
     deleteTask,
-    fetchSummary
+    fetchSummary,
+    subscribeEvents
   };
 };
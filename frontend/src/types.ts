@@ -17,6 +17,11 @@ export type AuthResponse = {
   user: UserProfile;
 };
 
+export type StreamToken = {
+  stream_token: string;
+  expires_in: number;
+};
+
 export type StatusValue = "backlog" | "in_progress" | "done";
 
 export type Task = {